@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import timeit
+import typing
+
+
+def measure(
+    fn: typing.Callable[[], object],
+    *,
+    number: int,
+    repeat: int = 5,
+) -> float:
+    """
+    Return the best per-call duration in microseconds.
+    """
+
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return best / number * 1_000_000
+
+
+def print_table(
+    title: str,
+    header: list[str],
+    rows: list[list[object]],
+) -> None:
+    all_rows: list[list[object]] = [list(header), *rows]
+    widths = [
+        max(len(_fmt(row[i])) for row in all_rows) for i in range(len(header))
+    ]
+
+    print(title)
+    print("  ".join(h.rjust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print("  ".join(_fmt(v).rjust(w) for v, w in zip(row, widths)))
+    print()
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
@@ -0,0 +1,98 @@
+"""
+Decoding executor requests for batch functions with increasingly large event
+payloads. "before" is the previous ServerRequest model, which validated every
+event's data against the recursive JSON type. "after" validates only the
+routing fields and each event's envelope.
+
+Usage: python benchmarks/event_decoding.py
+"""
+
+from __future__ import annotations
+
+import json
+
+from _utils import measure, print_table
+from inngest._internal import server_lib, types
+
+_BATCH_SIZES = [1, 10, 100]
+_DATA_KEYS = [10, 200]
+
+
+class _OldServerRequest(types.BaseModel):
+    ctx: server_lib.ServerRequestCtx
+    event: server_lib.Event
+    events: list[server_lib.Event] | None = None
+    steps: dict[str, object]
+    use_api: bool
+
+
+def _create_body(batch_size: int, data_keys: int) -> bytes:
+    events = [
+        {
+            "data": {
+                f"key_{i}": {"id": i, "tags": ["a", "b", "c"], "value": 1.5}
+                for i in range(data_keys)
+            },
+            "id": f"event-{n}",
+            "name": "app/event",
+            "ts": 1_700_000_000_000,
+        }
+        for n in range(batch_size)
+    ]
+    body = {
+        "ctx": {
+            "attempt": 0,
+            "disable_immediate_execution": False,
+            "run_id": "run",
+            "stack": {"stack": []},
+        },
+        "event": events[0],
+        "events": events,
+        "steps": {},
+        "use_api": False,
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def _before(body: bytes) -> None:
+    request = _OldServerRequest.from_raw(body)
+    assert not isinstance(request, Exception)
+
+
+def _after(body: bytes) -> None:
+    request = server_lib.ServerRequest.from_raw(body)
+    assert not isinstance(request, Exception)
+    event = request.get_event()
+    assert not isinstance(event, Exception)
+    events = request.get_events()
+    assert not isinstance(events, Exception)
+
+
+def main() -> None:
+    rows: list[list[object]] = []
+    for data_keys in _DATA_KEYS:
+        for batch_size in _BATCH_SIZES:
+            body = _create_body(batch_size, data_keys)
+            number = max(1, 200 // (batch_size * data_keys // 10 or 1))
+            before = measure(lambda: _before(body), number=number)
+            after = measure(lambda: _after(body), number=number)
+            rows.append(
+                [
+                    batch_size,
+                    data_keys,
+                    f"{len(body) / 1024:.0f} KiB",
+                    before / 1000,
+                    after / 1000,
+                    f"{before / after:.1f}x",
+                ]
+            )
+
+    print_table(
+        "ServerRequest decoding (ms per request)",
+        ["events", "data keys", "body", "before", "after", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
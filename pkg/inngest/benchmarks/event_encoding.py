@@ -0,0 +1,117 @@
+"""
+Encoding events for Inngest.send with increasingly large batches. "before" is
+the previous path, which dumped every event with Pydantic before encoding it.
+"after" encodes each event's fields directly. The dicts rows send plain dicts:
+"before" had to create a fully validated Event from each dict, while "after"
+only validates each dict's envelope.
+
+Usage: python benchmarks/event_encoding.py
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+
+from _utils import measure, print_table
+from inngest._internal import client_lib, json_lib, server_lib, transforms
+
+_BATCH_SIZES = [100, 1_000, 10_000]
+
+
+def _create_dicts(batch_size: int) -> list[dict[str, object]]:
+    return [
+        {
+            "data": {
+                "order": {"id": n, "items": [{"sku": "abc", "qty": 2}]},
+                "tags": ["a", "b", "c"],
+                "total": 1.5,
+            },
+            "name": "app/order.created",
+        }
+        for n in range(batch_size)
+    ]
+
+
+def _before(
+    events: list[server_lib.Event],
+    codec: json_lib.JSONCodec,
+) -> None:
+    for event in events:
+        d = event.to_dict()
+        assert not isinstance(d, Exception)
+        if d.get("id") == "":
+            del d["id"]
+        if d.get("ts") == 0:
+            d["ts"] = int(time.time() * 1000)
+        content = transforms.dump_json(d, codec)
+        assert not isinstance(content, Exception)
+
+
+def _before_dicts(
+    dicts: list[dict[str, object]],
+    codec: json_lib.JSONCodec,
+) -> None:
+    _before([server_lib.Event(**d) for d in dicts], codec)  # type: ignore[arg-type]
+
+
+def _after(
+    events: list[server_lib.Event],
+    codec: json_lib.JSONCodec,
+) -> None:
+    encoded = client_lib.client._encode_events(events, codec)
+    assert not isinstance(encoded, Exception)
+
+
+def _after_dicts(
+    dicts: list[dict[str, object]],
+    codec: json_lib.JSONCodec,
+) -> None:
+    events = server_lib.to_events(dicts)
+    assert not isinstance(events, Exception)
+    _after(events, codec)
+
+
+def main() -> None:
+    codec = json_lib.default_codec()
+    rows: list[list[object]] = []
+    for batch_size in _BATCH_SIZES:
+        dicts = _create_dicts(batch_size)
+        events = [server_lib.Event(**d) for d in dicts]  # type: ignore[arg-type]
+        number = max(1, 10_000 // batch_size)
+        cases: list[
+            tuple[str, typing.Callable[[], None], typing.Callable[[], None]]
+        ] = [
+            (
+                "Event",
+                lambda: _before(events, codec),
+                lambda: _after(events, codec),
+            ),
+            (
+                "dict",
+                lambda: _before_dicts(dicts, codec),
+                lambda: _after_dicts(dicts, codec),
+            ),
+        ]
+        for kind, before_fn, after_fn in cases:
+            before = measure(before_fn, number=number)
+            after = measure(after_fn, number=number)
+            rows.append(
+                [
+                    batch_size,
+                    kind,
+                    before / 1000,
+                    after / 1000,
+                    f"{before / after:.1f}x",
+                ]
+            )
+
+    print_table(
+        "Event encoding (ms per send)",
+        ["events", "input", "before", "after", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
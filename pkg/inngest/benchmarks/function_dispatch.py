@@ -0,0 +1,95 @@
+"""
+Function lookup cost as the number of served functions grows. The registry
+lookup should stay flat while the linear scan grows with the function count.
+
+Usage: python benchmarks/function_dispatch.py
+"""
+
+from __future__ import annotations
+
+import typing
+
+import inngest
+from _utils import measure, print_table
+from inngest._internal import comm_lib, function, server_lib
+
+_COUNTS = [10, 100, 1_000, 10_000]
+
+
+def _create_functions(
+    client: inngest.Inngest,
+    count: int,
+) -> list[function.Function[typing.Any]]:
+    fns = []
+    for i in range(count):
+
+        @client.create_function(
+            fn_id=f"fn-{i}",
+            on_failure=lambda ctx: None,
+            trigger=inngest.TriggerEvent(event=f"app/fn-{i}"),
+        )
+        def fn(ctx: inngest.ContextSync) -> None:
+            pass
+
+        fns.append(fn)
+    return fns
+
+
+def _linear_scan(
+    app_id: str,
+    fns: dict[str, function.Function[typing.Any]],
+    fn_id: str,
+) -> function.Function[typing.Any] | None:
+    """
+    The lookup that CommHandler used before the registry.
+    """
+
+    for fn in fns.values():
+        if fn.get_id() == fn_id or fn.on_failure_fn_id == fn_id:
+            return fn
+
+    app_and_fn_id = f"{app_id}-{fn_id}"
+    for fn in fns.values():
+        if fn.get_id() == app_and_fn_id or fn.on_failure_fn_id == app_and_fn_id:
+            return fn
+    return None
+
+
+def main() -> None:
+    client = inngest.Inngest(app_id="bench", is_production=False)
+
+    rows: list[list[object]] = []
+    for count in _COUNTS:
+        fns = _create_functions(client, count)
+        handler = comm_lib.CommHandler(
+            client=client,
+            framework=server_lib.Framework.FLASK,
+            functions=fns,
+            streaming=None,
+        )
+
+        # Worst case for the linear scan: the last function's on_failure
+        # handler, requested with a legacy ID.
+        fn_id = f"fn-{count - 1}-failure"
+        number = max(1, 100_000 // count)
+
+        rows.append(
+            [
+                count,
+                measure(
+                    lambda: _linear_scan(client.app_id, handler._fns, fn_id),
+                    number=number,
+                ),
+                measure(lambda: handler._get_function(fn_id), number=100_000),
+            ]
+        )
+
+    print_table(
+        "Function lookup (us per request)",
+        ["functions", "linear scan", "registry"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Encoding and decoding with each JSON backend: large step outputs (what the SDK
+sends back to Inngest) and event batches (what it sends to the Event API and
+fetches for batch functions). Install orjson to include it
+(`pip install inngest[orjson]`).
+
+Usage: python benchmarks/json_codecs.py
+"""
+
+from __future__ import annotations
+
+from _utils import measure, print_table
+from inngest._internal import json_lib
+
+
+def _create_step_output(item_count: int) -> object:
+    return {
+        "items": [
+            {
+                "id": i,
+                "name": f"item {i}",
+                "price": i * 1.25,
+                "tags": ["a", "b", "c"],
+                "active": i % 2 == 0,
+            }
+            for i in range(item_count)
+        ],
+    }
+
+
+def _create_event_batch(event_count: int) -> object:
+    return [
+        {
+            "data": {
+                f"key_{k}": {"id": k, "value": "x" * 20} for k in range(20)
+            },
+            "id": f"event-{i}",
+            "name": "app/event",
+            "ts": 1_700_000_000_000,
+        }
+        for i in range(event_count)
+    ]
+
+
+def main() -> None:
+    codecs: list[tuple[str, json_lib.JSONCodec]] = [
+        ("stdlib", json_lib.StdlibJSONCodec()),
+    ]
+    if json_lib._has_orjson:
+        codecs.append(("orjson", json_lib.OrjsonJSONCodec()))
+    else:
+        print("orjson is not installed; only benchmarking stdlib\n")
+
+    payloads = [
+        ("step output, 100 items", _create_step_output(100)),
+        ("step output, 10k items", _create_step_output(10_000)),
+        ("event batch, 10 events", _create_event_batch(10)),
+        ("event batch, 100 events", _create_event_batch(100)),
+    ]
+
+    rows: list[list[object]] = []
+    for label, payload in payloads:
+        size = len(json_lib.StdlibJSONCodec().dumps(payload))
+        number = max(1, 2_000_000 // size)
+        for name, codec in codecs:
+            encoded = codec.dumps(payload)
+            dumps = measure(lambda: codec.dumps(payload), number=number)
+            loads = measure(lambda: codec.loads(encoded), number=number)
+            rows.append(
+                [
+                    label,
+                    f"{size / 1024:.0f} KiB",
+                    name,
+                    dumps / 1000,
+                    loads / 1000,
+                    f"{size / dumps:.0f}",
+                ]
+            )
+
+    print_table(
+        "JSON backends (ms per call)",
+        ["payload", "size", "backend", "dumps", "loads", "dumps MB/s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Signature validation plus request decoding for signed executor requests of
+increasing size. "before" is the previous pipeline: canonicalize (which parses
+the body) and then validate the raw bytes into a ServerRequest (which parses
+them again).
+
+Usage: python benchmarks/request_pipeline.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import jcs
+from _utils import measure, print_table
+from inngest._internal import comm_lib, net, server_lib, transforms
+
+_SIGNING_KEY = "signkey-prod-" + "ab" * 32
+_SIGNING_KEY_FALLBACK = "signkey-prod-" + "cd" * 32
+_STEP_COUNTS = [10, 100, 1_000, 5_000]
+
+
+def _create_body(step_count: int, *, canonical: bool) -> bytes:
+    event = {
+        "data": {"user": {"id": 1, "name": "Alice"}},
+        "id": "",
+        "name": "app/event",
+        "ts": 0,
+    }
+    body = {
+        "ctx": {
+            "attempt": 0,
+            "disable_immediate_execution": False,
+            "run_id": "run",
+            "stack": {"stack": []},
+        },
+        "event": event,
+        "events": [event],
+        "steps": {
+            hashlib.sha1(str(i).encode()).hexdigest(): {
+                "data": {"index": i, "items": list(range(20)), "msg": "hi"}
+            }
+            for i in range(step_count)
+        },
+        "use_api": False,
+    }
+
+    if canonical:
+        canonicalized = jcs.canonicalize(body)
+        assert isinstance(canonicalized, bytes)
+        return canonicalized
+    return json.dumps(body, indent=1).encode("utf-8")
+
+
+def _before(body: bytes, headers: dict[str, str]) -> None:
+    canonicalized = transforms.canonicalize(body)
+    assert not isinstance(canonicalized, Exception)
+    err = net._validate_sig(
+        body=canonicalized,
+        headers=headers,
+        mode=server_lib.ServerKind.CLOUD,
+        signing_key=_SIGNING_KEY,
+    )
+    if isinstance(err, Exception):
+        err = net._validate_sig(
+            body=canonicalized,
+            headers=headers,
+            mode=server_lib.ServerKind.CLOUD,
+            signing_key=_SIGNING_KEY_FALLBACK,
+        )
+    assert not isinstance(err, Exception)
+    request = server_lib.ServerRequest.from_raw(body)
+    assert not isinstance(request, Exception)
+
+
+def _after(body: bytes, headers: dict[str, str]) -> None:
+    req = comm_lib.CommRequest(
+        body=body,
+        headers=headers,
+        public_path=None,
+        query_params={},
+        raw_request=None,
+        request_url="",
+        serve_origin=None,
+        serve_path=None,
+    )
+    err = net.validate_request_sig(
+        body=req.body,
+        headers=req.headers,
+        load_body=req.load_body,
+        mode=server_lib.ServerKind.CLOUD,
+        signing_key=_SIGNING_KEY,
+        signing_key_fallback=_SIGNING_KEY_FALLBACK,
+    )
+    assert not isinstance(err, Exception)
+    request = req.parse_body(server_lib.ServerRequest)
+    assert not isinstance(request, Exception)
+
+
+def main() -> None:
+    for canonical in [True, False]:
+        rows: list[list[object]] = []
+        for step_count in _STEP_COUNTS:
+            body = _create_body(step_count, canonical=canonical)
+
+            # Sign with the fallback key to include the fallback cost.
+            sig = net.sign_request(body, _SIGNING_KEY_FALLBACK)
+            assert not isinstance(sig, Exception)
+            headers = {server_lib.HeaderKey.SIGNATURE.value: sig}
+
+            number = max(1, 2_000 // step_count)
+            before = measure(lambda: _before(body, headers), number=number)
+            after = measure(lambda: _after(body, headers), number=number)
+            rows.append(
+                [
+                    step_count,
+                    f"{len(body) / 1024:.0f} KiB",
+                    before / 1000,
+                    after / 1000,
+                    f"{before / after:.1f}x",
+                ]
+            )
+
+        kind = "canonical" if canonical else "non-canonical"
+        print_table(
+            f"Signed request pipeline, {kind} body (ms per request)",
+            ["steps", "body", "before", "after", "speedup"],
+            rows,
+        )
+
+
+if __name__ == "__main__":
+    main()
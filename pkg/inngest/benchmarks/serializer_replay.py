@@ -0,0 +1,126 @@
+"""
+Replaying a function whose 500 steps all return Pydantic models, so every
+memoized output is deserialized with the client's serializer. "before" builds
+a new TypeAdapter for every output, like the previous PydanticSerializer.
+"after" uses the TypeAdapter cache.
+
+Usage: python benchmarks/serializer_replay.py
+"""
+
+from __future__ import annotations
+
+import json
+
+import inngest
+import pydantic
+from _utils import measure, print_table
+from inngest._internal import comm_lib, serializer_lib, server_lib, transforms
+
+_STEP_COUNT = 500
+
+
+class _Order(pydantic.BaseModel):
+    id: int
+    items: list[str]
+    total: float
+
+
+class _UncachedSerializer(serializer_lib.PydanticSerializer):
+    def deserialize(self, obj: object, typ: object) -> object:
+        return pydantic.TypeAdapter[object](typ).validate_python(obj)
+
+
+def _create_handler(
+    serializer: serializer_lib.PydanticSerializer,
+) -> comm_lib.CommHandler:
+    client = inngest.Inngest(
+        app_id="bench",
+        is_production=False,
+        serializer=serializer,
+    )
+
+    def load(i: int) -> _Order:
+        raise AssertionError("step should be memoized")
+
+    @client.create_function(
+        fn_id="fn",
+        retries=0,
+        trigger=inngest.TriggerEvent(event="app/fn"),
+    )
+    def fn(ctx: inngest.ContextSync) -> None:
+        for i in range(_STEP_COUNT):
+            order = ctx.step.run(f"step-{i}", load, i, output_type=_Order)
+            assert isinstance(order, _Order)
+
+    return comm_lib.CommHandler(
+        client=client,
+        framework=server_lib.Framework.FLASK,
+        functions=[fn],
+        streaming=None,
+    )
+
+
+def _create_request() -> comm_lib.CommRequest:
+    body = {
+        "ctx": {
+            "attempt": 0,
+            "disable_immediate_execution": False,
+            "run_id": "run",
+            "stack": {"stack": []},
+        },
+        "event": {"data": {}, "name": "app/fn"},
+        "events": [{"data": {}, "name": "app/fn"}],
+        "steps": {
+            transforms.hash_step_id(f"step-{i}"): {
+                "data": {"id": i, "items": ["a", "b", "c"], "total": 1.5}
+            }
+            for i in range(_STEP_COUNT)
+        },
+        "use_api": False,
+    }
+    return comm_lib.CommRequest(
+        body=json.dumps(body).encode("utf-8"),
+        headers={},
+        public_path=None,
+        query_params={"fnId": "bench-fn"},
+        raw_request=None,
+        request_url="",
+        serve_origin=None,
+        serve_path=None,
+    )
+
+
+def _replay(
+    handler: comm_lib.CommHandler,
+    request: comm_lib.CommRequest,
+) -> None:
+    res = handler.post_sync(request)
+    assert res.status_code == 200, res.body
+
+
+def main() -> None:
+    request = _create_request()
+    before_handler = _create_handler(_UncachedSerializer())
+    serializer = serializer_lib.PydanticSerializer()
+    after_handler = _create_handler(serializer)
+
+    before = measure(lambda: _replay(before_handler, request), number=3)
+    after = measure(lambda: _replay(after_handler, request), number=3)
+
+    print_table(
+        f"Replaying {_STEP_COUNT} Pydantic step outputs (ms per replay)",
+        ["before", "after", "speedup", "cache hits", "cache misses"],
+        [
+            [
+                before / 1000,
+                after / 1000,
+                f"{before / after:.1f}x",
+                serializer.cache_hits,
+                serializer.cache_misses,
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
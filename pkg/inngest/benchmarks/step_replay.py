@@ -0,0 +1,232 @@
+"""
+Replaying a function whose 1,000 steps are all memoized. "before" forces every
+step through report_step and hashes step IDs without the cache, like before
+the memo-hit fast path. "after" is the current code.
+
+Usage: python benchmarks/step_replay.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+import unittest.mock
+
+import inngest
+from _utils import measure, print_table
+from inngest._internal import (
+    comm_lib,
+    execution_lib,
+    function,
+    middleware_lib,
+    net,
+    server_lib,
+    step_lib,
+    transforms,
+)
+
+_STEP_COUNT = 1_000
+
+
+class _FullPathExecution(execution_lib.ExecutionV0):
+    async def report_memoized_step(
+        self,
+        hashed_id: str,
+    ) -> step_lib.Output | None:
+        transforms.hash_step_id.cache_clear()
+        return None
+
+
+class _FullPathExecutionSync(execution_lib.ExecutionV0Sync):
+    def report_memoized_step(
+        self,
+        hashed_id: str,
+    ) -> step_lib.Output | None:
+        transforms.hash_step_id.cache_clear()
+        return None
+
+
+def _identity(value: int) -> int:
+    return value
+
+
+async def _identity_async(value: int) -> int:
+    return value
+
+
+def _create_functions(
+    client: inngest.Inngest,
+) -> tuple[function.Function[typing.Any], function.Function[typing.Any]]:
+    @client.create_function(
+        fn_id="async",
+        trigger=inngest.TriggerEvent(event="app/fn"),
+    )
+    async def fn_async(ctx: inngest.Context) -> None:
+        for i in range(_STEP_COUNT):
+            await ctx.step.run(f"step-{i}", _identity_async, i)
+
+    @client.create_function(
+        fn_id="sync",
+        trigger=inngest.TriggerEvent(event="app/fn"),
+    )
+    def fn_sync(ctx: inngest.ContextSync) -> None:
+        for i in range(_STEP_COUNT):
+            ctx.step.run(f"step-{i}", _identity, i)
+
+    return fn_async, fn_sync
+
+
+def _create_request() -> server_lib.ServerRequest:
+    return server_lib.ServerRequest(
+        ctx=server_lib.ServerRequestCtx(
+            attempt=0,
+            disable_immediate_execution=False,
+            run_id="run",
+            stack=server_lib.ServerRequestCtxStack(stack=[]),
+        ),
+        event={"data": {}, "name": "app/fn"},
+        events=None,
+        steps={
+            transforms.hash_step_id(f"step-{i}"): {"data": i}
+            for i in range(_STEP_COUNT)
+        },
+        use_api=False,
+    )
+
+
+def _get_entry(
+    client: inngest.Inngest,
+    fn: function.Function[typing.Any],
+) -> comm_lib.FunctionEntry:
+    entry = comm_lib.FunctionRegistry(client.app_id, [fn]).get(fn.id)
+    if isinstance(entry, Exception):
+        raise entry
+    return entry
+
+
+def _replay_async(
+    client: inngest.Inngest,
+    fn: function.Function[typing.Any],
+    request: server_lib.ServerRequest,
+    execution_cls: type[execution_lib.ExecutionV0],
+) -> None:
+    timings = net.ServerTimings()
+    middleware = middleware_lib.MiddlewareManager.from_client(
+        client, {}, timings
+    )
+    ctx = execution_lib.Context(
+        attempt=0,
+        event=inngest.Event(name="app/fn"),
+        events=[inngest.Event(name="app/fn")],
+        group=step_lib.Group(),
+        logger=unittest.mock.Mock(),
+        run_id="run",
+        step=step_lib.Step(
+            client,
+            execution_cls(
+                step_lib.StepMemos.from_raw(request.steps),
+                middleware,
+                request,
+                None,
+                timings,
+            ),
+            middleware,
+            step_lib.StepIDCounter(),
+            None,
+        ),
+    )
+    entry = _get_entry(client, fn)
+    res = asyncio.run(
+        fn.call_handler(
+            client, ctx, entry.handler, entry.output_type, middleware
+        )
+    )
+    assert res.error is None
+
+
+def _replay_sync(
+    client: inngest.Inngest,
+    fn: function.Function[typing.Any],
+    request: server_lib.ServerRequest,
+    execution_cls: type[execution_lib.ExecutionV0Sync],
+) -> None:
+    timings = net.ServerTimings()
+    middleware = middleware_lib.MiddlewareManager.from_client(
+        client, {}, timings
+    )
+    ctx = execution_lib.ContextSync(
+        attempt=0,
+        event=inngest.Event(name="app/fn"),
+        events=[inngest.Event(name="app/fn")],
+        group=step_lib.GroupSync(),
+        logger=unittest.mock.Mock(),
+        run_id="run",
+        step=step_lib.StepSync(
+            client,
+            execution_cls(
+                step_lib.StepMemos.from_raw(request.steps),
+                middleware,
+                request,
+                None,
+                timings,
+            ),
+            middleware,
+            step_lib.StepIDCounter(),
+            None,
+        ),
+    )
+    entry = _get_entry(client, fn)
+    res = fn.call_handler_sync(
+        client, ctx, entry.handler, entry.output_type, middleware
+    )
+    assert res.error is None
+
+
+def main() -> None:
+    client = inngest.Inngest(app_id="bench", is_production=False)
+    fn_async, fn_sync = _create_functions(client)
+    request = _create_request()
+
+    async_before = measure(
+        lambda: _replay_async(client, fn_async, request, _FullPathExecution),
+        number=5,
+    )
+    async_after = measure(
+        lambda: _replay_async(
+            client, fn_async, request, execution_lib.ExecutionV0
+        ),
+        number=5,
+    )
+    sync_before = measure(
+        lambda: _replay_sync(client, fn_sync, request, _FullPathExecutionSync),
+        number=5,
+    )
+    sync_after = measure(
+        lambda: _replay_sync(
+            client, fn_sync, request, execution_lib.ExecutionV0Sync
+        ),
+        number=5,
+    )
+
+    print_table(
+        f"Replaying {_STEP_COUNT:,} memoized steps (ms per replay)",
+        ["handler", "before", "after", "speedup"],
+        [
+            [
+                "Step",
+                async_before / 1000,
+                async_after / 1000,
+                f"{async_before / async_after:.1f}x",
+            ],
+            [
+                "StepSync",
+                sync_before / 1000,
+                sync_after / 1000,
+                f"{sync_before / sync_after:.1f}x",
+            ],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,34 @@
 """Public entrypoint for the Inngest SDK."""
 
-from ._internal.client_lib import Inngest, SendEventsResult
+from ._internal.client_lib import (
+    BufferedSender,
+    Inngest,
+    OverflowPolicy,
+    SendEventsResult,
+)
+from ._internal.compression_lib import Compression
 from ._internal.const import Streaming
 from ._internal.errors import NonRetriableError, RetryAfterError, StepError
-from ._internal.execution_lib import Context, ContextSync
+from ._internal.execution_lib import (
+    Checkpoint,
+    Context,
+    ContextSync,
+    ContinuationCache,
+)
 from ._internal.function import Function
+from ._internal.json_lib import JSONCodec, OrjsonJSONCodec, StdlibJSONCodec
 from ._internal.middleware_lib import (
     Middleware,
     MiddlewareSync,
     TransformOutputResult,
 )
-from ._internal.serializer_lib import PydanticSerializer, Serializer
+from ._internal.net import HTTPOptions
+from ._internal.retry_lib import RetryBudget, RetryPolicy
+from ._internal.serializer_lib import (
+    BufferSerializer,
+    PydanticSerializer,
+    Serializer,
+)
 from ._internal.server_lib import (
     Batch,
     Cancel,
@@ -31,26 +49,38 @@ from ._internal.types import JSON
 
 __all__ = [
     "Batch",
+    "BufferSerializer",
+    "BufferedSender",
     "Cancel",
+    "Checkpoint",
+    "Compression",
     "Concurrency",
     "Context",
     "ContextSync",
+    "ContinuationCache",
     "Debounce",
     "Event",
     "Function",
+    "HTTPOptions",
     "Inngest",
     "JSON",
+    "JSONCodec",
     "Middleware",
     "MiddlewareSync",
     "NonRetriableError",
+    "OrjsonJSONCodec",
+    "OverflowPolicy",
     "ParallelMode",
     "Priority",
     "PydanticSerializer",
     "RateLimit",
     "RetryAfterError",
+    "RetryBudget",
+    "RetryPolicy",
     "SendEventsResult",
     "Serializer",
     "Singleton",
+    "StdlibJSONCodec",
     "Step",
     "StepError",
     "StepMemos",
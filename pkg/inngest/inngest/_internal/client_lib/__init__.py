@@ -1,4 +1,5 @@
 from .client import Inngest
 from .models import SendEventsResult
+from .producer import BufferedSender, OverflowPolicy
 
-__all__ = ["Inngest", "SendEventsResult"]
+__all__ = ["BufferedSender", "Inngest", "OverflowPolicy", "SendEventsResult"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import collections
+import datetime
+import threading
+import time
+
+from inngest._internal import server_lib
+
+
+class BatchCache:
+    """
+    Keeps the batch events fetched from the API for recent runs. A run's batch
+    never changes, so each step request for the run can reuse it instead of
+    fetching it again. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 100,
+        ttl: int | datetime.timedelta = datetime.timedelta(minutes=10),
+    ) -> None:
+        """
+        Args:
+        ----
+            max_size: Maximum number of runs. The least recently used run is evicted first.
+            ttl: Evict runs that weren't used within this duration. int value is in ms.
+        """
+
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        if isinstance(ttl, int):
+            self._ttl = ttl / 1000
+        else:
+            self._ttl = ttl.total_seconds()
+
+        self._max_size = max_size
+
+        # Keyed by run ID. Ordered by use, so the first item is the least
+        # recently used. Values are the events and when they were last used.
+        self._batches: collections.OrderedDict[
+            str, tuple[list[server_lib.Event], float]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+    def get(self, run_id: str) -> list[server_lib.Event] | None:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            item = self._batches.get(run_id)
+            if item is None:
+                self.misses += 1
+                return None
+
+            self._batches[run_id] = (item[0], now)
+            self._batches.move_to_end(run_id)
+            self.hits += 1
+
+        # Deep copy so that callers can't change the cached events (e.g. by
+        # mutating event.data).
+        return _copy_events(item[0])
+
+    def put(self, run_id: str, events: list[server_lib.Event]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._batches[run_id] = (_copy_events(events), now)
+            self._batches.move_to_end(run_id)
+            self._evict_expired(now)
+            while len(self._batches) > self._max_size:
+                self._batches.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._batches.clear()
+
+    def _evict_expired(self, now: float) -> None:
+        """
+        Must be called with the lock held.
+        """
+
+        cutoff = now - self._ttl
+        while self._batches:
+            _, used_at = next(iter(self._batches.values()))
+            if used_at > cutoff:
+                break
+            self._batches.popitem(last=False)
+
+
+def _copy_events(events: list[server_lib.Event]) -> list[server_lib.Event]:
+    return [e.model_copy(deep=True) for e in events]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+import typing
+import unittest
+
+from inngest._internal import server_lib
+
+from .batch_cache import BatchCache
+
+
+def _batch(name: str) -> list[server_lib.Event]:
+    return [server_lib.Event(name=name)]
+
+
+class TestBatchCache(unittest.TestCase):
+    def test_max_size(self) -> None:
+        cache = BatchCache(max_size=2)
+        cache.put("a", _batch("a"))
+        cache.put("b", _batch("b"))
+
+        # Using "a" makes "b" the least recently used.
+        assert cache.get("a") is not None
+        cache.put("c", _batch("c"))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("c") == _batch("c")
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    def test_ttl(self) -> None:
+        cache = BatchCache(ttl=10)
+        cache.put("a", _batch("a"))
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_copy(self) -> None:
+        cache = BatchCache()
+        events = _batch("a")
+        cache.put("a", events)
+        events.append(server_lib.Event(name="b"))
+
+        cached = cache.get("a")
+        assert cached == _batch("a")
+        assert cached is not None
+        cached.clear()
+        assert cache.get("a") == _batch("a")
+
+    def test_deep_copy(self) -> None:
+        cache = BatchCache()
+        events = [server_lib.Event(data={"nested": {"a": 1}}, name="a")]
+        cache.put("a", events)
+
+        # Mutating the events that were put doesn't change the cache.
+        typing.cast(dict[str, object], events[0].data)["b"] = 2
+
+        cached = cache.get("a")
+        assert cached is not None
+        assert cached[0].data == {"nested": {"a": 1}}
+
+        # Neither does mutating the events that were returned.
+        typing.cast(dict[str, dict[str, int]], cached[0].data)["nested"][
+            "a"
+        ] = 3
+        cached[0].name = "b"
+
+        cached = cache.get("a")
+        assert cached is not None
+        assert cached[0].data == {"nested": {"a": 1}}
+        assert cached[0].name == "a"
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import concurrent.futures
+import dataclasses
 import datetime
+import functools
 import logging
 import os
-import random
 import secrets
+import threading
 import time
 import typing
 import urllib.parse
@@ -14,18 +17,24 @@ import urllib.parse
 import httpx
 
 from inngest._internal import (
+    compression_lib,
     const,
     env_lib,
     errors,
     function,
+    json_lib,
     middleware_lib,
     net,
+    retry_lib,
     serializer_lib,
     server_lib,
+    transforms,
     types,
 )
 
 from . import models
+from .batch_cache import BatchCache
+from .producer import BufferedSender, OverflowPolicy
 from .utils import get_api_origin, get_event_api_origin
 
 if typing.TYPE_CHECKING:
@@ -34,8 +43,24 @@ if typing.TYPE_CHECKING:
 # Dummy value
 _DEV_SERVER_EVENT_KEY = "NO_EVENT_KEY_SET"
 
-MAX_SEND_ATTEMPTS = 5
-RETRY_BASE_DELAY = 0.1  # 100ms in seconds
+# Events are sent in chunks that stay within these limits. A single event that
+# exceeds the byte limit is sent in its own chunk.
+SEND_CHUNK_MAX_BYTES = 512 * 1024
+SEND_CHUNK_MAX_EVENTS = 1_000
+
+# Maximum number of chunks sent at the same time.
+SEND_CONCURRENCY = 4
+
+
+@dataclasses.dataclass
+class _SendChunk:
+    # Index of the chunk's first event in the sent list.
+    offset: int
+
+    request: httpx.Request
+
+    # Number of events in the chunk.
+    size: int
 
 
 class Inngest:
@@ -75,13 +100,19 @@ class Inngest:
         api_base_url: str | None = None,
         app_id: str,
         app_version: str | None = None,
+        checkpoint: execution_lib.Checkpoint | None = None,
+        compression: compression_lib.Compression | None = None,
+        continuation_cache: execution_lib.ContinuationCache | None = None,
         env: str | None = None,
         event_api_base_url: str | None = None,
         event_key: str | None = None,
+        http_options: net.HTTPOptions | None = None,
         is_production: bool | None = None,
+        json_codec: json_lib.JSONCodec | None = None,
         logger: types.Logger | None = None,
         middleware: list[middleware_lib.UninitializedMiddleware] | None = None,
         request_timeout: int | datetime.timedelta | None = None,
+        retry_policy: retry_lib.RetryPolicy | None = None,
         serializer: serializer_lib.Serializer | None = None,
         signing_key: str | None = None,
     ) -> None:
@@ -91,19 +122,29 @@ class Inngest:
             api_base_url: Origin for the Inngest REST API.
             app_id: Unique Inngest ID. Changing this ID will make Inngest think it's a different app.
             app_version: Arbitrary version identifier (e.g. a semver string or Git SHA).
+            checkpoint: Run consecutive new step.run calls in the same request, until a time or output size budget is reached. Can be overridden per function.
+            compression: Compress large step outputs and function results. Can be overridden per function.
+            continuation_cache: Keep suspended async functions in memory between requests, so that a run's next request resumes the function instead of replaying it. Only useful for long-lived processes.
             env: Branch environment to use. This is only necessary for branch environments.
             event_api_base_url: Origin for the Inngest Event API.
             event_key: Inngest event key.
+            http_options: Connection pool and transport settings for requests to Inngest.
             is_production: Whether the app is in production. This affects request signature verification and default Inngest server URLs.
+            json_codec: Encodes/decodes JSON sent to and received from Inngest. Defaults to the standard library. Use inngest.OrjsonJSONCodec() for faster encoding and decoding.
             logger: Logger to use.
             middleware: List of middleware to use.
             request_timeout: Timeout configuration for internal http client. int value is in ms. Event sending requests may take longer due to retries.
+            retry_policy: How requests to Inngest are retried. Defaults to 5 attempts with exponential backoff, limited by a retry budget shared by the whole process.
             serializer: Serializes/deserializes function/step output using the output_type argument.
             signing_key: Inngest signing key.
         """
 
         self.app_id = app_id
         self._app_version = app_version
+        self._checkpoint = checkpoint
+        self._compression = compression
+        self._continuation_cache = continuation_cache
+        self.json_codec = json_codec or json_lib.default_codec()
         self.logger = logger or logging.getLogger(__name__)
         self._mode = _get_mode(self.logger, is_production)
 
@@ -121,13 +162,6 @@ class Inngest:
             const.EnvKey.SIGNING_KEY_FALLBACK.value
         )
 
-        if isinstance(request_timeout, int):
-            self._httpx_timeout = request_timeout / 1000  # convert ms to s
-        elif isinstance(request_timeout, datetime.timedelta):
-            self._httpx_timeout = request_timeout.total_seconds()
-        else:
-            self._httpx_timeout = 30.0
-
         self._env = env or env_lib.get_environment_name()
         if (
             self._env is None
@@ -148,17 +182,30 @@ class Inngest:
             raise maybe_str
         self._event_api_origin = maybe_str
 
+        self._send_chunk_max_bytes = SEND_CHUNK_MAX_BYTES
+        self._send_chunk_max_events = SEND_CHUNK_MAX_EVENTS
+        self._send_concurrency = SEND_CONCURRENCY
+
+        self._batch_cache = BatchCache()
         self._serializer = serializer
         self._http_client = net.AuthenticatedHTTPClient(
             env=self._env,
+            http_options=http_options,
+            json_codec=self.json_codec,
+            request_timeout=request_timeout,
+            retry_policy=retry_policy,
             signing_key=self._signing_key,
             signing_key_fallback=self._signing_key_fallback,
         )
 
-    def _build_send_request(
+    def _build_send_requests(
         self,
         events: list[server_lib.Event],
-    ) -> types.MaybeError[httpx.Request]:
+    ) -> types.MaybeError[list[_SendChunk]]:
+        """
+        Build 1 request per chunk of events.
+        """
+
         event_key: str
         if self._event_key is not None:
             event_key = self._event_key
@@ -177,28 +224,43 @@ class Inngest:
         # do that.
         server_kind = None
 
-        headers = net.create_headers(
-            env=self._env,
-            framework=framework,
-            server_kind=server_kind,
-        )
-        headers[server_lib.HeaderKey.EVENT_ID_SEED.value] = _seed()
-
-        body = []
-        for event in events:
-            d = event.to_dict()
-            if isinstance(d, Exception):
-                return d
-
-            if d.get("id") == "":
-                del d["id"]
-            if d.get("ts") == 0:
-                d["ts"] = int(time.time() * 1000)
-            body.append(d)
-
-        return self._http_client.build_httpx_request(
-            "POST", url, headers=headers, json=body, timeout=self._httpx_timeout
+        encoded = _encode_events(events, self.json_codec)
+        if isinstance(encoded, Exception):
+            return encoded
+
+        split = _split_send_chunks(
+            encoded,
+            max_bytes=self._send_chunk_max_bytes,
+            max_events=self._send_chunk_max_events,
         )
+        chunks: list[_SendChunk] = []
+        for i, (offset, content) in enumerate(split):
+            end = split[i + 1][0] if i + 1 < len(split) else len(events)
+            headers = net.create_headers(
+                env=self._env,
+                framework=framework,
+                server_kind=server_kind,
+            )
+
+            # Each request needs its own seed since the Inngest Server derives
+            # event IDs from the seed and the event's index in the request.
+            headers[server_lib.HeaderKey.EVENT_ID_SEED.value] = _seed()
+
+            chunks.append(
+                _SendChunk(
+                    offset=offset,
+                    request=self._http_client.build_httpx_request(
+                        "POST",
+                        url,
+                        content=content,
+                        headers=headers,
+                        timeout=self._http_client.timeout,
+                    ),
+                    size=end - offset,
+                )
+            )
+
+        return chunks
 
     def add_middleware(
         self,
@@ -211,6 +273,8 @@ class Inngest:
         *,
         batch_events: server_lib.Batch | None = None,
         cancel: list[server_lib.Cancel] | None = None,
+        checkpoint: execution_lib.Checkpoint | None = None,
+        compression: compression_lib.Compression | None = None,
         concurrency: list[server_lib.Concurrency] | None = None,
         debounce: server_lib.Debounce | None = None,
         fn_id: str,
@@ -244,6 +308,8 @@ class Inngest:
         ----
             batch_events: Event batching config.
             cancel: Run cancellation config.
+            checkpoint: Run consecutive new step.run calls in the same request, until a time or output size budget is reached. Overrides the client's checkpoint config.
+            compression: Compress large step outputs and the function result. Overrides the client's compression config.
             concurrency: Concurrency config.
             debounce: Debouncing config.
             fn_id: Function ID. Changing this ID will make Inngest think this is a new function.
@@ -268,11 +334,14 @@ class Inngest:
             | execution_lib.FunctionHandlerSync[types.T],
         ) -> function.Function[types.T]:
             triggers = trigger if isinstance(trigger, list) else [trigger]
+            self._prepare_output_type(output_type)
 
             return function.Function(
                 function.FunctionOpts(
                     batch_events=batch_events,
                     cancel=cancel,
+                    checkpoint=checkpoint,
+                    compression=compression,
                     concurrency=concurrency,
                     debounce=debounce,
                     fully_qualified_id=fully_qualified_fn_id,
@@ -299,48 +368,49 @@ class Inngest:
         self, run_id: str
     ) -> types.MaybeError[list[server_lib.Event]]:
         """
-        Fetch a batch of events from the API
+        Fetch a batch of events from the API, unless it's cached
         """
 
-        url = urllib.parse.urljoin(
-            self._api_origin,
-            f"/v0/runs/{run_id}/batch",
-        )
-        res = await self._http_client.get(url, auth=True)
+        cached = self._batch_cache.get(run_id)
+        if cached is not None:
+            return cached
+
+        res = await self._http_client.get(self._batch_url(run_id), auth=True)
         if isinstance(res, Exception):
             return res
 
-        data = res.json()
-        if not isinstance(data, list):
-            raise errors.BodyInvalidError("batch data is not an array")
+        events = _parse_batch(res.content, self.json_codec)
+        if isinstance(events, Exception):
+            return events
 
-        events = []
-        for e in data:
-            events.append(server_lib.Event.model_validate(e))
+        self._batch_cache.put(run_id, events)
         return events
 
     def _get_batch_sync(
         self, run_id: str
     ) -> types.MaybeError[list[server_lib.Event]]:
         """
-        Fetch a batch of events from the API
+        Fetch a batch of events from the API, unless it's cached
         """
 
-        url = urllib.parse.urljoin(
-            self._api_origin,
-            f"/v0/runs/{run_id}/batch",
-        )
-        res = self._http_client.get_sync(url, auth=True)
+        cached = self._batch_cache.get(run_id)
+        if cached is not None:
+            return cached
+
+        return self._fetch_batch_sync(run_id)
+
+    def _fetch_batch_sync(
+        self, run_id: str
+    ) -> types.MaybeError[list[server_lib.Event]]:
+        res = self._http_client.get_sync(self._batch_url(run_id), auth=True)
         if isinstance(res, Exception):
             return res
 
-        data = res.json()
-        if not isinstance(data, list):
-            raise errors.BodyInvalidError("batch data is not an array")
+        events = _parse_batch(res.content, self.json_codec)
+        if isinstance(events, Exception):
+            return events
 
-        events = []
-        for e in data:
-            events.append(server_lib.Event.model_validate(e))
+        self._batch_cache.put(run_id, events)
         return events
 
     async def _get_steps(
@@ -350,19 +420,11 @@ class Inngest:
         Fetch memoized step data from the API
         """
 
-        url = urllib.parse.urljoin(
-            self._api_origin,
-            f"/v0/runs/{run_id}/actions",
-        )
-        res = await self._http_client.get(url, auth=True)
+        res = await self._http_client.get(self._steps_url(run_id), auth=True)
         if isinstance(res, Exception):
             return res
 
-        data = res.json()
-        if not isinstance(data, dict):
-            raise errors.BodyInvalidError("step data is not an object")
-
-        return data
+        return _parse_steps(res.content, self.json_codec)
 
     def _get_steps_sync(
         self, run_id: str
@@ -371,37 +433,101 @@ class Inngest:
         Fetch memoized step data from the API
         """
 
-        url = urllib.parse.urljoin(
+        res = self._http_client.get_sync(self._steps_url(run_id), auth=True)
+        if isinstance(res, Exception):
+            return res
+
+        return _parse_steps(res.content, self.json_codec)
+
+    def _get_batch_and_steps_sync(
+        self, run_id: str
+    ) -> types.MaybeError[tuple[list[server_lib.Event], dict[str, object]]]:
+        """
+        Fetch a batch of events and memoized step data from the API. The
+        requests are sent at the same time, unless the batch is cached.
+        """
+
+        events = self._batch_cache.get(run_id)
+        if events is not None:
+            steps = self._get_steps_sync(run_id)
+            if isinstance(steps, Exception):
+                return steps
+            return events, steps
+
+        batch_future = _use_api_pool().submit(self._fetch_batch_sync, run_id)
+        steps = self._get_steps_sync(run_id)
+        maybe_events = batch_future.result()
+
+        if isinstance(maybe_events, Exception):
+            return maybe_events
+        if isinstance(steps, Exception):
+            return steps
+        return maybe_events, steps
+
+    def _batch_url(self, run_id: str) -> str:
+        return urllib.parse.urljoin(
+            self._api_origin,
+            f"/v0/runs/{run_id}/batch",
+        )
+
+    def _steps_url(self, run_id: str) -> str:
+        return urllib.parse.urljoin(
             self._api_origin,
             f"/v0/runs/{run_id}/actions",
         )
-        res = self._http_client.get_sync(url, auth=True)
-        if isinstance(res, Exception):
-            return res
 
-        data = res.json()
-        if not isinstance(data, dict):
-            raise errors.BodyInvalidError("step data is not an object")
+    def producer(
+        self,
+        *,
+        linger: int | datetime.timedelta = datetime.timedelta(milliseconds=50),
+        max_batch_size: int = 500,
+        max_queue_size: int = 10_000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> BufferedSender:
+        """
+        Create a sender that queues events and sends them in batches from a
+        background thread. Useful when events are sent one at a time at a high
+        rate, since each send is otherwise its own request. Queued events are
+        sent when the process exits.
 
-        return data
+        Args:
+        ----
+            linger: Maximum time an event waits for its batch to fill up. int value is in ms.
+            max_batch_size: Maximum number of events in a batch.
+            max_queue_size: Maximum number of queued events. New events are handled by overflow when the queue is full.
+            overflow: What to do with new events when the queue is full.
+        """
+
+        return BufferedSender(
+            self,
+            linger=linger,
+            max_batch_size=max_batch_size,
+            max_queue_size=max_queue_size,
+            overflow=overflow,
+        )
 
     async def send(
         self,
-        events: server_lib.Event | list[server_lib.Event],
+        events: server_lib.EventLike | typing.Sequence[server_lib.EventLike],
         *,
         skip_middleware: bool = False,
     ) -> list[str]:
         """
         Send one or more events. This method is asynchronous.
 
+        Large lists of events are split into chunks that are sent
+        concurrently. If any chunk fails, a SendEventsError is raised with the
+        IDs of the events that were sent and the error of each failed chunk.
+
         Args:
         ----
-            events: An event or list of events to send.
+            events: An event or list of events to send. Events can also be mappings with the same fields, which skips validating their data.
             skip_middleware: Whether to skip middleware.
         """
 
-        if not isinstance(events, list):
-            events = [events]
+        parsed_events = server_lib.to_events(events)
+        if isinstance(parsed_events, Exception):
+            raise parsed_events
 
         middleware = None
         if not skip_middleware:
@@ -410,70 +536,76 @@ class Inngest:
                 raw_request=None,
                 timings=None,
             )
-            err = await middleware.before_send_events(events)
+            err = await middleware.before_send_events(parsed_events)
             if isinstance(err, Exception):
                 raise err
 
-        req = self._build_send_request(events)
-        if isinstance(req, Exception):
-            raise req
-
-        # TODO: Migrate this to HTTPClient.post
-        resp = None
-        for attempt in range(MAX_SEND_ATTEMPTS):
-            try:
-                resp = await net.fetch_with_thready_safety(
-                    self._http_client._http_client,
-                    self._http_client._http_client_sync,
-                    req,
-                )
-            except httpx.RequestError:
-                pass  # we will retry with delay
-
-            # Don't retry if the request was successful or if there was a 4xx
-            # status code. We don't want to retry on 4xx because the request is
-            # malformed and retrying will just fail again.
-            if resp is not None and resp.status_code < 500:
-                break
+        chunks = self._build_send_requests(parsed_events)
+        if isinstance(chunks, Exception):
+            raise chunks
 
-            await asyncio.sleep(_compute_backoff_delay(attempt))
+        semaphore = asyncio.Semaphore(self._send_concurrency)
 
-        if resp is None:
-            raise errors.SendEventsError(
-                "never received response while sending events", []
-            )
+        async def send_chunk(
+            chunk: _SendChunk,
+        ) -> types.MaybeError[models.SendEventsResult]:
+            async with semaphore:
+                try:
+                    return await self._send_chunk(chunk.request)
+                except Exception as err:
+                    return err
 
-        result = models.SendEventsResult.from_raw(resp.json())
-        if isinstance(result, Exception):
-            raise result
+        results = await asyncio.gather(*(send_chunk(c) for c in chunks))
+        result, err = _merge_send_results(chunks, results)
 
         if middleware is not None:
-            err = await middleware.after_send_events(result)
-            if isinstance(err, Exception):
-                raise err
+            middleware_err = await middleware.after_send_events(result)
+            if isinstance(middleware_err, Exception):
+                raise middleware_err
 
-        if result.error is not None:
-            raise errors.SendEventsError(result.error, result.ids)
+        if err is not None:
+            raise err
 
         return result.ids
 
+    async def _send_chunk(
+        self,
+        req: httpx.Request,
+    ) -> types.MaybeError[models.SendEventsResult]:
+        resp = await self._http_client.send(req)
+        if isinstance(resp, Exception):
+            err = errors.SendEventsError(
+                "never received response while sending events", []
+            )
+            err.__cause__ = resp
+            return err
+
+        return models.SendEventsResult.from_raw(
+            transforms.load_json(resp.content, self.json_codec)
+        )
+
     def send_sync(
         self,
-        events: server_lib.Event | list[server_lib.Event],
+        events: server_lib.EventLike | typing.Sequence[server_lib.EventLike],
         *,
         skip_middleware: bool = False,
     ) -> list[str]:
         """
         Send one or more events. This method is synchronous.
 
+        Large lists of events are split into chunks that are sent
+        concurrently. If any chunk fails, a SendEventsError is raised with the
+        IDs of the events that were sent and the error of each failed chunk.
+
         Args:
         ----
-            events: An event or list of events to send.
+            events: An event or list of events to send. Events can also be mappings with the same fields, which skips validating their data.
             skip_middleware: Whether to skip middleware.
         """
 
-        if not isinstance(events, list):
-            events = [events]
+        parsed_events = server_lib.to_events(events)
+        if isinstance(parsed_events, Exception):
+            raise parsed_events
 
         middleware = None
         if not skip_middleware:
@@ -482,49 +614,74 @@ class Inngest:
                 raw_request=None,
                 timings=None,
             )
-            err = middleware.before_send_events_sync(events)
+            err = middleware.before_send_events_sync(parsed_events)
             if isinstance(err, Exception):
                 raise err
 
-        req = self._build_send_request(events)
-        if isinstance(req, Exception):
-            raise req
-
-        # TODO: Migrate this to HTTPClient.post_sync
-        resp = None
-        for attempt in range(MAX_SEND_ATTEMPTS):
-            try:
-                resp = self._http_client._http_client_sync.send(req)
-            except httpx.RequestError:
-                pass  # we will retry with delay
+        chunks = self._build_send_requests(parsed_events)
+        if isinstance(chunks, Exception):
+            raise chunks
 
-            # Don't retry if the request was successful or if there was a 4xx
-            # status code. We don't want to retry on 4xx because the request is
-            # malformed and retrying will just fail again.
-            if resp is not None and resp.status_code < 500:
-                break
+        results = self._send_chunks_sync(chunks)
+        result, err = _merge_send_results(chunks, results)
 
-            time.sleep(_compute_backoff_delay(attempt))
-
-        if resp is None:
-            raise errors.SendEventsError(
-                "never received response while sending events", []
-            )
+        if middleware is not None:
+            middleware_err = middleware.after_send_events_sync(result)
+            if isinstance(middleware_err, Exception):
+                raise middleware_err
 
-        result = models.SendEventsResult.from_raw(resp.json())
+        if err is not None:
+            raise err
 
-        if isinstance(result, Exception):
-            raise result
+        return result.ids
 
-        if middleware is not None:
-            err = middleware.after_send_events_sync(result)
-            if isinstance(err, Exception):
-                raise err
+    def _send_chunks_sync(
+        self,
+        chunks: list[_SendChunk],
+    ) -> list[types.MaybeError[models.SendEventsResult]]:
+        """
+        Send chunks concurrently. Returns their results in the same order.
+        """
 
-        if result.error is not None:
-            raise errors.SendEventsError(result.error, result.ids)
+        def send_chunk(
+            chunk: _SendChunk,
+        ) -> types.MaybeError[models.SendEventsResult]:
+            try:
+                return self._send_chunk_sync(chunk.request)
+            except Exception as err:
+                return err
+
+        if len(chunks) == 1 or self._send_concurrency == 1:
+            return [send_chunk(c) for c in chunks]
+
+        # The pool is shared, so limit this send's concurrency separately.
+        semaphore = threading.BoundedSemaphore(self._send_concurrency)
+        futures: list[
+            concurrent.futures.Future[types.MaybeError[models.SendEventsResult]]
+        ] = []
+        for chunk in chunks:
+            semaphore.acquire()
+            future = _send_pool().submit(send_chunk, chunk)
+            future.add_done_callback(lambda _: semaphore.release())
+            futures.append(future)
+
+        return [f.result() for f in futures]
+
+    def _send_chunk_sync(
+        self,
+        req: httpx.Request,
+    ) -> types.MaybeError[models.SendEventsResult]:
+        resp = self._http_client.send_sync(req)
+        if isinstance(resp, Exception):
+            err = errors.SendEventsError(
+                "never received response while sending events", []
+            )
+            err.__cause__ = resp
+            return err
 
-        return result.ids
+        return models.SendEventsResult.from_raw(
+            transforms.load_json(resp.content, self.json_codec)
+        )
 
     def set_logger(self, logger: types.Logger) -> None:
         self.logger = logger
@@ -542,6 +699,18 @@ class Inngest:
 
         return self._serializer.serialize(obj, typ)
 
+    def _prepare_output_type(self, typ: object) -> None:
+        """
+        Build whatever the client's serializer needs for an output type ahead
+        of time, so that the first request doesn't pay for it.
+        """
+
+        if typ is types.EmptySentinel:
+            return
+
+        if isinstance(self._serializer, serializer_lib.PydanticSerializer):
+            self._serializer.prepare(typ)
+
     def _deserialize(self, obj: object, typ: object) -> object:
         """
         Deserialize a Python object using the client's serializer.
@@ -580,6 +749,178 @@ def _get_mode(
     return server_lib.ServerKind.CLOUD
 
 
+def _encode_events(
+    events: list[server_lib.Event],
+    codec: json_lib.JSONCodec,
+) -> types.MaybeError[list[bytes]]:
+    """
+    Encode each event separately so that chunks can be split by size without
+    encoding twice. Validated event data is already JSON, so events are
+    encoded directly rather than dumped by Pydantic first.
+    """
+
+    now = int(time.time() * 1000)
+    encoded: list[bytes] = []
+    for event in events:
+        d: dict[str, object] = {"data": event.data}
+        if event.id != "":
+            d["id"] = event.id
+        d["name"] = event.name
+        d["ts"] = event.ts or now
+
+        content = transforms.dump_json(d, codec)
+        if isinstance(content, Exception):
+            # The data may have been changed after validation (e.g. by
+            # middleware) to something Pydantic knows how to dump.
+            dumped = event.to_dict()
+            if isinstance(dumped, Exception):
+                return dumped
+            d["data"] = dumped["data"]
+
+            content = transforms.dump_json(d, codec)
+            if isinstance(content, Exception):
+                return content
+        encoded.append(content)
+
+    return encoded
+
+
+def _parse_batch(
+    content: bytes,
+    codec: json_lib.JSONCodec,
+) -> types.MaybeError[list[server_lib.Event]]:
+    data = transforms.load_json(content, codec)
+    if isinstance(data, Exception):
+        return data
+    if not isinstance(data, list):
+        return errors.BodyInvalidError("batch data is not an array")
+
+    events: list[server_lib.Event] = []
+    for e in data:
+        event = server_lib.Event.from_json(e)
+        if isinstance(event, Exception):
+            return event
+        events.append(event)
+    return events
+
+
+def _parse_steps(
+    content: bytes,
+    codec: json_lib.JSONCodec,
+) -> types.MaybeError[dict[str, object]]:
+    data = transforms.load_json(content, codec)
+    if isinstance(data, Exception):
+        return data
+    if not isinstance(data, dict):
+        return errors.BodyInvalidError("step data is not an object")
+    return data
+
+
+def _split_send_chunks(
+    encoded: list[bytes],
+    *,
+    max_bytes: int,
+    max_events: int,
+) -> list[tuple[int, bytes]]:
+    """
+    Group encoded events into JSON arrays within the limits. Returns each
+    array with the index of its first event.
+    """
+
+    chunks: list[tuple[int, bytes]] = []
+    offset = 0
+    size = 2  # Brackets
+    for i, event in enumerate(encoded):
+        event_size = len(event) + 1  # Comma
+        is_full = size + event_size > max_bytes or i - offset >= max_events
+        if i > offset and is_full:
+            chunks.append((offset, b"[" + b",".join(encoded[offset:i]) + b"]"))
+            offset = i
+            size = 2
+        size += event_size
+
+    chunks.append((offset, b"[" + b",".join(encoded[offset:]) + b"]"))
+    return chunks
+
+
+@functools.cache
+def _use_api_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Fetches runs' batches while their steps are fetched on the calling
+    thread. Shared by all clients, so that clients created per request (or
+    per test) don't each keep idle threads alive.
+    """
+
+    return concurrent.futures.ThreadPoolExecutor(
+        thread_name_prefix="inngest-use-api",
+    )
+
+
+@functools.cache
+def _send_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Sends chunks of events. Shared by all clients, so that each send (and
+    each BufferedSender batch) doesn't start and stop threads.
+    """
+
+    return concurrent.futures.ThreadPoolExecutor(
+        thread_name_prefix="inngest-send",
+    )
+
+
+def _merge_send_results(
+    chunks: list[_SendChunk],
+    results: list[types.MaybeError[models.SendEventsResult]],
+) -> tuple[models.SendEventsResult, Exception | None]:
+    """
+    Merge the results of sending each chunk into the result of the whole send
+    and the error to raise after middleware, if any. A lone chunk's exception
+    is raised immediately, as it was before chunking.
+
+    With multiple chunks, the merged IDs stay aligned with the sent events:
+    each event in a failed chunk gets an empty ID. The IDs that the API
+    returned for a failed chunk (if any) are in its chunk error.
+    """
+
+    if len(results) == 1:
+        result = results[0]
+        if isinstance(result, Exception):
+            # Nothing was sent, so there's nothing for middleware to see.
+            raise result
+        if result.error is not None:
+            return result, errors.SendEventsError(result.error, result.ids)
+        return result, None
+
+    ids: list[str] = []
+    chunk_errors: list[errors.SendEventsError] = []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            chunk_ids = getattr(result, "ids", [])
+            message = str(result)
+        else:
+            chunk_ids = result.ids
+            message = result.error or ""
+
+        if isinstance(result, Exception) or result.error is not None:
+            ids.extend([""] * chunk.size)
+            chunk_errors.append(
+                errors.SendEventsError(message, chunk_ids, offset=chunk.offset)
+            )
+        else:
+            ids.extend(chunk_ids)
+
+    if len(chunk_errors) == 0:
+        return models.SendEventsResult(ids=ids), None
+
+    message = (
+        f"{len(chunk_errors)} of {len(chunks)} chunks failed: {chunk_errors[0]}"
+    )
+    return (
+        models.SendEventsResult(error=message, ids=ids),
+        errors.SendEventsError(message, ids, chunk_errors=chunk_errors),
+    )
+
+
 def _seed() -> str:
     """
     Create the event ID seed header value. This is used to seed a
@@ -592,12 +933,3 @@ def _seed() -> str:
     entropy = secrets.token_bytes(10)
     entropy_base64 = base64.b64encode(entropy).decode("utf-8")
     return f"{current_time_millis},{entropy_base64}"
-
-
-def _compute_backoff_delay(attempt: int) -> float:
-    # Jitter between 0 and the base delay
-    jitter = random.random() * RETRY_BASE_DELAY  # noqa:S311
-
-    # Exponential backoff with jitter
-    delay: float = RETRY_BASE_DELAY * (2**attempt) + jitter
-    return delay
@@ -1,9 +1,14 @@
+import asyncio
+import json
 import os
+import threading
 import unittest
 
+import httpx
+import pydantic
 import pytest
 
-from inngest._internal import client_lib, const, errors, server_lib
+from inngest._internal import client_lib, const, errors, net, server_lib
 
 
 class Test(unittest.TestCase):
@@ -212,3 +217,221 @@ class Test(unittest.TestCase):
         )
         assert client.api_origin == "https://example.com"
         assert client.event_api_origin == "https://example.com"
+
+
+class _EventAPI:
+    """
+    Fake Event API that fails requests whose first event is in fail_names.
+    """
+
+    def __init__(self, fail_names: frozenset[str] = frozenset()) -> None:
+        self.bodies: list[list[dict[str, object]]] = []
+        self.seeds: set[str] = set()
+        self._fail_names = fail_names
+        self._lock = threading.Lock()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        with self._lock:
+            self.bodies.append(body)
+            self.seeds.add(
+                request.headers[server_lib.HeaderKey.EVENT_ID_SEED.value]
+            )
+
+        if body[0]["name"] in self._fail_names:
+            return httpx.Response(400, json={"error": "bad", "ids": []})
+        return httpx.Response(
+            200,
+            json={"ids": [event["name"] for event in body]},
+        )
+
+    def install(self, client: client_lib.Inngest) -> None:
+        transport = httpx.MockTransport(self.handle)
+        client._http_client._async_clients = net.AsyncHTTPClientRegistry(
+            lambda: httpx.AsyncClient(transport=transport)
+        )
+        client._http_client._http_client_sync = httpx.Client(
+            transport=transport
+        )
+
+
+class TestSendChunking(unittest.TestCase):
+    def _create_client(self, api: _EventAPI) -> client_lib.Inngest:
+        client = client_lib.Inngest(app_id="test", is_production=False)
+        client._send_chunk_max_events = 3
+        api.install(client)
+        return client
+
+    def test_sync(self) -> None:
+        api = _EventAPI()
+        client = self._create_client(api)
+        events = [server_lib.Event(name=str(i)) for i in range(8)]
+
+        ids = client.send_sync(events)
+
+        # IDs are in the same order as the events.
+        assert ids == [str(i) for i in range(8)]
+        assert sorted(len(body) for body in api.bodies) == [2, 3, 3]
+        assert len(api.seeds) == 3
+
+    def test_reuses_threads(self) -> None:
+        api = _EventAPI()
+        client = self._create_client(api)
+        events = [server_lib.Event(name=str(i)) for i in range(8)]
+
+        for _ in range(2):
+            assert client.send_sync(events) == [str(i) for i in range(8)]
+
+            # The send threads outlive the send.
+            assert any(
+                t.name.startswith("inngest-send") for t in threading.enumerate()
+            )
+
+    def test_async(self) -> None:
+        api = _EventAPI()
+        client = self._create_client(api)
+        events = [server_lib.Event(name=str(i)) for i in range(8)]
+
+        ids = asyncio.run(client.send(events))
+
+        assert ids == [str(i) for i in range(8)]
+        assert sorted(len(body) for body in api.bodies) == [2, 3, 3]
+
+    def test_max_bytes(self) -> None:
+        api = _EventAPI()
+        client = self._create_client(api)
+        client._send_chunk_max_events = 1_000
+        client._send_chunk_max_bytes = 2_500
+        events = [
+            server_lib.Event(name=str(i), data={"value": "x" * 1_000})
+            for i in range(5)
+        ]
+
+        ids = client.send_sync(events)
+
+        assert ids == [str(i) for i in range(5)]
+        assert sorted(len(body) for body in api.bodies) == [1, 2, 2]
+
+    def test_chunk_error(self) -> None:
+        api = _EventAPI(fail_names=frozenset({"3"}))
+        client = self._create_client(api)
+        events = [server_lib.Event(name=str(i)) for i in range(8)]
+
+        with pytest.raises(errors.SendEventsError) as exc_info:
+            client.send_sync(events)
+
+        # The other chunks were still sent. IDs stay aligned with the events,
+        # so the middle chunk's events have empty IDs.
+        ids = exc_info.value.ids
+        assert ids == ["0", "1", "2", "", "", "", "6", "7"]
+        assert [i for i, event_id in enumerate(ids) if event_id] == [
+            0,
+            1,
+            2,
+            6,
+            7,
+        ]
+        assert len(exc_info.value.chunk_errors) == 1
+        assert exc_info.value.chunk_errors[0].offset == 3
+        assert str(exc_info.value.chunk_errors[0]) == "bad"
+
+
+class TestSendEncoding(unittest.TestCase):
+    def test_mappings(self) -> None:
+        api = _EventAPI()
+        client = client_lib.Inngest(app_id="test", is_production=False)
+        api.install(client)
+
+        ids = client.send_sync(
+            [
+                {"data": {"a": 1}, "name": "0"},
+                server_lib.Event(id="abc", name="1", ts=123),
+            ]
+        )
+
+        assert ids == ["0", "1"]
+        body = api.bodies[0]
+
+        # Empty IDs are omitted and missing timestamps are set.
+        assert body[0]["data"] == {"a": 1}
+        assert "id" not in body[0]
+        assert isinstance(body[0]["ts"], int)
+        assert body[0]["ts"] > 0
+        assert body[1] == {"data": {}, "id": "abc", "name": "1", "ts": 123}
+
+    def test_invalid_mapping(self) -> None:
+        client = client_lib.Inngest(app_id="test", is_production=False)
+
+        # The name is required.
+        with pytest.raises(pydantic.ValidationError):
+            client.send_sync({"data": {}})
+
+
+class TestUseAPI(unittest.TestCase):
+    def test_sync(self) -> None:
+        paths: list[str] = []
+        lock = threading.Lock()
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            with lock:
+                paths.append(request.url.path)
+            if request.url.path.endswith("/batch"):
+                return httpx.Response(200, json=[{"data": {}, "name": "a"}])
+            return httpx.Response(200, json={"step": {"data": 1}})
+
+        client = client_lib.Inngest(app_id="test", is_production=False)
+        client._http_client._http_client_sync = httpx.Client(
+            transport=httpx.MockTransport(handle)
+        )
+
+        for _ in range(2):
+            res = client._get_batch_and_steps_sync("run")
+            assert not isinstance(res, Exception)
+            events, steps = res
+            assert [e.name for e in events] == ["a"]
+            assert steps == {"step": {"data": 1}}
+
+        # The batch is only fetched once since it's cached.
+        assert sorted(paths) == [
+            "/v0/runs/run/actions",
+            "/v0/runs/run/actions",
+            "/v0/runs/run/batch",
+        ]
+
+    def test_reuses_thread(self) -> None:
+        def handle(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/batch"):
+                return httpx.Response(200, json=[{"data": {}, "name": "a"}])
+            return httpx.Response(200, json={})
+
+        thread_names: set[str] = set()
+        for i in range(3):
+            # A new client each time, like clients created per request.
+            client = client_lib.Inngest(app_id="test", is_production=False)
+            client._http_client._http_client_sync = httpx.Client(
+                transport=httpx.MockTransport(handle)
+            )
+
+            res = client._get_batch_and_steps_sync(f"run-{i}")
+            assert not isinstance(res, Exception)
+            thread_names.update(
+                t.name
+                for t in threading.enumerate()
+                if t.name.startswith("inngest-use-api")
+            )
+
+        # Sequential requests share a thread, even across clients.
+        assert len(thread_names) == 1
+
+    def test_invalid_batch(self) -> None:
+        def handle(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={})
+
+        client = client_lib.Inngest(app_id="test", is_production=False)
+        client._http_client._http_client_sync = httpx.Client(
+            transport=httpx.MockTransport(handle)
+        )
+
+        res = client._get_batch_and_steps_sync("run")
+        assert isinstance(res, errors.BodyInvalidError)
+        assert len(client._batch_cache) == 0
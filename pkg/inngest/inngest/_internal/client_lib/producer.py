@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import dataclasses
+import datetime
+import enum
+import threading
+import time
+import typing
+
+from inngest._internal import errors, middleware_lib, server_lib, types
+
+from . import models
+
+if typing.TYPE_CHECKING:
+    from .client import Inngest
+
+
+class OverflowPolicy(enum.Enum):
+    """
+    What BufferedSender does with new events when its queue is full.
+    """
+
+    # Wait for room in the queue.
+    BLOCK = "block"
+
+    # Don't queue the events. Their futures fail with a SendEventsError.
+    DROP = "drop"
+
+    # Raise a SendEventsError.
+    RAISE = "raise"
+
+
+@dataclasses.dataclass
+class _QueuedEvent:
+    event: server_lib.Event
+    future: concurrent.futures.Future[str]
+
+    # Monotonic time when the event was queued.
+    queued_at: float
+
+
+class BufferedSender:
+    """
+    Sends events in batches from a background thread. Create with
+    Inngest.producer.
+
+    A batch is sent when it reaches max_batch_size events or when its oldest
+    event has waited for linger. Batches that are too large for a single
+    request are split like any other Inngest.send call.
+    """
+
+    def __init__(
+        self,
+        client: Inngest,
+        *,
+        linger: int | datetime.timedelta = datetime.timedelta(milliseconds=50),
+        max_batch_size: int = 500,
+        max_queue_size: int = 10_000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """
+        Args:
+        ----
+            client: Client used to send the events.
+            linger: Maximum time an event waits for its batch to fill up. int value is in ms.
+            max_batch_size: Maximum number of events in a batch.
+            max_queue_size: Maximum number of queued events. New events are handled by overflow when the queue is full.
+            overflow: What to do with new events when the queue is full.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_queue_size < max_batch_size:
+            raise ValueError("max_queue_size must be at least max_batch_size")
+
+        if isinstance(linger, int):
+            self._linger = linger / 1000  # convert ms to s
+        else:
+            self._linger = linger.total_seconds()
+
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_queue_size = max_queue_size
+        self._overflow = overflow
+
+        # Guards all of the below.
+        self._condition = threading.Condition()
+
+        self._is_closed = False
+        self._flush_requests = 0
+        self._in_flight = 0
+        self._queue: collections.deque[_QueuedEvent] = collections.deque()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> BufferedSender:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close_sync()
+
+    async def send(
+        self,
+        events: server_lib.EventLike | typing.Sequence[server_lib.EventLike],
+    ) -> list[asyncio.Future[str]]:
+        """
+        Queue one or more events. Returns a future per event that resolves to
+        its ID once it's sent. This method is asynchronous and only waits when
+        the queue is full and the overflow policy is BLOCK.
+
+        Args:
+        ----
+            events: An event or list of events to send.
+        """
+
+        parsed_events = server_lib.to_events(events)
+        if isinstance(parsed_events, Exception):
+            raise parsed_events
+
+        futures = self._enqueue(parsed_events, block=False)
+        if futures is None:
+            # The queue is full. Wait in a thread so that the event loop isn't
+            # blocked.
+            futures = await asyncio.to_thread(self.send_sync, parsed_events)
+
+        return [asyncio.wrap_future(f) for f in futures]
+
+    def send_sync(
+        self,
+        events: server_lib.EventLike | typing.Sequence[server_lib.EventLike],
+    ) -> list[concurrent.futures.Future[str]]:
+        """
+        Queue one or more events. Returns a future per event that resolves to
+        its ID once it's sent. This method is synchronous and thread-safe. It
+        only blocks when the queue is full and the overflow policy is BLOCK.
+
+        Args:
+        ----
+            events: An event or list of events to send.
+        """
+
+        parsed_events = server_lib.to_events(events)
+        if isinstance(parsed_events, Exception):
+            raise parsed_events
+
+        futures = self._enqueue(parsed_events, block=True)
+        if futures is None:
+            raise Exception("unreachable")
+        return futures
+
+    def _enqueue(
+        self,
+        events: list[server_lib.Event],
+        *,
+        block: bool,
+    ) -> list[concurrent.futures.Future[str]] | None:
+        """
+        Check for room and queue the events under one lock. Returns None when
+        the queue is full, the overflow policy is BLOCK and block is False.
+        """
+
+        if len(events) > self._max_queue_size:
+            raise ValueError("cannot queue more than max_queue_size events")
+
+        futures: list[concurrent.futures.Future[str]] = [
+            concurrent.futures.Future() for _ in events
+        ]
+
+        with self._condition:
+            if self._is_closed:
+                raise errors.SendEventsError("producer is closed", [])
+
+            if not self._has_room_locked(len(events)):
+                if self._overflow is OverflowPolicy.RAISE:
+                    raise errors.SendEventsError("producer queue is full", [])
+
+                if self._overflow is OverflowPolicy.DROP:
+                    for future in futures:
+                        future.set_exception(
+                            errors.SendEventsError("producer queue is full", [])
+                        )
+                    return futures
+
+                if not block:
+                    return None
+
+                self._condition.wait_for(
+                    lambda: self._is_closed
+                    or self._has_room_locked(len(events))
+                )
+                if self._is_closed:
+                    raise errors.SendEventsError("producer is closed", [])
+
+            now = time.monotonic()
+            self._queue.extend(
+                _QueuedEvent(event=event, future=future, queued_at=now)
+                for event, future in zip(events, futures)
+            )
+            self._start_locked()
+            self._condition.notify_all()
+
+        return futures
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """
+        Send queued events now and wait until they're sent. Returns False if
+        the timeout was reached. This method is asynchronous.
+
+        Args:
+        ----
+            timeout: Maximum number of seconds to wait.
+        """
+
+        return await asyncio.to_thread(self.flush_sync, timeout)
+
+    def flush_sync(self, timeout: float | None = None) -> bool:
+        """
+        Send queued events now and wait until they're sent. Returns False if
+        the timeout was reached. This method is synchronous.
+
+        Args:
+        ----
+            timeout: Maximum number of seconds to wait.
+        """
+
+        with self._condition:
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: len(self._queue) == 0 and self._in_flight == 0,
+                    timeout,
+                )
+            finally:
+                self._flush_requests -= 1
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Send queued events and stop the background thread. New events are
+        rejected. This method is asynchronous.
+
+        Args:
+        ----
+            timeout: Maximum number of seconds to wait.
+        """
+
+        await asyncio.to_thread(self.close_sync, timeout)
+
+    def close_sync(self, timeout: float | None = None) -> None:
+        """
+        Send queued events and stop the background thread. New events are
+        rejected. This method is synchronous.
+
+        Args:
+        ----
+            timeout: Maximum number of seconds to wait.
+        """
+
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        atexit.unregister(self.close_sync)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _has_room_locked(self, count: int) -> bool:
+        return len(self._queue) + count <= self._max_queue_size
+
+    def _start_locked(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            daemon=True,
+            name="inngest-producer",
+            target=self._run,
+        )
+        self._thread.start()
+
+        # Don't lose queued events when the process exits normally.
+        atexit.register(self.close_sync)
+
+    def _run(self) -> None:
+        # Runs the send events middleware hooks, which may be async. Owned by
+        # this thread since the caller's loop (if any) may be blocked or gone.
+        loop = asyncio.new_event_loop()
+        try:
+            self._run_batches(loop)
+        finally:
+            loop.close()
+
+    def _run_batches(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                self._send_batch(batch, loop)
+            except Exception as err:
+                self._client.logger.error(f"failed to send event batch: {err}")
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(err)
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    def _next_batch(self) -> list[_QueuedEvent] | None:
+        """
+        Wait until a batch is ready. Returns None when closed and there are no
+        more events.
+        """
+
+        with self._condition:
+            while True:
+                self._condition.wait_for(
+                    lambda: len(self._queue) > 0 or self._is_closed
+                )
+                if len(self._queue) == 0:
+                    return None
+
+                # Linger until the batch is full, unless something is waiting
+                # for the queue to drain.
+                deadline = self._queue[0].queued_at + self._linger
+                while (
+                    len(self._queue) < self._max_batch_size
+                    and self._flush_requests == 0
+                    and not self._is_closed
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch: list[_QueuedEvent] = []
+                while (
+                    len(self._queue) > 0 and len(batch) < self._max_batch_size
+                ):
+                    item = self._queue.popleft()
+
+                    # Skip events whose futures were cancelled.
+                    if item.future.set_running_or_notify_cancel():
+                        batch.append(item)
+
+                # There's room in the queue for blocked senders.
+                self._condition.notify_all()
+
+                if len(batch) > 0:
+                    self._in_flight = len(batch)
+                    return batch
+
+    def _send_batch(
+        self,
+        batch: list[_QueuedEvent],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        client = self._client
+        events = [item.event for item in batch]
+
+        # Use the async hooks since they support both sync and async
+        # middleware.
+        middleware = middleware_lib.MiddlewareManager.from_client(
+            client,
+            raw_request=None,
+            timings=None,
+        )
+        err = loop.run_until_complete(middleware.before_send_events(events))
+        if isinstance(err, Exception):
+            raise err
+
+        chunks = client._build_send_requests(events)
+        if isinstance(chunks, Exception):
+            raise chunks
+
+        results = client._send_chunks_sync(chunks)
+
+        ids: list[str] = []
+        outcomes: list[str | Exception] = []
+        first_error: Exception | None = None
+        for chunk, result in zip(chunks, results):
+            chunk_ids = _chunk_ids(result, chunk.offset, chunk.size)
+            if isinstance(chunk_ids, Exception):
+                first_error = first_error or chunk_ids
+                ids.extend([""] * chunk.size)
+                outcomes.extend([chunk_ids] * chunk.size)
+            else:
+                ids.extend(chunk_ids)
+                outcomes.extend(chunk_ids)
+
+        err = loop.run_until_complete(
+            middleware.after_send_events(
+                models.SendEventsResult(
+                    error=None if first_error is None else str(first_error),
+                    ids=ids,
+                )
+            )
+        )
+        if isinstance(err, Exception):
+            client.logger.error(f"after_send_events middleware failed: {err}")
+
+        for item, outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                item.future.set_exception(outcome)
+            else:
+                item.future.set_result(outcome)
+
+
+def _chunk_ids(
+    result: types.MaybeError[models.SendEventsResult],
+    offset: int,
+    size: int,
+) -> types.MaybeError[list[str]]:
+    """
+    Get the IDs of a sent chunk's events, in the same order as the events.
+    """
+
+    if isinstance(result, Exception):
+        return result
+
+    if result.error is not None:
+        return errors.SendEventsError(result.error, result.ids, offset=offset)
+
+    if len(result.ids) != size:
+        return errors.SendEventsError(
+            f"expected {size} event IDs but received {len(result.ids)}",
+            result.ids,
+            offset=offset,
+        )
+
+    return result.ids
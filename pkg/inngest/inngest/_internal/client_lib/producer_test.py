@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+import threading
+import unittest
+
+import httpx
+import pytest
+
+from inngest._internal import client_lib, errors, middleware_lib, server_lib
+
+
+class _EventAPI:
+    """
+    Fake Event API that returns each event's name as its ID.
+    """
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.is_paused = threading.Event()
+        self.resume = threading.Event()
+        self.resume.set()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.batch_sizes.append(len(body))
+        self.is_paused.set()
+        self.resume.wait()
+        return httpx.Response(
+            200,
+            json={"ids": [event["name"] for event in body]},
+        )
+
+    def create_client(
+        self,
+        middleware: list[middleware_lib.UninitializedMiddleware] | None = None,
+    ) -> client_lib.Inngest:
+        client = client_lib.Inngest(
+            app_id="test",
+            is_production=False,
+            middleware=middleware,
+        )
+        client._http_client._http_client_sync = httpx.Client(
+            transport=httpx.MockTransport(self.handle)
+        )
+        return client
+
+
+class TestBufferedSender(unittest.TestCase):
+    def test_max_batch_size(self) -> None:
+        api = _EventAPI()
+        producer = api.create_client().producer(
+            linger=datetime.timedelta(minutes=1),
+            max_batch_size=4,
+        )
+        self.addCleanup(producer.close_sync)
+
+        futures = producer.send_sync(
+            [server_lib.Event(name=str(i)) for i in range(10)]
+        )
+        assert producer.flush_sync(timeout=5)
+
+        # Full batches are sent without lingering, and flush sends the rest.
+        assert api.batch_sizes == [4, 4, 2]
+        assert [f.result() for f in futures] == [str(i) for i in range(10)]
+
+    def test_linger(self) -> None:
+        api = _EventAPI()
+        producer = api.create_client().producer(linger=200)
+        self.addCleanup(producer.close_sync)
+
+        futures = [
+            producer.send_sync(server_lib.Event(name=str(i)))[0]
+            for i in range(3)
+        ]
+
+        assert [f.result(timeout=5) for f in futures] == ["0", "1", "2"]
+        assert api.batch_sizes == [3]
+
+    def test_async(self) -> None:
+        api = _EventAPI()
+        producer = api.create_client().producer(linger=10)
+
+        async def run() -> list[str]:
+            futures = await producer.send(
+                [server_lib.Event(name=str(i)) for i in range(3)]
+            )
+            ids = await asyncio.gather(*futures)
+            await producer.close()
+            return list(ids)
+
+        assert asyncio.run(run()) == ["0", "1", "2"]
+
+    def test_async_middleware(self) -> None:
+        sent: list[list[str]] = []
+
+        class _Middleware(middleware_lib.Middleware):
+            async def before_send_events(
+                self,
+                events: list[server_lib.Event],
+            ) -> None:
+                await asyncio.sleep(0)
+                for event in events:
+                    event.name = f"{event.name}!"
+
+            async def after_send_events(
+                self,
+                result: client_lib.SendEventsResult,
+            ) -> None:
+                await asyncio.sleep(0)
+                sent.append(result.ids)
+
+        api = _EventAPI()
+        producer = api.create_client([_Middleware]).producer(linger=10)
+        self.addCleanup(producer.close_sync)
+
+        futures = producer.send_sync(
+            [server_lib.Event(name=str(i)) for i in range(3)]
+        )
+
+        assert [f.result(timeout=5) for f in futures] == ["0!", "1!", "2!"]
+        assert producer.flush_sync(timeout=5)
+        assert sent == [["0!", "1!", "2!"]]
+
+    def test_overflow_raise(self) -> None:
+        api = _EventAPI()
+        api.resume.clear()
+        producer = api.create_client().producer(
+            max_batch_size=2,
+            max_queue_size=2,
+            overflow=client_lib.OverflowPolicy.RAISE,
+        )
+        self.addCleanup(producer.close_sync)
+
+        # The 1st batch is stuck in flight and the 2nd fills the queue.
+        producer.send_sync(
+            [server_lib.Event(name="0"), server_lib.Event(name="1")]
+        )
+        assert api.is_paused.wait(timeout=5)
+        producer.send_sync(
+            [server_lib.Event(name="2"), server_lib.Event(name="3")]
+        )
+
+        with pytest.raises(errors.SendEventsError):
+            producer.send_sync(server_lib.Event(name="4"))
+
+        api.resume.set()
+        assert producer.flush_sync(timeout=5)
+        assert api.batch_sizes == [2, 2]
+
+    def test_overflow_block_async(self) -> None:
+        api = _EventAPI()
+        api.resume.clear()
+        producer = api.create_client().producer(
+            max_batch_size=2,
+            max_queue_size=2,
+        )
+        self.addCleanup(producer.close_sync)
+
+        # The 1st batch is stuck in flight and the 2nd fills the queue.
+        producer.send_sync(
+            [server_lib.Event(name="0"), server_lib.Event(name="1")]
+        )
+        assert api.is_paused.wait(timeout=5)
+        producer.send_sync(
+            [server_lib.Event(name="2"), server_lib.Event(name="3")]
+        )
+
+        async def run() -> list[str]:
+            task = asyncio.create_task(
+                producer.send(server_lib.Event(name="4"))
+            )
+
+            # The event loop keeps running while the send waits for room.
+            await asyncio.sleep(0.1)
+            assert not task.done()
+
+            api.resume.set()
+            ids = await asyncio.gather(*await task)
+            return list(ids)
+
+        assert asyncio.run(run()) == ["4"]
+
+    def test_close(self) -> None:
+        api = _EventAPI()
+        producer = api.create_client().producer(
+            linger=datetime.timedelta(minutes=1),
+        )
+
+        futures = producer.send_sync(server_lib.Event(name="0"))
+        producer.close_sync(timeout=5)
+
+        # Queued events are sent, but new events are rejected.
+        assert futures[0].result() == "0"
+        with pytest.raises(errors.SendEventsError):
+            producer.send_sync(server_lib.Event(name="1"))
@@ -1,9 +1,12 @@
 from .handler import CommHandler, get_function_configs
 from .models import CommRequest, CommResponse
+from .registry import FunctionEntry, FunctionRegistry
 
 __all__ = [
     "CommHandler",
     "CommRequest",
     "CommResponse",
+    "FunctionEntry",
+    "FunctionRegistry",
     "get_function_configs",
 ]
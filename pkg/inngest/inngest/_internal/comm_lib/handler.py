@@ -26,6 +26,7 @@ from inngest._internal import (
 )
 
 from .models import CommRequest, CommResponse
+from .registry import FunctionEntry, FunctionRegistry
 from .utils import parse_query_params, wrap_handler, wrap_handler_sync
 
 
@@ -35,6 +36,7 @@ class CommHandler:
     _fns: dict[str, function.Function[typing.Any]]
     _framework: server_lib.Framework
     _mode: server_lib.ServerKind
+    _registry: FunctionRegistry
     _signing_key: str | None
     _signing_key_fallback: str | None
 
@@ -56,6 +58,10 @@ class CommHandler:
         self._mode = client._mode
         self._api_origin = client.api_origin
         self._fns = {fn.get_id(): fn for fn in functions}
+
+        # Built once so that finding the function for a request doesn't scale
+        # with the number of functions.
+        self._registry = FunctionRegistry(client.app_id, self._fns.values())
         self._framework = framework
 
         if streaming is None:
@@ -119,13 +125,7 @@ class CommHandler:
             self._client.logger.error(server_kind)
             server_kind = None
 
-        middleware = middleware_lib.MiddlewareManager.from_client(
-            self._client,
-            req.raw_request,
-            req.timings,
-        )
-
-        request = server_lib.ServerRequest.from_raw(req.body)
+        request = req.parse_body(server_lib.ServerRequest)
         if isinstance(request, Exception):
             return request
 
@@ -135,11 +135,25 @@ class CommHandler:
             )
 
         # Get the function we should call.
-        fn = self._get_function(params.fn_id)
-        if isinstance(fn, Exception):
-            return fn
+        entry = self._get_function(params.fn_id)
+        if isinstance(entry, Exception):
+            return entry
 
-        events = request.events
+        middleware = middleware_lib.MiddlewareManager.from_client(
+            self._client,
+            req.raw_request,
+            req.timings,
+        )
+        for m in entry.middleware:
+            middleware.add(m)
+
+        event = request.get_event()
+        if isinstance(event, Exception):
+            return event
+
+        events = request.get_events()
+        if isinstance(events, Exception):
+            return events
         steps = request.steps
         if request.use_api:
             # Putting the batch and memoized steps in the request would make it
@@ -165,14 +179,14 @@ class CommHandler:
 
         memos = step_lib.StepMemos.from_raw(steps)
 
-        if fn.is_handler_async:
+        if entry.is_handler_async:
             # Don't await because we might need to stream the response.
             call_res_task = asyncio.create_task(
-                fn.call(
+                entry.fn.call_handler(
                     self._client,
                     execution_lib.Context(
                         attempt=request.ctx.attempt,
-                        event=request.event,
+                        event=event,
                         events=events,
                         group=step_lib.Group(),
                         logger=self._client.logger,
@@ -191,7 +205,8 @@ class CommHandler:
                             params.step_id,
                         ),
                     ),
-                    params.fn_id,
+                    entry.handler,
+                    entry.output_type,
                     middleware,
                 )
             )
@@ -204,16 +219,17 @@ class CommHandler:
                     self._framework,
                     server_kind,
                     req.timings,
+                    self._client.json_codec,
                 )
 
             call_res = await call_res_task
         else:
             fn_call = functools.partial(
-                fn.call_sync,
+                entry.fn.call_handler_sync,
                 self._client,
                 execution_lib.ContextSync(
                     attempt=request.ctx.attempt,
-                    event=request.event,
+                    event=event,
                     events=events,
                     group=step_lib.GroupSync(),
                     logger=self._client.logger,
@@ -232,7 +248,8 @@ class CommHandler:
                         params.step_id,
                     ),
                 ),
-                params.fn_id,
+                entry.handler,
+                entry.output_type,
                 middleware,
             )
 
@@ -251,6 +268,7 @@ class CommHandler:
             self._client.env,
             self._framework,
             server_kind,
+            json_codec=self._client.json_codec,
         )
 
     @wrap_handler_sync()
@@ -271,13 +289,7 @@ class CommHandler:
             self._client.logger.error(server_kind)
             server_kind = None
 
-        middleware = middleware_lib.MiddlewareManager.from_client(
-            self._client,
-            req.raw_request,
-            req.timings,
-        )
-
-        request = server_lib.ServerRequest.from_raw(req.body)
+        request = req.parse_body(server_lib.ServerRequest)
         if isinstance(request, Exception):
             return request
 
@@ -287,11 +299,25 @@ class CommHandler:
             )
 
         # Get the function we should call.
-        fn = self._get_function(params.fn_id)
-        if isinstance(fn, Exception):
-            return fn
+        entry = self._get_function(params.fn_id)
+        if isinstance(entry, Exception):
+            return entry
 
-        events = request.events
+        middleware = middleware_lib.MiddlewareManager.from_client(
+            self._client,
+            req.raw_request,
+            req.timings,
+        )
+        for m in entry.middleware:
+            middleware.add(m)
+
+        event = request.get_event()
+        if isinstance(event, Exception):
+            return event
+
+        events = request.get_events()
+        if isinstance(events, Exception):
+            return events
         steps = request.steps
         if request.use_api:
             # Putting the batch and memoized steps in the request would make it
@@ -299,17 +325,12 @@ class CommHandler:
             # API
 
             with req.timings.use_api:
-                fetched_events = self._client._get_batch_sync(
+                fetched = self._client._get_batch_and_steps_sync(
                     request.ctx.run_id
                 )
-                if isinstance(fetched_events, Exception):
-                    return fetched_events
-                events = fetched_events
-
-                fetched_steps = self._client._get_steps_sync(request.ctx.run_id)
-                if isinstance(fetched_steps, Exception):
-                    return fetched_steps
-                steps = fetched_steps
+                if isinstance(fetched, Exception):
+                    return fetched
+                events, steps = fetched
         if events is None:
             # Should be unreachable. The Executor should always either send the
             # batch or tell the SDK to fetch the batch
@@ -318,11 +339,11 @@ class CommHandler:
 
         memos = step_lib.StepMemos.from_raw(steps)
 
-        call_res = fn.call_sync(
+        call_res = entry.fn.call_handler_sync(
             self._client,
             execution_lib.ContextSync(
                 attempt=request.ctx.attempt,
-                event=request.event,
+                event=event,
                 events=events,
                 group=step_lib.GroupSync(),
                 logger=self._client.logger,
@@ -341,7 +362,8 @@ class CommHandler:
                     params.step_id,
                 ),
             ),
-            params.fn_id,
+            entry.handler,
+            entry.output_type,
             middleware,
         )
 
@@ -351,32 +373,13 @@ class CommHandler:
             self._client.env,
             self._framework,
             server_kind,
+            json_codec=self._client.json_codec,
         )
 
-    def _get_function(
-        self, fn_id: str
-    ) -> types.MaybeError[function.Function[typing.Any]]:
-        # Look for the function ID in the list of user functions, but also
-        # look for it in the list of on_failure functions.
-        for _fn in self._fns.values():
-            if _fn.get_id() == fn_id:
-                return _fn
-            if _fn.on_failure_fn_id == fn_id:
-                return _fn
-
-        # If we didn't find the function ID, it might be because the function ID
-        # in the request uses the old format that didn't include the app ID.
-        # We'll prefix the function ID with the app ID and try again. This logic
-        # can be deleted when no one is using Python SDK versions below 0.3.0
-        # anymore.
-        app_and_fn_id = f"{self._client.app_id}-{fn_id}"
-        for _fn in self._fns.values():
-            if _fn.get_id() == app_and_fn_id:
-                return _fn
-            if _fn.on_failure_fn_id == app_and_fn_id:
-                return _fn
-
-        return errors.FunctionNotFoundError(f"function {fn_id} not found")
+    def _get_function(self, fn_id: str) -> types.MaybeError[FunctionEntry]:
+        # Accepts the function ID, the on_failure function ID, and the legacy
+        # function ID that doesn't include the app ID.
+        return self._registry.get(fn_id)
 
     @wrap_handler_sync(require_signature=False)
     def get_sync(
@@ -555,7 +558,7 @@ class Syncer:
             # it's critical
             return Exception("request must be signed for in-band sync")
 
-        req_body = server_lib.InBandSynchronizeRequest.from_raw(req.body)
+        req_body = req.parse_body(server_lib.InBandSynchronizeRequest)
         if isinstance(req_body, Exception):
             return req_body
 
@@ -682,11 +685,15 @@ class Syncer:
         # with the concurrency scope.
         body = transforms.deep_strip_none(body)
 
+        content = transforms.dump_json(body, handler._client.json_codec)
+        if isinstance(content, Exception):
+            return content
+
         return handler._http_client.build_httpx_request(
             "POST",
             registration_url,
+            content=content,
             headers=headers,
-            json=body,
             params=outgoing_params,
             timeout=30,
         )
@@ -696,9 +703,11 @@ class Syncer:
         handler: CommHandler,
         res: httpx.Response,
     ) -> types.MaybeError[CommResponse]:
-        try:
-            server_res_body = res.json()
-        except Exception:
+        server_res_body = transforms.load_json(
+            res.content,
+            handler._client.json_codec,
+        )
+        if isinstance(server_res_body, Exception):
             return errors.RegistrationFailedError("response is not valid JSON")
 
         if not isinstance(server_res_body, dict):
@@ -735,9 +744,9 @@ class Syncer:
         self._logger.debug(f"Sending out-of-band sync request to {prep.url}")
 
         res = await net.fetch_with_auth_fallback(
-            handler._http_client._http_client,
-            handler._http_client._http_client_sync,
+            handler._http_client._async_clients,
             prep,
+            retry_policy=handler._http_client.retry_policy,
             signing_key=handler._signing_key,
             signing_key_fallback=handler._signing_key_fallback,
         )
@@ -762,6 +771,7 @@ class Syncer:
         res = net.fetch_with_auth_fallback_sync(
             handler._http_client._http_client_sync,
             prep,
+            retry_policy=handler._http_client.retry_policy,
             signing_key=handler._signing_key,
             signing_key_fallback=handler._signing_key_fallback,
         )
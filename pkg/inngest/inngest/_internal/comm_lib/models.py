@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import http
-import json
 import typing
 
 import pydantic
@@ -10,12 +9,15 @@ import pydantic
 from inngest._internal import (
     errors,
     execution_lib,
+    json_lib,
     net,
     server_lib,
     transforms,
     types,
 )
 
+_stdlib_json_codec = json_lib.StdlibJSONCodec()
+
 
 class CommRequest(types.BaseModel):
     body: bytes
@@ -35,9 +37,43 @@ class CommRequest(types.BaseModel):
         exclude=True,
     )
 
+    # Parsed body, cached so that the body is parsed at most once per request.
+    _loaded_body: object = pydantic.PrivateAttr(default=types.empty_sentinel)
+
     class Config:
         arbitrary_types_allowed = True
 
+    def load_body(self) -> types.MaybeError[object]:
+        """
+        Parse the JSON body. The result is cached.
+        """
+
+        if isinstance(self._loaded_body, types.EmptySentinel):
+            # Always use the standard library since the result is used for
+            # signature canonicalization, which needs an exact parse.
+            self._loaded_body = transforms.load_json(
+                self.body,
+                _stdlib_json_codec,
+            )
+        return self._loaded_body
+
+    def parse_body(
+        self,
+        model: type[types.BaseModelT],
+    ) -> types.MaybeError[types.BaseModelT]:
+        """
+        Validate the body into a model. Reuses the parsed body if something
+        (e.g. signature validation) already parsed it. Otherwise, validates the
+        raw bytes directly without an intermediate parse.
+        """
+
+        if isinstance(self._loaded_body, types.EmptySentinel):
+            return model.from_raw(self.body)
+
+        if isinstance(self._loaded_body, Exception):
+            return self._loaded_body
+        return model.from_raw(self._loaded_body)
+
 
 class CommResponse:
     def __init__(
@@ -48,12 +84,19 @@ class CommResponse:
         stream: typing.Callable[[], typing.AsyncGenerator[bytes, None]]
         | None = None,
         status_code: int = http.HTTPStatus.OK.value,
+        json_codec: json_lib.JSONCodec | None = None,
     ) -> None:
         self.headers = headers or {}
         self.body = body
+        self.json_codec = json_codec or json_lib.default_codec()
         self.status_code = status_code
         self.stream = stream
 
+        # Encoded body, cached since it's needed for both signing and sending.
+        # Stored with the body it was encoded from so that replacing the body
+        # invalidates it.
+        self._encoded_body: tuple[object, bytes] | None = None
+
     @property
     def no_retry(self) -> bool:
         value = self.headers.get(server_lib.HeaderKey.NO_RETRY.value)
@@ -88,6 +131,7 @@ class CommResponse:
         framework: server_lib.Framework,
         server_kind: server_lib.ServerKind | None,
         timings: net.ServerTimings,
+        json_codec: json_lib.JSONCodec,
     ) -> CommResponse:
         """
         Create a streaming response. Sends keepalive bytes until the response is
@@ -119,25 +163,26 @@ class CommResponse:
                 env,
                 framework,
                 server_kind,
+                json_codec=json_codec,
             )
 
-            body = transforms.dump_json(comm_res.body)
+            body = transforms.dump_json(comm_res.body, json_codec)
             if isinstance(body, Exception):
                 comm_res = cls.from_error(logger, body)
-                body = json.dumps(comm_res.body)
+                body = json_codec.dumps(comm_res.body)
 
             comm_res.headers[server_lib.HeaderKey.SERVER_TIMING.value] = (
                 timings.to_header()
             )
 
             # Send the "actual" CommResponse as the body.
-            yield json.dumps(
+            yield json_codec.dumps(
                 {
-                    "body": body,
+                    "body": body.decode("utf-8"),
                     "headers": comm_res.headers,
                     "status": comm_res.status_code,
                 }
-            ).encode("utf-8")
+            )
 
         return cls(
             headers=net.create_headers(
@@ -157,7 +202,12 @@ class CommResponse:
         env: str | None,
         framework: server_lib.Framework,
         server_kind: server_lib.ServerKind | None,
+        *,
+        json_codec: json_lib.JSONCodec | None = None,
     ) -> CommResponse:
+        if json_codec is None:
+            json_codec = json_lib.default_codec()
+
         headers = {
             **net.create_headers(
                 env=env,
@@ -169,7 +219,7 @@ class CommResponse:
         if call_res.multi:
             multi_body: list[object] = []
             for item in call_res.multi:
-                d = _prep_call_result(item)
+                d = _prep_call_result(item, json_codec)
                 if isinstance(d, Exception):
                     return cls.from_error(logger, d)
                 multi_body.append(d)
@@ -181,10 +231,11 @@ class CommResponse:
             return cls(
                 body=multi_body,
                 headers=headers,
+                json_codec=json_codec,
                 status_code=http.HTTPStatus.PARTIAL_CONTENT.value,
             )
 
-        body = _prep_call_result(call_res)
+        body = _prep_call_result(call_res, json_codec)
         status_code = http.HTTPStatus.OK.value
         if isinstance(body, Exception):
             return cls.from_error(logger, body)
@@ -202,6 +253,7 @@ class CommResponse:
         return cls(
             body=body,
             headers=headers,
+            json_codec=json_codec,
             status_code=status_code,
         )
 
@@ -249,10 +301,17 @@ class CommResponse:
         )
 
     def body_bytes(self) -> types.MaybeError[bytes]:
-        dumped = transforms.dump_json(self.body)
+        if (
+            self._encoded_body is not None
+            and self._encoded_body[0] is self.body
+        ):
+            return self._encoded_body[1]
+
+        dumped = transforms.dump_json(self.body, self.json_codec)
         if isinstance(dumped, Exception):
             return dumped
-        return dumped.encode("utf-8")
+        self._encoded_body = (self.body, dumped)
+        return dumped
 
     def prep_call_result(
         self,
@@ -279,7 +338,7 @@ class CommResponse:
             d["error"] = e
 
         if call_res.output is not types.empty_sentinel:
-            err = transforms.dump_json(call_res.output)
+            err = transforms.dump_json(call_res.output, self.json_codec)
             if isinstance(err, Exception):
                 msg = "returned unserializable data"
                 if call_res.step is not None:
@@ -315,6 +374,7 @@ class CommResponse:
 
 def _prep_call_result(
     call_res: execution_lib.CallResult,
+    json_codec: json_lib.JSONCodec,
 ) -> types.MaybeError[object]:
     """
     Convert a CallResult to the shape the Inngest Server expects. For step-level
@@ -337,7 +397,7 @@ def _prep_call_result(
         d["error"] = e
 
     if call_res.output is not types.empty_sentinel:
-        err = transforms.dump_json(call_res.output)
+        err = transforms.dump_json(call_res.output, json_codec)
         if isinstance(err, Exception):
             msg = "returned unserializable data"
             if call_res.step is not None:
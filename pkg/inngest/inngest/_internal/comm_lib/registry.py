@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+from inngest._internal import (
+    errors,
+    execution_lib,
+    function,
+    middleware_lib,
+    types,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class FunctionEntry:
+    """
+    Everything needed to call a function, resolved once when the registry is
+    built.
+    """
+
+    fn: function.Function[typing.Any]
+
+    # The canonical ID to pass to the function. This is always the fully
+    # qualified main ID or on_failure ID, even if the request used a legacy ID.
+    fn_id: str
+
+    handler: (
+        execution_lib.FunctionHandlerAsync[typing.Any]
+        | execution_lib.FunctionHandlerSync[typing.Any]
+    )
+    is_handler_async: bool
+
+    # Function-level middleware. Client-level middleware is added separately
+    # since it can change after the registry is built.
+    middleware: tuple[middleware_lib.UninitializedMiddleware, ...]
+
+    output_type: object
+
+
+class FunctionRegistry:
+    """
+    Maps every accepted function ID form (main, on_failure, and legacy IDs
+    without the app ID prefix) to a resolved entry. Lookups are O(1) regardless
+    of how many functions are served.
+    """
+
+    def __init__(
+        self,
+        app_id: str,
+        fns: typing.Iterable[function.Function[typing.Any]],
+    ) -> None:
+        self._entries: dict[str, FunctionEntry] = {}
+
+        fns = list(fns)
+        for fn in fns:
+            self._entries[fn.get_id()] = FunctionEntry(
+                fn=fn,
+                fn_id=fn.get_id(),
+                handler=fn._handler,
+                is_handler_async=fn.is_handler_async,
+                middleware=tuple(fn._middleware),
+                output_type=fn._output_type,
+            )
+
+        for fn in fns:
+            if fn.on_failure_fn_id is None or fn._opts.on_failure is None:
+                continue
+
+            self._entries.setdefault(
+                fn.on_failure_fn_id,
+                FunctionEntry(
+                    fn=fn,
+                    fn_id=fn.on_failure_fn_id,
+                    handler=fn._opts.on_failure,
+                    is_handler_async=bool(fn.is_on_failure_handler_async),
+                    middleware=tuple(fn._middleware),
+                    # We only need to serialize to JSON so any type is fine.
+                    # Deserialization isn't necessary since on_failure handlers
+                    # aren't invoked via `step.invoke`.
+                    output_type=object,
+                ),
+            )
+
+        # The function ID in the request may use the old format that didn't
+        # include the app ID. Exact matches take precedence over these. This
+        # logic can be deleted when no one is using Python SDK versions below
+        # 0.3.0 anymore.
+        prefix = f"{app_id}-"
+        for fn_id, entry in list(self._entries.items()):
+            if fn_id.startswith(prefix):
+                self._entries.setdefault(fn_id[len(prefix) :], entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, fn_id: str) -> types.MaybeError[FunctionEntry]:
+        entry = self._entries.get(fn_id)
+        if entry is None:
+            return errors.FunctionNotFoundError(f"function {fn_id} not found")
+        return entry
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import unittest
+
+import inngest
+from inngest._internal import errors
+
+from .registry import FunctionRegistry
+
+client = inngest.Inngest(
+    api_base_url="http://foo.bar",
+    app_id="my-app",
+    is_production=False,
+)
+
+
+def _on_failure(ctx: inngest.ContextSync) -> None:
+    pass
+
+
+@client.create_function(
+    fn_id="fn",
+    on_failure=_on_failure,
+    output_type=int,
+    trigger=inngest.TriggerEvent(event="app/fn"),
+)
+def fn(ctx: inngest.ContextSync) -> int:
+    return 1
+
+
+class TestFunctionRegistry(unittest.TestCase):
+    def test_main(self) -> None:
+        registry = FunctionRegistry(client.app_id, [fn])
+        entry = registry.get("my-app-fn")
+        assert not isinstance(entry, Exception)
+        assert entry.fn is fn
+        assert entry.fn_id == "my-app-fn"
+        assert entry.handler is fn._handler
+        assert entry.is_handler_async is False
+        assert entry.output_type is int
+
+    def test_on_failure(self) -> None:
+        registry = FunctionRegistry(client.app_id, [fn])
+        entry = registry.get("my-app-fn-failure")
+        assert not isinstance(entry, Exception)
+        assert entry.fn is fn
+        assert entry.fn_id == "my-app-fn-failure"
+        assert entry.handler is _on_failure
+        assert entry.output_type is object
+
+    def test_legacy_id(self) -> None:
+        registry = FunctionRegistry(client.app_id, [fn])
+
+        entry = registry.get("fn")
+        assert not isinstance(entry, Exception)
+        assert entry.fn_id == "my-app-fn"
+
+        entry = registry.get("fn-failure")
+        assert not isinstance(entry, Exception)
+        assert entry.fn_id == "my-app-fn-failure"
+
+    def test_exact_match_takes_precedence(self) -> None:
+        @client.create_function(
+            fn_id="my-app-fn",
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def other(ctx: inngest.ContextSync) -> None:
+            pass
+
+        # "my-app-fn" is both the full ID of fn and the legacy ID of other.
+        registry = FunctionRegistry(client.app_id, [other, fn])
+        entry = registry.get("my-app-fn")
+        assert not isinstance(entry, Exception)
+        assert entry.fn is fn
+
+    def test_not_found(self) -> None:
+        registry = FunctionRegistry(client.app_id, [fn])
+        entry = registry.get("unknown")
+        assert isinstance(entry, errors.FunctionNotFoundError)
+        assert str(entry) == "function unknown not found"
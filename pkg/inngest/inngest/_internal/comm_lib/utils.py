@@ -85,6 +85,7 @@ def wrap_handler(
                     request_signing_key = net.validate_request_sig(
                         body=req.body,
                         headers=req.headers,
+                        load_body=req.load_body,
                         mode=self._client._mode,
                         signing_key=self._signing_key,
                         signing_key_fallback=self._signing_key_fallback,
@@ -116,6 +117,7 @@ def wrap_handler(
                 ),
                 server_lib.HeaderKey.SERVER_TIMING.value: req.timings.to_header(),
             }
+            res.json_codec = self._client.json_codec
 
             if isinstance(request_signing_key, str):
                 err = res.sign(request_signing_key)
@@ -164,6 +166,7 @@ def wrap_handler_sync(
                     request_signing_key = net.validate_request_sig(
                         body=req.body,
                         headers=req.headers,
+                        load_body=req.load_body,
                         mode=self._client._mode,
                         signing_key=self._signing_key,
                         signing_key_fallback=self._signing_key_fallback,
@@ -195,6 +198,7 @@ def wrap_handler_sync(
                 ),
                 server_lib.HeaderKey.SERVER_TIMING.value: req.timings.to_header(),
             }
+            res.json_codec = self._client.json_codec
 
             if isinstance(request_signing_key, str):
                 err = res.sign(request_signing_key)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import base64
+import typing
+import zlib
+
+from inngest._internal import json_lib
+
+try:
+    import zstandard
+
+    _has_zstandard = True
+except ImportError:
+    _has_zstandard = False
+
+# Marks a JSON object as a compressed value. The value is the algorithm.
+_compression_marker: typing.Final = "__COMPRESSED__"
+
+Algorithm = typing.Literal["zlib", "zstd"]
+
+
+class Compression:
+    """
+    Compress step outputs and function results whose JSON encoding is at least
+    threshold bytes. Inngest resends every memoized step output in each
+    request for a run, so large outputs cost bandwidth and parse time on every
+    later step.
+
+    Compressed values are replaced with a JSON object holding the
+    base64-encoded compressed JSON. They're compressed before the
+    transform_output middleware hook runs (so encryption middleware encrypts
+    the compressed value) and decompressed after the transform_input hook
+    runs. A compressed function result is only readable by SDKs that support
+    compression (e.g. through step.invoke in this SDK).
+    """
+
+    def __init__(
+        self,
+        *,
+        algorithm: Algorithm = "zlib",
+        level: int | None = None,
+        threshold: int = 64 * 1024,
+    ) -> None:
+        """
+        Args:
+        ----
+            algorithm: Compression algorithm. zstd requires the zstandard package (`pip install inngest[zstd]`).
+            level: Compression level. Defaults to the algorithm's default.
+            threshold: Minimum size, in bytes, of an output's JSON encoding for it to be compressed.
+        """
+
+        if algorithm == "zstd" and not _has_zstandard:
+            raise ImportError(
+                "zstandard is not installed. Install it with `pip install inngest[zstd]`"
+            )
+        if threshold < 0:
+            raise ValueError("threshold must not be negative")
+
+        self._algorithm = algorithm
+        self._level = level
+        self._threshold = threshold
+
+    def compress(self, value: object, json_codec: json_lib.JSONCodec) -> object:
+        """
+        Return the compressed value, or the value itself if it's below the
+        threshold or doesn't get smaller.
+        """
+
+        if is_compressed(value):
+            return value
+
+        try:
+            encoded = json_codec.dumps(value)
+        except Exception:
+            # Let encoding the response report the error.
+            return value
+
+        if len(encoded) < self._threshold:
+            return value
+
+        if self._algorithm == "zstd":
+            compressed = zstandard.ZstdCompressor(
+                level=3 if self._level is None else self._level
+            ).compress(encoded)
+        else:
+            compressed = zlib.compress(
+                encoded,
+                -1 if self._level is None else self._level,
+            )
+
+        data = base64.b64encode(compressed).decode("ascii")
+        if len(data) >= len(encoded):
+            return value
+
+        return {_compression_marker: self._algorithm, "data": data}
+
+
+def is_compressed(value: object) -> bool:
+    return isinstance(value, dict) and _compression_marker in value
+
+
+def decompress(value: object, json_codec: json_lib.JSONCodec) -> object:
+    """
+    Return the decompressed value, or the value itself if it isn't
+    compressed. Raises if the value is compressed but invalid.
+    """
+
+    if not is_compressed(value):
+        return value
+
+    # Safe to cast since is_compressed checked that it's a dict.
+    value = typing.cast(dict[str, object], value)
+    algorithm = value[_compression_marker]
+    data = value.get("data")
+    if not isinstance(data, str):
+        raise ValueError("compressed value is missing data")
+
+    compressed = base64.b64decode(data)
+    if algorithm == "zlib":
+        encoded = zlib.decompress(compressed)
+    elif algorithm == "zstd":
+        if not _has_zstandard:
+            raise ImportError(
+                "zstandard is not installed. Install it with `pip install inngest[zstd]`"
+            )
+        encoded = zstandard.ZstdDecompressor().decompress(compressed)
+    else:
+        raise ValueError(f"unknown compression algorithm: {algorithm}")
+
+    return json_codec.loads(encoded)
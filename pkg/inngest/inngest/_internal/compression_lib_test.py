@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import typing
+import unittest
+
+import test_core
+
+import inngest
+
+from . import comm_lib, compression_lib, json_lib, server_lib, transforms
+
+_codec = json_lib.StdlibJSONCodec()
+
+
+class _WrapMiddleware(inngest.MiddlewareSync):
+    """
+    Stands in for encryption middleware: wraps outputs and unwraps memos.
+    """
+
+    def transform_input(
+        self,
+        ctx: inngest.Context | inngest.ContextSync,
+        function: inngest.Function[typing.Any],
+        steps: inngest.StepMemos,
+    ) -> None:
+        for step in steps.values():
+            if isinstance(step.data, dict):
+                step.data = step.data["wrapped"]
+
+    def transform_output(self, result: inngest.TransformOutputResult) -> None:
+        result.output = {"wrapped": result.output}
+
+
+class TestCompression(unittest.TestCase):
+    def test_threshold(self) -> None:
+        compression = inngest.Compression(threshold=100)
+        small = {"value": "a" * 10}
+        large = {"value": "a" * 1_000}
+
+        assert compression.compress(small, _codec) is small
+
+        compressed = compression.compress(large, _codec)
+        assert compression_lib.is_compressed(compressed)
+        assert len(json.dumps(compressed)) < len(json.dumps(large))
+        assert compression_lib.decompress(compressed, _codec) == large
+
+    def test_incompressible(self) -> None:
+        compression = inngest.Compression(threshold=0)
+        value = "ab"
+
+        assert compression.compress(value, _codec) == value
+
+    def test_step_output(self) -> None:
+        client = inngest.Inngest(
+            app_id="app",
+            compression=inngest.Compression(threshold=100),
+            is_production=False,
+            middleware=[_WrapMiddleware],
+        )
+        large = "a" * 1_000
+        outputs: list[object] = []
+
+        @client.create_function(
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> str:
+            outputs.append(ctx.step.run("a", lambda: large))
+            return large
+
+        handler = comm_lib.CommHandler(
+            client=client,
+            framework=server_lib.Framework.FLASK,
+            functions=[fn],
+            streaming=None,
+        )
+
+        # The step output is compressed before middleware wraps it.
+        req = test_core.execution_request({})
+        res = handler.post_sync(req)
+        assert res.status_code == 206
+        assert isinstance(res.body, list)
+        memo = res.body[0]["data"]
+        assert compression_lib.is_compressed(memo["wrapped"])
+        assert "compress;dur=" in req.timings.to_header()
+
+        # The memo is decompressed after middleware unwraps it.
+        req = test_core.execution_request(
+            {transforms.hash_step_id("a"): {"data": memo}}
+        )
+        res = handler.post_sync(req)
+        assert res.status_code == 200
+        assert outputs == [large]
+        assert "decompress;dur=" in req.timings.to_header()
+
+        # The function result is compressed too.
+        assert isinstance(res.body, dict)
+        assert compression_lib.is_compressed(res.body["wrapped"])
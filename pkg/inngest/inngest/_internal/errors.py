@@ -195,16 +195,27 @@ class RetryAfterError(Error):
 class SendEventsError(Error):
     code = server_lib.ErrorCode.SEND_EVENT_FAILED
 
-    def __init__(self, message: str, ids: list[str]) -> None:
+    def __init__(
+        self,
+        message: str,
+        ids: list[str],
+        *,
+        chunk_errors: list[SendEventsError] | None = None,
+        offset: int = 0,
+    ) -> None:
         """
         Args:
         ----
             message: Error message
-            ids: List of event IDs that successfully sent
+            ids: List of event IDs that successfully sent. When the events were sent in multiple chunks, there's 1 ID per event (in the same order) and each event in a failed chunk has an empty ID.
+            chunk_errors: Errors of the failed chunks, when the events were sent in multiple chunks. Each error's ids are the chunk's successfully sent events.
+            offset: For a chunk's error, the index of the chunk's first event in the sent list.
         """
 
         super().__init__(message)
+        self.chunk_errors = chunk_errors or []
         self.ids = ids
+        self.offset = offset
 
 
 class StepError(Error):
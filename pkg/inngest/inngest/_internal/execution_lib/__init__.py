@@ -1,5 +1,7 @@
 from .base import BaseExecution, BaseExecutionSync
+from .checkpoint import Checkpoint, CheckpointBuffer
 from .context_var import get_step_context, set_step_context, step
+from .continuation import Continuation, ContinuationCache
 from .models import (
     CallResult,
     Context,
@@ -16,7 +18,11 @@ __all__ = [
     "BaseExecution",
     "BaseExecutionSync",
     "CallResult",
+    "Checkpoint",
+    "CheckpointBuffer",
     "Context",
+    "Continuation",
+    "ContinuationCache",
     "ContextSync",
     "FunctionHandlerAsync",
     "FunctionHandlerSync",
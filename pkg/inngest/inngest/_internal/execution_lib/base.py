@@ -31,6 +31,21 @@ class BaseExecution(typing.Protocol):
         step_info: step_lib.StepInfo,
     ) -> ReportedStep: ...
 
+    async def report_memoized_step(
+        self,
+        hashed_id: str,
+    ) -> step_lib.Output | None: ...
+
+    def checkpoint(
+        self,
+        response: step_lib.StepResponse,
+    ) -> step_lib.Output | None: ...
+
+    async def suspend(
+        self,
+        interrupt: step_lib.ResponseInterrupt,
+    ) -> step_lib.Output: ...
+
     async def run(
         self,
         client: client_lib.Inngest,
@@ -50,6 +65,16 @@ class BaseExecutionSync(typing.Protocol):
         step_info: step_lib.StepInfo,
     ) -> ReportedStepSync: ...
 
+    def report_memoized_step(
+        self,
+        hashed_id: str,
+    ) -> step_lib.Output | None: ...
+
+    def checkpoint(
+        self,
+        response: step_lib.StepResponse,
+    ) -> step_lib.Output | None: ...
+
     def run(
         self,
         client: client_lib.Inngest,
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import time
+
+from inngest._internal import json_lib, server_lib, step_lib
+
+
+class Checkpoint:
+    """
+    Run consecutive new step.run calls in the same request instead of
+    returning to Inngest after each one. Completed steps are reported together
+    when a budget is reached, when the function reaches any other kind of step
+    (e.g. step.sleep), or when it returns. Without this, every sequential step
+    costs a full round trip to Inngest plus a replay of the function.
+
+    Parallel steps and targeted steps are never checkpointed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_duration: int | datetime.timedelta = datetime.timedelta(seconds=5),
+        max_output_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+        ----
+            max_duration: Stop running new steps once the request has run for this long. Checked after each step, so a slow step can overrun it. int value is in ms.
+            max_output_size: Stop running new steps once the JSON-encoded outputs of the completed steps reach this many bytes.
+        """
+
+        if max_output_size < 1:
+            raise ValueError("max_output_size must be at least 1")
+
+        if isinstance(max_duration, int):
+            self._max_duration = max_duration / 1000
+        else:
+            self._max_duration = max_duration.total_seconds()
+
+        self._max_output_size = max_output_size
+
+    def start(self, json_codec: json_lib.JSONCodec) -> CheckpointBuffer:
+        """
+        Start checkpointing a request.
+        """
+
+        return CheckpointBuffer(
+            deadline=time.monotonic() + self._max_duration,
+            json_codec=json_codec,
+            max_output_size=self._max_output_size,
+        )
+
+
+@dataclasses.dataclass
+class CheckpointBuffer:
+    """
+    Steps completed so far in a request.
+    """
+
+    # Monotonic time.
+    deadline: float
+
+    json_codec: json_lib.JSONCodec
+    max_output_size: int
+    responses: list[step_lib.StepResponse] = dataclasses.field(
+        default_factory=list
+    )
+    output_size: int = 0
+
+    def add(self, response: step_lib.StepResponse) -> step_lib.Output:
+        """
+        Add a completed step and return its output as it'll be memoized by
+        Inngest, so that the function sees the same value it would see when
+        replaying. Raises a ResponseInterrupt when a budget is reached.
+        """
+
+        self.responses.append(response)
+
+        try:
+            encoded = self.json_codec.dumps(response.output)
+            data = self.json_codec.loads(encoded)
+        except Exception:
+            # Stop here and let the response encoding report the error.
+            raise step_lib.ResponseInterrupt([])
+
+        self.output_size += len(encoded)
+        if (
+            self.output_size >= self.max_output_size
+            or time.monotonic() >= self.deadline
+        ):
+            raise step_lib.ResponseInterrupt([])
+
+        return step_lib.Output(data=data)
+
+    def flush(
+        self,
+        responses: list[step_lib.StepResponse],
+    ) -> list[step_lib.StepResponse]:
+        """
+        Combine the checkpointed steps with the responses that stopped the
+        function. Only completed steps (including errors) are kept since the
+        next request discovers anything else again (e.g. a new step.sleep or
+        planned parallel steps).
+        """
+
+        if len(self.responses) == 0:
+            return responses
+
+        return [
+            *self.responses,
+            *(
+                r
+                for r in responses
+                if r.step.op
+                in (
+                    server_lib.Opcode.STEP_ERROR,
+                    server_lib.Opcode.STEP_FAILED,
+                    server_lib.Opcode.STEP_RUN,
+                )
+            ),
+        ]
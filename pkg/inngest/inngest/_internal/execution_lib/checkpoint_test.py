@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+import unittest
+
+import test_core
+
+import inngest
+from inngest._internal import comm_lib, server_lib
+
+from .checkpoint import Checkpoint
+
+
+def _identity(value: object) -> object:
+    return value
+
+
+async def _identity_async(value: object) -> object:
+    return value
+
+
+class _Run:
+    """
+    Drives a function the way the Executor does, with each response's steps
+    added to the next request's memos.
+    """
+
+    def __init__(
+        self, client: inngest.Inngest, fn: inngest.Function[typing.Any]
+    ) -> None:
+        self.responses: list[comm_lib.CommResponse] = []
+        self._handler = comm_lib.CommHandler(
+            client=client,
+            framework=server_lib.Framework.FLASK,
+            functions=[fn],
+            streaming=None,
+        )
+        self._is_async = fn.is_handler_async
+        self._steps: dict[str, dict[str, object]] = {}
+
+    def request(self) -> comm_lib.CommResponse:
+        req = test_core.execution_request(self._steps)
+
+        async def post() -> comm_lib.CommResponse:
+            return await self._handler.post(req)
+
+        res: comm_lib.CommResponse
+        if self._is_async:
+            res = asyncio.run(post())
+        else:
+            res = self._handler.post_sync(req)
+        self.responses.append(res)
+
+        if res.status_code == 206:
+            assert isinstance(res.body, list)
+            for op in res.body:
+                if op["op"] in ("StepRun", "Sleep"):
+                    self._steps[op["id"]] = {"data": op.get("data")}
+        return res
+
+    def finish(self) -> object:
+        while True:
+            res = self.request()
+            if res.status_code != 206:
+                assert res.status_code == 200
+                return res.body
+
+    def ops(self, index: int) -> list[str]:
+        body = self.responses[index].body
+        assert isinstance(body, list)
+        return [op["op"] for op in body]
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_async(self) -> None:
+        client = inngest.Inngest(
+            app_id="app",
+            checkpoint=Checkpoint(),
+            is_production=False,
+        )
+        handler_starts = 0
+
+        @client.create_function(
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        async def fn(ctx: inngest.Context) -> list[object]:
+            nonlocal handler_starts
+            handler_starts += 1
+
+            outputs = []
+            for i in range(5):
+                outputs.append(await ctx.step.run(f"a-{i}", _identity_async, i))
+            await ctx.step.sleep("zzz", 1000)
+            outputs.append(await ctx.step.run("b", _identity_async, (1, 2)))
+            return outputs
+
+        run = _Run(client, fn)
+        assert run.finish() == [0, 1, 2, 3, 4, [1, 2]]
+        assert handler_starts == 4
+
+        # All steps before the sleep are reported together.
+        assert run.ops(0) == ["StepRun"] * 5
+        assert run.ops(1) == ["Sleep"]
+        assert run.ops(2) == ["StepRun"]
+
+    def test_sync(self) -> None:
+        client = inngest.Inngest(app_id="app", is_production=False)
+
+        @client.create_function(
+            checkpoint=Checkpoint(),
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> list[object]:
+            # The tuple is returned as a list, the same as when it's memoized.
+            return [ctx.step.run(f"a-{i}", _identity, (i,)) for i in range(3)]
+
+        run = _Run(client, fn)
+        assert run.finish() == [[0], [1], [2]]
+        assert len(run.responses) == 2
+        assert run.ops(0) == ["StepRun"] * 3
+
+    def test_max_output_size(self) -> None:
+        client = inngest.Inngest(app_id="app", is_production=False)
+
+        @client.create_function(
+            checkpoint=Checkpoint(max_output_size=10),
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> list[object]:
+            return [ctx.step.run(f"a-{i}", _identity, "1234") for i in range(5)]
+
+        run = _Run(client, fn)
+        assert run.finish() == ["1234"] * 5
+
+        # Each output is 6 bytes of JSON, so the budget is reached after 2.
+        assert run.ops(0) == ["StepRun"] * 2
+        assert run.ops(1) == ["StepRun"] * 2
+        assert run.ops(2) == ["StepRun"]
+
+    def test_step_error(self) -> None:
+        client = inngest.Inngest(app_id="app", is_production=False)
+
+        def fail() -> None:
+            raise Exception("oh no")
+
+        @client.create_function(
+            checkpoint=Checkpoint(),
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> None:
+            ctx.step.run("a", _identity, 1)
+            ctx.step.run("b", fail)
+
+        run = _Run(client, fn)
+        run.request()
+        assert run.ops(0) == ["StepRun", "StepError"]
+
+    def test_function_error(self) -> None:
+        client = inngest.Inngest(app_id="app", is_production=False)
+
+        @client.create_function(
+            checkpoint=Checkpoint(),
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> None:
+            ctx.step.run("a", _identity, 1)
+            raise Exception("oh no")
+
+        run = _Run(client, fn)
+
+        # The completed step is reported before the error.
+        assert run.request().status_code == 206
+        assert run.request().status_code == 500
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import datetime
+import threading
+import time
+import typing
+
+from inngest._internal import step_lib
+
+from .models import CallResult, Context
+
+if typing.TYPE_CHECKING:
+    from .v0 import ExecutionV0
+
+
+@dataclasses.dataclass
+class Continuation:
+    """
+    A handler suspended at a step boundary, waiting for the next request in its
+    run to deliver the step's memo.
+    """
+
+    ctx: Context
+    execution: ExecutionV0
+
+    # The user's handler. A continuation is only resumed for the same handler.
+    handler: object
+
+    # Memo IDs the next request must have. This is every memo the handler has
+    # consumed so far plus the step it's suspended at.
+    memo_ids: frozenset[str]
+
+    # ID of the step the handler is suspended at.
+    pending_id: str
+
+    # Resolving this resumes the handler.
+    resume: asyncio.Future[step_lib.Output]
+
+    # Runs the handler. Its result is only used when the handler returns.
+    task: asyncio.Task[CallResult]
+
+    # Monotonic time when the continuation was stored.
+    stored_at: float
+
+    def cancel(self) -> None:
+        loop = self.task.get_loop()
+        if loop.is_closed():
+            return
+
+        try:
+            loop.call_soon_threadsafe(self.task.cancel)
+        except RuntimeError:
+            # Loop closed between the check and the call.
+            pass
+
+
+class ContinuationCache:
+    """
+    Keeps suspended async handlers in memory so that the next request for the
+    same run resumes them instead of replaying the handler from the start.
+    Without this, a run with N steps does O(N^2) handler work in total.
+
+    A continuation is only resumed when the next request for its run arrives
+    on the same event loop, doesn't target a specific step, and has exactly
+    the memos the handler has seen so far plus the memo for the step it's
+    suspended at. Otherwise the request falls back to normal replay.
+
+    Only sequential steps are suspended: errors, parallel steps and sync
+    handlers always use replay.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1_000,
+        ttl: int | datetime.timedelta = datetime.timedelta(minutes=5),
+    ) -> None:
+        """
+        Args:
+        ----
+            max_size: Maximum number of suspended handlers. The least recently suspended handler is evicted first. This doesn't bound memory use since each handler holds its local variables (of any size) in memory, so lower it for handlers with large locals.
+            ttl: Evict suspended handlers that haven't been resumed within this duration. int value is in ms.
+        """
+
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        if isinstance(ttl, int):
+            self._ttl = ttl / 1000
+        else:
+            self._ttl = ttl.total_seconds()
+
+        self._max_size = max_size
+
+        # Keyed by run ID. Ordered by insertion, so the first item is the
+        # least recently suspended.
+        self._continuations: collections.OrderedDict[str, Continuation] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._continuations)
+
+    def put(self, run_id: str, continuation: Continuation) -> None:
+        evicted: list[Continuation] = []
+        with self._lock:
+            existing = self._continuations.pop(run_id, None)
+            if existing is not None and existing is not continuation:
+                evicted.append(existing)
+
+            self._continuations[run_id] = continuation
+            evicted.extend(self._evict_expired())
+            while len(self._continuations) > self._max_size:
+                _, oldest = self._continuations.popitem(last=False)
+                evicted.append(oldest)
+
+            self.evictions += len(evicted)
+
+        for c in evicted:
+            c.cancel()
+
+    def take(
+        self,
+        run_id: str,
+        handler: object,
+        memo_ids: typing.Callable[[], frozenset[str]],
+    ) -> Continuation | None:
+        """
+        Remove and return the continuation for a run if it can resume with the
+        incoming memos. A continuation that can't resume is discarded since
+        the run has moved on without it.
+
+        Args:
+        ----
+            run_id: Run ID.
+            handler: The handler the request is for.
+            memo_ids: Returns the IDs of the incoming memos. Only called if the run has a continuation.
+        """
+
+        with self._lock:
+            expired = self._evict_expired()
+            continuation = self._continuations.pop(run_id, None)
+            self.evictions += len(expired)
+
+        for c in expired:
+            c.cancel()
+
+        is_resumable = continuation is not None and (
+            continuation.handler is handler
+            and continuation.task.get_loop() is asyncio.get_running_loop()
+            and not continuation.task.done()
+            and continuation.memo_ids == memo_ids()
+        )
+
+        with self._lock:
+            if is_resumable:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if not is_resumable:
+            if continuation is not None:
+                continuation.cancel()
+            return None
+
+        return continuation
+
+    def clear(self) -> None:
+        with self._lock:
+            continuations = list(self._continuations.values())
+            self._continuations.clear()
+
+        for c in continuations:
+            c.cancel()
+
+    def _evict_expired(self) -> list[Continuation]:
+        """
+        Must be called with the lock held.
+        """
+
+        evicted: list[Continuation] = []
+        cutoff = time.monotonic() - self._ttl
+        while self._continuations:
+            oldest = next(iter(self._continuations.values()))
+            if oldest.stored_at > cutoff:
+                break
+            self._continuations.popitem(last=False)
+            evicted.append(oldest)
+        return evicted
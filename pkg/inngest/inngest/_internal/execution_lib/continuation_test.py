@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+import test_core
+
+import inngest
+from inngest._internal import comm_lib, server_lib
+
+from .continuation import ContinuationCache
+
+
+async def _identity(value: int) -> int:
+    return value
+
+
+class _Run:
+    """
+    Drives a function the way the Executor does: one request per step, with
+    each response's step added to the next request's memos.
+    """
+
+    def __init__(
+        self, cache: ContinuationCache | None, step_count: int
+    ) -> None:
+        self.handler_starts = 0
+
+        client = inngest.Inngest(
+            app_id="app",
+            continuation_cache=cache,
+            is_production=False,
+        )
+
+        @client.create_function(
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        async def fn(ctx: inngest.Context) -> list[object]:
+            self.handler_starts += 1
+            outputs: list[object] = []
+            for i in range(step_count):
+                outputs.append(await ctx.step.run(f"step-{i}", _identity, i))
+            await ctx.step.sleep("zzz", 1000)
+            return outputs
+
+        self._handler = comm_lib.CommHandler(
+            client=client,
+            framework=server_lib.Framework.FAST_API,
+            functions=[fn],
+            streaming=None,
+        )
+        self._steps: dict[str, dict[str, object]] = {}
+
+    async def request(self, run_id: str = "run") -> comm_lib.CommResponse:
+        res = await self._handler.post(
+            test_core.execution_request(self._steps, run_id=run_id)
+        )
+
+        if res.status_code == 206:
+            assert isinstance(res.body, list)
+            for op in res.body:
+                self._steps[op["id"]] = {"data": op.get("data")}
+        return res
+
+    async def finish(self, run_id: str = "run") -> object:
+        while True:
+            res = await self.request(run_id)
+            if res.status_code != 206:
+                assert res.status_code == 200
+                return res.body
+
+
+class TestContinuationCache(unittest.TestCase):
+    def test_resume(self) -> None:
+        cache = ContinuationCache()
+        run = _Run(cache, 5)
+        assert asyncio.run(run.finish()) == [0, 1, 2, 3, 4]
+        assert run.handler_starts == 1
+        assert cache.hits == 6
+        assert len(cache) == 0
+
+    def test_disabled(self) -> None:
+        run = _Run(None, 5)
+        assert asyncio.run(run.finish()) == [0, 1, 2, 3, 4]
+        assert run.handler_starts == 7
+
+    def test_memo_mismatch(self) -> None:
+        """
+        Replay when the memos aren't what the suspended handler expects (e.g.
+        the Executor retried a request).
+        """
+
+        cache = ContinuationCache()
+        run = _Run(cache, 3)
+
+        async def test() -> object:
+            await run.request()
+            await run.request()
+
+            # Forget the latest memo.
+            run._steps.popitem()
+            return await run.finish()
+
+        assert asyncio.run(test()) == [0, 1, 2]
+        assert run.handler_starts == 2
+        assert cache.misses == 2
+
+    def test_eviction(self) -> None:
+        cache = ContinuationCache(max_size=1)
+        run_a = _Run(cache, 3)
+        run_b = _Run(cache, 3)
+
+        async def test() -> tuple[object, object]:
+            # Interleave 2 runs so that each evicts the other.
+            while True:
+                res_a = await run_a.request("a")
+                res_b = await run_b.request("b")
+                if res_a.status_code == 200 and res_b.status_code == 200:
+                    return res_a.body, res_b.body
+
+        assert asyncio.run(test()) == ([0, 1, 2], [0, 1, 2])
+        assert run_a.handler_starts == 5
+
+        # The last run to suspend wasn't evicted.
+        assert run_b.handler_starts == 4
+        assert cache.hits == 1
+        assert cache.evictions == 7
+
+    def test_ttl(self) -> None:
+        cache = ContinuationCache(ttl=0)
+        run = _Run(cache, 3)
+        assert asyncio.run(run.finish()) == [0, 1, 2]
+        assert run.handler_starts == 5
+        assert cache.hits == 0
@@ -13,8 +13,8 @@ class CallResult:
     error: Exception | None = None
 
     # Multiple results from a single call (only used for steps). This will only
-    # be longer than 1 for parallel steps. Otherwise, it will be 1 long for
-    # sequential steps
+    # be longer than 1 for parallel or checkpointed steps. Otherwise, it will be
+    # 1 long for sequential steps
     multi: list[CallResult] | None = None
 
     # Need a sentinel value to differentiate between None and unset
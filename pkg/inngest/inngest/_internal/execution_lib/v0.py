@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import time
 import typing
 
 from inngest._internal import errors, server_lib, step_lib, transforms, types
 from inngest._internal.execution_lib import BaseExecution, BaseExecutionSync
 
+from .checkpoint import CheckpointBuffer
+from .continuation import Continuation, ContinuationCache
 from .models import (
     CallResult,
     Context,
@@ -15,6 +19,7 @@ from .models import (
     ReportedStep,
     ReportedStepSync,
     UserError,
+    _in_step,
 )
 
 if typing.TYPE_CHECKING:
@@ -38,6 +43,21 @@ class ExecutionV0(BaseExecution):
         self._target_hashed_id = target_hashed_id
         self._timings = timings
 
+        # Only set when checkpointing is enabled for this request.
+        self._checkpoint: CheckpointBuffer | None = None
+
+        # Only set when the handler runs in a task that can be suspended (see
+        # ContinuationCache). The handler resolves it when it suspends.
+        self._suspend_signal: (
+            asyncio.Future[
+                tuple[
+                    step_lib.ResponseInterrupt,
+                    asyncio.Future[step_lib.Output],
+                ]
+            ]
+            | None
+        ) = None
+
     def _handle_skip(
         self,
         step_info: step_lib.StepInfo,
@@ -53,6 +73,30 @@ class ExecutionV0(BaseExecution):
             # Skip this step because a different step is targeted.
             raise step_lib.SkipInterrupt(step_info.display_name)
 
+    async def report_memoized_step(
+        self,
+        hashed_id: str,
+    ) -> step_lib.Output | None:
+        """
+        Fast path for a memoized step: pop and return its memo without the
+        bookkeeping in report_step. Returns None if the step isn't memoized or
+        is nested in another step, in which case the caller must use
+        report_step.
+        """
+
+        if _in_step.get():
+            return None
+
+        memo = self._memos.pop(hashed_id)
+        if isinstance(memo, types.EmptySentinel):
+            return None
+
+        # If there are no more memos then all future code is new.
+        if self._memos.size == 0:
+            await self._middleware.before_execution()
+
+        return memo
+
     async def report_step(
         self,
         step_info: step_lib.StepInfo,
@@ -69,15 +113,7 @@ class ExecutionV0(BaseExecution):
             await self._middleware.before_execution()
 
         if not isinstance(memo, types.EmptySentinel):
-            if memo.error is not None:
-                step.error = errors.StepError(
-                    message=memo.error.message,
-                    name=memo.error.name,
-                    stack=memo.error.stack,
-                )
-            elif not isinstance(memo.data, types.EmptySentinel):
-                step.output = memo.data
-
+            _apply_memo(step, memo)
             return step
 
         self._handle_skip(step_info)
@@ -85,6 +121,10 @@ class ExecutionV0(BaseExecution):
         is_targeting_enabled = self._target_hashed_id is not None
         if step_lib.in_parallel.get() and not is_targeting_enabled:
             if step_info.op == server_lib.Opcode.STEP_RUN:
+                if step_lib.run_concurrently.get():
+                    # Run this step now, alongside the group's other steps.
+                    return step
+
                 step_info.op = server_lib.Opcode.PLANNED
 
             # Plan this step because we're in parallel mode.
@@ -109,7 +149,53 @@ class ExecutionV0(BaseExecution):
         if step_info.op == server_lib.Opcode.STEP_RUN:
             return step
 
-        raise step_lib.ResponseInterrupt(step_lib.StepResponse(step=step_info))
+        memo = await self.suspend(
+            step_lib.ResponseInterrupt(step_lib.StepResponse(step=step_info))
+        )
+        _apply_memo(step, memo)
+        return step
+
+    def checkpoint(
+        self,
+        response: step_lib.StepResponse,
+    ) -> step_lib.Output | None:
+        """
+        Checkpoint a completed step.run and return its output, unless
+        checkpointing is disabled. Raises a ResponseInterrupt when a budget is
+        reached.
+        """
+
+        if self._checkpoint is None or step_lib.in_parallel.get():
+            return None
+        return self._checkpoint.add(response)
+
+    async def suspend(
+        self,
+        interrupt: step_lib.ResponseInterrupt,
+    ) -> step_lib.Output:
+        """
+        Report a step to the Inngest server by raising the interrupt. If the
+        handler can be suspended, it instead waits for the next request in the
+        run and returns the step's memo from that request.
+        """
+
+        signal = self._suspend_signal
+        if (
+            signal is None
+            or signal.done()
+            or (
+                self._checkpoint is not None
+                and len(self._checkpoint.responses) > 0
+            )
+            or len(interrupt.responses) != 1
+            or self._target_hashed_id is not None
+            or step_lib.in_parallel.get()
+        ):
+            raise interrupt
+
+        resume = asyncio.Future[step_lib.Output]()
+        signal.set_result((interrupt, resume))
+        return await resume
 
     async def run(
         self,
@@ -119,6 +205,18 @@ class ExecutionV0(BaseExecution):
         fn: function.Function[types.T],
         output_type: object = types.EmptySentinel,
     ) -> CallResult:
+        self._checkpoint = _start_checkpoint(client, fn, self._target_hashed_id)
+
+        cache = client._continuation_cache
+        if cache is not None and self._target_hashed_id is None:
+            continuation = cache.take(
+                self._request.ctx.run_id,
+                handler,
+                self._memos.ids,
+            )
+            if continuation is not None:
+                return await self._resume(cache, continuation, fn)
+
         # Give middleware the opportunity to change some of params passed to the
         # user's handler.
         middleware_err = await self._middleware.transform_input(
@@ -135,10 +233,138 @@ class ExecutionV0(BaseExecution):
             if isinstance(err, Exception):
                 return CallResult(err)
 
+        if cache is None or self._target_hashed_id is not None:
+            with self._timings.function:
+                return await self._run_handler(
+                    client, ctx, handler, output_type
+                )
+
+        # Run the handler in a task so that it can suspend at a step boundary
+        # and be resumed by a later request.
+        memo_ids = self._memos.ids()
+        self._suspend_signal = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(
+            self._run_handler(client, ctx, handler, output_type)
+        )
+        return await self._wait_for_handler(
+            cache,
+            Continuation(
+                ctx=ctx,
+                execution=self,
+                handler=handler,
+                memo_ids=memo_ids,
+                pending_id="",
+                resume=asyncio.get_running_loop().create_future(),
+                task=task,
+                stored_at=0,
+            ),
+        )
+
+    async def _resume(
+        self,
+        cache: ContinuationCache,
+        continuation: Continuation,
+        fn: function.Function[typing.Any],
+    ) -> CallResult:
+        """
+        Resume a suspended handler with this request's state.
+        """
+
+        ctx = continuation.ctx
+        middleware_err = await self._middleware.transform_input(
+            ctx,
+            fn,
+            self._memos,
+        )
+        if isinstance(middleware_err, Exception):
+            continuation.cancel()
+            return CallResult(middleware_err)
+
+        memo = self._memos.pop(continuation.pending_id)
+        if isinstance(memo, types.EmptySentinel):
+            # Unreachable since the cache checked the memo IDs.
+            continuation.cancel()
+            return CallResult(errors.UnreachableError("missing pending memo"))
+
+        # The suspended handler keeps using its original execution and step
+        # objects, so point them at this request. It already consumed every
+        # other memo.
+        exe = continuation.execution
+        exe._memos = step_lib.StepMemos({})
+        exe._middleware = self._middleware
+        exe._checkpoint = self._checkpoint
+        exe._request = self._request
+        exe._timings = self._timings
+        exe._suspend_signal = asyncio.get_running_loop().create_future()
+        ctx.attempt = self._request.ctx.attempt
+        ctx.step._middleware = self._middleware
+
+        err = await self._middleware.before_execution()
+        if isinstance(err, Exception):
+            continuation.cancel()
+            return CallResult(err)
+
+        continuation.resume.set_result(memo)
+        return await exe._wait_for_handler(cache, continuation)
+
+    async def _wait_for_handler(
+        self,
+        cache: ContinuationCache,
+        continuation: Continuation,
+    ) -> CallResult:
+        """
+        Wait for the handler task to either finish or suspend. A suspended
+        handler is stored in the cache.
+        """
+
+        signal = self._suspend_signal
+        if signal is None:
+            raise errors.UnreachableError("missing suspend signal")
+
+        task = continuation.task
+        with self._timings.function:
+            try:
+                await asyncio.wait(
+                    (task, signal),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+
+        if not signal.done():
+            self._suspend_signal = None
+            return task.result()
+
+        interrupt, resume = signal.result()
+        pending_id = interrupt.responses[0].step.id
+        cache.put(
+            self._request.ctx.run_id,
+            dataclasses.replace(
+                continuation,
+                memo_ids=continuation.memo_ids | {pending_id},
+                pending_id=pending_id,
+                resume=resume,
+                stored_at=time.monotonic(),
+            ),
+        )
+
+        err = await self._middleware.after_execution()
+        if isinstance(err, Exception):
+            return CallResult(err)
+
+        return CallResult.from_responses(interrupt.responses)
+
+    async def _run_handler(
+        self,
+        client: client_lib.Inngest,
+        ctx: Context,
+        handler: FunctionHandlerAsync[types.T],
+        output_type: object,
+    ) -> CallResult:
         try:
             try:
-                with self._timings.function:
-                    output: object = await handler(ctx)
+                output: object = await handler(ctx)
                 output = client._serialize(output, output_type)
             except Exception as user_err:
                 transforms.remove_first_traceback_frame(user_err)
@@ -148,15 +374,18 @@ class ExecutionV0(BaseExecution):
             if isinstance(err, Exception):
                 return CallResult(err)
 
-            return CallResult(output=output)
+            return _checkpointed(self._checkpoint) or CallResult(output=output)
         except step_lib.ResponseInterrupt as interrupt:
             err = await self._middleware.after_execution()
             if isinstance(err, Exception):
                 return CallResult(err)
 
-            return CallResult.from_responses(interrupt.responses)
+            responses = interrupt.responses
+            if self._checkpoint is not None:
+                responses = self._checkpoint.flush(responses)
+            return CallResult.from_responses(responses)
         except UserError as err:
-            return CallResult(err.err)
+            return _checkpointed(self._checkpoint) or CallResult(err.err)
         except step_lib.SkipInterrupt as err:
             # This should only happen in a non-deterministic scenario, where
             # step targeting is enabled and an unexpected step is encountered.
@@ -171,6 +400,45 @@ class ExecutionV0(BaseExecution):
             return CallResult(err)
 
 
+def _start_checkpoint(
+    client: client_lib.Inngest,
+    fn: function.Function[typing.Any],
+    target_hashed_id: str | None,
+) -> CheckpointBuffer | None:
+    # Targeted requests run exactly 1 step.
+    if target_hashed_id is not None:
+        return None
+
+    checkpoint = fn._opts.checkpoint or client._checkpoint
+    if checkpoint is None:
+        return None
+    return checkpoint.start(client.json_codec)
+
+
+def _checkpointed(checkpoint: CheckpointBuffer | None) -> CallResult | None:
+    """
+    Report checkpointed steps before the function's result. The next request
+    replays the function to the same result.
+    """
+
+    if checkpoint is None or len(checkpoint.responses) == 0:
+        return None
+    return CallResult.from_responses(checkpoint.responses)
+
+
+def _apply_memo(
+    step: ReportedStep | ReportedStepSync, memo: step_lib.Output
+) -> None:
+    if memo.error is not None:
+        step.error = errors.StepError(
+            message=memo.error.message,
+            name=memo.error.name,
+            stack=memo.error.stack,
+        )
+    elif not isinstance(memo.data, types.EmptySentinel):
+        step.output = memo.data
+
+
 class ExecutionV0Sync(BaseExecutionSync):
     version = "0"
 
@@ -188,6 +456,9 @@ class ExecutionV0Sync(BaseExecutionSync):
         self._target_hashed_id = target_hashed_id
         self._timings = timings
 
+        # Only set when checkpointing is enabled for this request.
+        self._checkpoint: CheckpointBuffer | None = None
+
     def _handle_skip(
         self,
         step_info: step_lib.StepInfo,
@@ -203,6 +474,30 @@ class ExecutionV0Sync(BaseExecutionSync):
             # Skip this step because a different step is targeted.
             raise step_lib.SkipInterrupt(step_info.display_name)
 
+    def report_memoized_step(
+        self,
+        hashed_id: str,
+    ) -> step_lib.Output | None:
+        """
+        Fast path for a memoized step: pop and return its memo without the
+        bookkeeping in report_step. Returns None if the step isn't memoized or
+        is nested in another step, in which case the caller must use
+        report_step.
+        """
+
+        if _in_step.get():
+            return None
+
+        memo = self._memos.pop(hashed_id)
+        if isinstance(memo, types.EmptySentinel):
+            return None
+
+        # If there are no more memos then all future code is new.
+        if self._memos.size == 0:
+            self._middleware.before_execution_sync()
+
+        return memo
+
     def report_step(
         self,
         step_info: step_lib.StepInfo,
@@ -216,15 +511,7 @@ class ExecutionV0Sync(BaseExecutionSync):
             self._middleware.before_execution_sync()
 
         if not isinstance(memo, types.EmptySentinel):
-            if memo.error is not None:
-                step.error = errors.StepError(
-                    message=memo.error.message,
-                    name=memo.error.name,
-                    stack=memo.error.stack,
-                )
-            elif not isinstance(memo.data, types.EmptySentinel):
-                step.output = memo.data
-
+            _apply_memo(step, memo)
             return step
 
         self._handle_skip(step_info)
@@ -232,6 +519,10 @@ class ExecutionV0Sync(BaseExecutionSync):
         is_targeting_enabled = self._target_hashed_id is not None
         if step_lib.in_parallel.get() and not is_targeting_enabled:
             if step_info.op == server_lib.Opcode.STEP_RUN:
+                if step_lib.run_concurrently.get():
+                    # Run this step now, alongside the group's other steps.
+                    return step
+
                 step_info.op = server_lib.Opcode.PLANNED
 
             # Plan this step because we're in parallel mode.
@@ -258,6 +549,20 @@ class ExecutionV0Sync(BaseExecutionSync):
 
         raise step_lib.ResponseInterrupt(step_lib.StepResponse(step=step_info))
 
+    def checkpoint(
+        self,
+        response: step_lib.StepResponse,
+    ) -> step_lib.Output | None:
+        """
+        Checkpoint a completed step.run and return its output, unless
+        checkpointing is disabled. Raises a ResponseInterrupt when a budget is
+        reached.
+        """
+
+        if self._checkpoint is None or step_lib.in_parallel.get():
+            return None
+        return self._checkpoint.add(response)
+
     def run(
         self,
         client: client_lib.Inngest,
@@ -266,6 +571,8 @@ class ExecutionV0Sync(BaseExecutionSync):
         fn: function.Function[types.T],
         output_type: object = types.EmptySentinel,
     ) -> CallResult:
+        self._checkpoint = _start_checkpoint(client, fn, self._target_hashed_id)
+
         # Give middleware the opportunity to change some of params passed to the
         # user's handler.
         middleware_err = self._middleware.transform_input_sync(
@@ -293,15 +600,18 @@ class ExecutionV0Sync(BaseExecutionSync):
             if isinstance(err, Exception):
                 return CallResult(err)
 
-            return CallResult(output=output)
+            return _checkpointed(self._checkpoint) or CallResult(output=output)
         except step_lib.ResponseInterrupt as interrupt:
             err = self._middleware.after_execution_sync()
             if isinstance(err, Exception):
                 return CallResult(err)
 
-            return CallResult.from_responses(interrupt.responses)
+            responses = interrupt.responses
+            if self._checkpoint is not None:
+                responses = self._checkpoint.flush(responses)
+            return CallResult.from_responses(responses)
         except UserError as err:
-            return CallResult(err.err)
+            return _checkpointed(self._checkpoint) or CallResult(err.err)
         except step_lib.SkipInterrupt as err:
             # This should only happen in a non-deterministic scenario, where
             # step targeting is enabled and an unexpected step is encountered.
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import unittest
+
+import test_core
+
+import inngest
+from inngest._internal import comm_lib, server_lib, transforms
+
+
+class TestMemoizedSteps(unittest.TestCase):
+    def test_replay(self) -> None:
+        client = inngest.Inngest(app_id="app", is_production=False)
+        step_runs = 0
+
+        def run() -> None:
+            nonlocal step_runs
+            step_runs += 1
+
+        @client.create_function(
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> list[object]:
+            outputs: list[object] = [ctx.step.run("a", run)]
+            try:
+                ctx.step.run("b", run)
+            except inngest.StepError as err:
+                outputs.append(err.message)
+            ctx.step.sleep("c", 1000)
+            outputs.append(
+                ctx.step.wait_for_event("d", event="app/other", timeout=1000)
+            )
+            outputs.append(
+                ctx.step.invoke_by_id("e", function_id="other"),
+            )
+            return outputs
+
+        handler = comm_lib.CommHandler(
+            client=client,
+            framework=server_lib.Framework.FLASK,
+            functions=[fn],
+            streaming=None,
+        )
+        res = handler.post_sync(
+            test_core.execution_request(
+                {
+                    transforms.hash_step_id("a"): {"data": 1},
+                    transforms.hash_step_id("b"): {
+                        "error": {"message": "oh no", "name": "Error"}
+                    },
+                    transforms.hash_step_id("c"): None,
+                    transforms.hash_step_id("d"): None,
+                    transforms.hash_step_id("e"): {"data": "invoked"},
+                }
+            )
+        )
+
+        assert res.status_code == 200
+        assert res.body == [1, "oh no", None, "invoked"]
+        assert step_runs == 0
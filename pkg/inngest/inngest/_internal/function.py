@@ -9,6 +9,7 @@ import pydantic
 
 from inngest._internal import (
     client_lib,
+    compression_lib,
     errors,
     execution_lib,
     middleware_lib,
@@ -31,6 +32,8 @@ class FunctionOpts(types.BaseModel):
 
     batch_events: server_lib.Batch | None
     cancel: list[server_lib.Cancel] | None
+    checkpoint: execution_lib.Checkpoint | None
+    compression: compression_lib.Compression | None
     concurrency: list[server_lib.Concurrency] | None
     debounce: server_lib.Debounce | None
 
@@ -137,34 +140,19 @@ class Function(typing.Generic[types.T]):
 
             self._on_failure_fn_id = f"{opts.fully_qualified_id}-failure"
 
-    async def call(
+    async def call_handler(
         self,
         client: client_lib.Inngest,
         ctx: execution_lib.Context,
-        fn_id: str,
+        handler: execution_lib.FunctionHandlerAsync[typing.Any]
+        | execution_lib.FunctionHandlerSync[typing.Any],
+        output_type: object,
         middleware: middleware_lib.MiddlewareManager,
     ) -> execution_lib.CallResult:
-        for m in self._middleware:
-            middleware.add(m)
-
-        if self.id == fn_id:
-            handler = self._handler
-            output_type = self._output_type
-        elif self.on_failure_fn_id == fn_id:
-            if self._opts.on_failure is None:
-                return execution_lib.CallResult(
-                    errors.FunctionNotFoundError("on_failure not defined")
-                )
-            handler = self._opts.on_failure
-
-            # We only need to serialize to JSON so any type is fine.
-            # Deserialization isn't necessary since on_failure handlers aren't
-            # invoked via `step.invoke`.
-            output_type = object
-        else:
-            return execution_lib.CallResult(
-                errors.FunctionNotFoundError("function ID mismatch")
-            )
+        """
+        Call an already-resolved handler. The caller is responsible for adding
+        function-level middleware.
+        """
 
         if not execution_lib.is_function_handler_async(handler):
             raise errors.UnreachableError("handler is not async")
@@ -178,7 +166,10 @@ class Function(typing.Generic[types.T]):
                 output_type,
             )
 
-        err = await middleware.transform_output(call_res)
+        err = await middleware.transform_output(
+            call_res,
+            self._opts.compression or client._compression,
+        )
         if isinstance(err, Exception):
             return execution_lib.CallResult(err)
 
@@ -188,34 +179,19 @@ class Function(typing.Generic[types.T]):
 
         return call_res
 
-    def call_sync(
+    def call_handler_sync(
         self,
         client: client_lib.Inngest,
         ctx: execution_lib.ContextSync,
-        fn_id: str,
+        handler: execution_lib.FunctionHandlerAsync[typing.Any]
+        | execution_lib.FunctionHandlerSync[typing.Any],
+        output_type: object,
         middleware: middleware_lib.MiddlewareManager,
     ) -> execution_lib.CallResult:
-        for m in self._middleware:
-            middleware.add(m)
-
-        if self.id == fn_id:
-            handler = self._handler
-            output_type = self._output_type
-        elif self.on_failure_fn_id == fn_id:
-            if self._opts.on_failure is None:
-                return execution_lib.CallResult(
-                    errors.FunctionNotFoundError("on_failure not defined")
-                )
-            handler = self._opts.on_failure
-
-            # We only need to serialize to JSON so any type is fine.
-            # Deserialization isn't necessary since on_failure handlers aren't
-            # invoked via `step.invoke`.
-            output_type = object
-        else:
-            return execution_lib.CallResult(
-                errors.FunctionNotFoundError("function ID mismatch")
-            )
+        """
+        Call an already-resolved handler. The caller is responsible for adding
+        function-level middleware.
+        """
 
         if not execution_lib.is_function_handler_sync(handler):
             raise errors.UnreachableError("handler is not sync")
@@ -231,7 +207,10 @@ class Function(typing.Generic[types.T]):
                 output_type,
             )
 
-        err = middleware.transform_output_sync(call_res)
+        err = middleware.transform_output_sync(
+            call_res,
+            self._opts.compression or client._compression,
+        )
         if isinstance(err, Exception):
             return execution_lib.CallResult(err)
 
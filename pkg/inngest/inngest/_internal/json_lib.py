@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import functools
+import json
+import typing
+
+try:
+    import orjson
+
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+
+class JSONCodec(typing.Protocol):
+    def dumps(self, obj: object) -> bytes:
+        """
+        Encode a Python object (dict, list, None, etc.) as UTF-8 JSON. Raises
+        on unserializable input.
+        """
+        ...
+
+    def loads(self, value: str | bytes) -> object:
+        """
+        Decode JSON into a Python object (dict, list, None, etc.). Raises on
+        invalid input.
+        """
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    Uses the standard library's json module.
+    """
+
+    def dumps(self, obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, value: str | bytes) -> object:
+        return json.loads(value)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """
+    Uses orjson, which is several times faster than the standard library for
+    large payloads. Requires the orjson package (`pip install inngest[orjson]`).
+
+    Falls back to the standard library for values that orjson can't encode
+    the same way:
+    - Integers outside the 64-bit range.
+    - Dicts with non-str keys.
+    - Strings with lone surrogates.
+    - Dataclasses, dates and times, and subclasses of str, int, dict and
+      list.
+
+    Also falls back for JSON with a run of 20 or more digits, since orjson
+    decodes integers outside the 64-bit range as floats.
+
+    Differs from the standard library in 2 ways:
+    - NaN and infinity are encoded as null instead of NaN and Infinity.
+    - Enums and UUIDs are encoded as their values. The standard library
+      raises a TypeError for them.
+    """
+
+    def __init__(self) -> None:
+        if not _has_orjson:
+            raise ImportError(
+                "orjson is not installed. Install it with `pip install inngest[orjson]`"
+            )
+
+        self._stdlib = StdlibJSONCodec()
+
+    def dumps(self, obj: object) -> bytes:
+        try:
+            # The passthrough options send these types to _reject instead of
+            # encoding them natively.
+            return orjson.dumps(
+                obj,
+                default=_reject,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except orjson.JSONEncodeError:
+            return self._stdlib.dumps(obj)
+
+    def loads(self, value: str | bytes) -> object:
+        if _has_long_number(value):
+            return self._stdlib.loads(value)
+
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # E.g. NaN, which the standard library accepts.
+            return self._stdlib.loads(value)
+
+
+def _reject(obj: object) -> typing.NoReturn:
+    """
+    Default hook for orjson. Makes orjson raise, so that the standard library
+    encodes the object instead.
+    """
+
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Maps digits to "0" and everything else to a space.
+_digits_table = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+
+# Integers with at least this many digits may not fit in 64 bits.
+_long_digits = b"0" * 20
+
+
+def _has_long_number(value: str | bytes) -> bool:
+    """
+    Returns True if the JSON has a run of digits that could be an integer
+    outside the 64-bit range. Also matches some floats and strings, which are
+    then decoded by the slower (but exact) standard library.
+    """
+
+    if isinstance(value, str):
+        value = value.encode("utf-8", "surrogatepass")
+    return _long_digits in value.translate(_digits_table)
+
+
+@functools.cache
+def default_codec() -> JSONCodec:
+    """
+    Returns the standard library codec. orjson is opt-in through the client's
+    json_codec argument. Codecs are stateless so the same instance is shared.
+    """
+
+    return StdlibJSONCodec()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import unittest
+import uuid
+
+from . import json_lib
+
+
+@dataclasses.dataclass
+class _Foo:
+    a: int
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Size(enum.IntEnum):
+    SMALL = 1
+
+
+def _codecs() -> list[json_lib.JSONCodec]:
+    codecs: list[json_lib.JSONCodec] = [json_lib.StdlibJSONCodec()]
+    if json_lib._has_orjson:
+        codecs.append(json_lib.OrjsonJSONCodec())
+    return codecs
+
+
+class TestCodecs(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        value = {
+            "bool": True,
+            "float": 1.5,
+            "int": 1,
+            "list": [1, "a", None],
+            "nested": {"a": {"b": []}},
+            "str": "héllo",
+        }
+        for codec in _codecs():
+            with self.subTest(codec=type(codec).__name__):
+                dumped = codec.dumps(value)
+                assert isinstance(dumped, bytes)
+                assert codec.loads(dumped) == value
+                assert codec.loads(dumped.decode("utf-8")) == value
+
+    def test_interchangeable(self) -> None:
+        """
+        Each backend can decode what the others encode.
+        """
+
+        value = {"a": [1, 2.5, "b", None, True], "c": {"d": "é", "e": "\ud800"}}
+        for encoder in _codecs():
+            for decoder in _codecs():
+                assert decoder.loads(encoder.dumps(value)) == value
+
+    def test_stdlib_separators(self) -> None:
+        # Same output as json.dumps with its default separators.
+        codec = json_lib.StdlibJSONCodec()
+        assert codec.dumps({"a": [1, 2]}) == b'{"a": [1, 2]}'
+
+    def test_wide_int(self) -> None:
+        for codec in _codecs():
+            with self.subTest(codec=type(codec).__name__):
+                assert codec.dumps(2**70) == str(2**70).encode("utf-8")
+
+    def test_non_str_keys(self) -> None:
+        for codec in _codecs():
+            with self.subTest(codec=type(codec).__name__):
+                assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_unserializable(self) -> None:
+        for codec in _codecs():
+            with self.subTest(codec=type(codec).__name__):
+                for value in [
+                    object(),
+                    datetime.datetime.now(),
+                    _Foo(a=1),
+                ]:
+                    with self.assertRaises(TypeError):
+                        codec.dumps(value)
+
+    def test_invalid(self) -> None:
+        for codec in _codecs():
+            with self.subTest(codec=type(codec).__name__):
+                with self.assertRaises(ValueError):
+                    codec.loads(b"{")
+
+
+@unittest.skipIf(not json_lib._has_orjson, "orjson is not installed")
+class TestOrjsonMatchesStdlib(unittest.TestCase):
+    def test_dumps(self) -> None:
+        stdlib = json_lib.StdlibJSONCodec()
+        orjson_codec = json_lib.OrjsonJSONCodec()
+        for value in [
+            {"a": [1, 2.5, "b", None, True], "c": {"d": "é"}},
+            (1, 2),
+            1e16,
+            2**64,
+            -(2**63) - 1,
+            {"a": 123456789012345678901234567890},
+            {1: "a", None: "b"},
+            _Size.SMALL,
+            {"a": datetime.date(2020, 1, 1)},
+        ]:
+            with self.subTest(value=value):
+                try:
+                    expected = stdlib.dumps(value)
+                except TypeError:
+                    with self.assertRaises(TypeError):
+                        orjson_codec.dumps(value)
+                    continue
+
+                actual = orjson_codec.dumps(value)
+                assert repr(stdlib.loads(actual)) == repr(
+                    stdlib.loads(expected)
+                )
+
+    def test_dumps_differences(self) -> None:
+        orjson_codec = json_lib.OrjsonJSONCodec()
+
+        # orjson has no hook for these, so they're documented differences.
+        assert (
+            orjson_codec.dumps([float("nan"), float("inf")]) == b"[null,null]"
+        )
+        assert orjson_codec.dumps(_Color.RED) == b'"red"'
+        assert (
+            orjson_codec.dumps(uuid.UUID(int=1))
+            == b'"00000000-0000-0000-0000-000000000001"'
+        )
+
+    def test_loads(self) -> None:
+        stdlib = json_lib.StdlibJSONCodec()
+        orjson_codec = json_lib.OrjsonJSONCodec()
+        for value in [
+            b'{"a": [1, 2.5, "b", null, true]}',
+            b'{"a": 123456789012345678901234567890}',
+            b"-123456789012345678901234567890",
+            b'{"a": 18446744073709551615}',
+            b'{"a": "12345678901234567890123"}',
+            b"0.1234567890123456789012345",
+            b"[NaN, Infinity]",
+            b"1e400",
+        ]:
+            with self.subTest(value=value):
+                expected = stdlib.loads(value)
+                actual = orjson_codec.loads(value)
+                assert repr(actual) == repr(expected)
+                assert repr(orjson_codec.loads(value.decode("utf-8"))) == repr(
+                    expected
+                )
@@ -4,6 +4,7 @@ import inspect
 import typing
 
 from inngest._internal import (
+    compression_lib,
     errors,
     execution_lib,
     function,
@@ -230,7 +231,8 @@ class MiddlewareManager:
             except Exception as err:
                 return err
 
-            return None
+        # After middleware since it may have decrypted compressed outputs.
+        return self._decompress_steps(steps)
 
     def transform_input_sync(
         self,
@@ -247,92 +249,179 @@ class MiddlewareManager:
             except Exception as err:
                 return err
 
+        # After middleware since it may have decrypted compressed outputs.
+        return self._decompress_steps(steps)
+
+    def _decompress_steps(
+        self,
+        steps: step_lib.StepMemos,
+    ) -> types.MaybeError[None]:
+        hashed_ids = steps.find(compression_lib.is_compressed)
+        if len(hashed_ids) == 0:
             return None
 
+        json_codec = self.client.json_codec
+        with self._timings.decompress:
+            try:
+                for hashed_id in hashed_ids:
+                    steps.update_data(
+                        hashed_id,
+                        lambda data: compression_lib.decompress(
+                            data, json_codec
+                        ),
+                    )
+            except Exception as err:
+                return err
+
+        return None
+
     async def transform_output(
         self,
         call_res: execution_lib.CallResult,
+        compression: compression_lib.Compression | None = None,
     ) -> types.MaybeError[None]:
+        # Before middleware so that outputs are compressed before they're
+        # encrypted.
+        if compression is not None:
+            self._compress_output(call_res, compression)
+
         with self._timings.mw_transform_output:
-            # This should only happen when planning parallel steps
-            if call_res.multi is not None:
-                if len(call_res.multi) > 1:
-                    return None
-                call_res = call_res.multi[0]
-
-            # Not sure how this can happen, but we should handle it
-            if call_res.is_empty:
-                return None
-
-            # Create a new result object to pass to the middleware. We don't want to
-            # pass the CallResult object because it exposes too many internal
-            # implementation details
-            result = TransformOutputResult(
-                error=call_res.error,
-                output=call_res.output,
-                step=None,
+            for res in _transformable_results(call_res):
+                err = await self._transform_output(res)
+                if err is not None:
+                    return err
+            return None
+
+    async def _transform_output(
+        self,
+        call_res: execution_lib.CallResult,
+    ) -> types.MaybeError[None]:
+        # Not sure how this can happen, but we should handle it
+        if call_res.is_empty:
+            return None
+
+        # Create a new result object to pass to the middleware. We don't want to
+        # pass the CallResult object because it exposes too many internal
+        # implementation details
+        result = TransformOutputResult(
+            error=call_res.error,
+            output=call_res.output,
+            step=None,
+        )
+        if call_res.step is not None:
+            result.step = TransformOutputStepInfo(
+                id=call_res.step.display_name,
+                op=call_res.step.op,
+                opts=call_res.step.opts,
             )
-            if call_res.step is not None:
-                result.step = TransformOutputStepInfo(
-                    id=call_res.step.display_name,
-                    op=call_res.step.op,
-                    opts=call_res.step.opts,
-                )
 
-            try:
-                # Reverse order because this is an "after" hook.
-                for m in reversed(self._middleware):
-                    await transforms.maybe_await(m.transform_output(result))
+        try:
+            # Reverse order because this is an "after" hook.
+            for m in reversed(self._middleware):
+                await transforms.maybe_await(m.transform_output(result))
 
-                # Update the original call result with the (possibly) mutated fields
-                call_res.error = result.error
-                call_res.output = result.output
+            # Update the original call result with the (possibly) mutated fields
+            call_res.error = result.error
+            call_res.output = result.output
 
-                return None
-            except Exception as err:
-                return err
+            return None
+        except Exception as err:
+            return err
 
     def transform_output_sync(
         self,
         call_res: execution_lib.CallResult,
+        compression: compression_lib.Compression | None = None,
     ) -> types.MaybeError[None]:
+        # Before middleware so that outputs are compressed before they're
+        # encrypted.
+        if compression is not None:
+            self._compress_output(call_res, compression)
+
         with self._timings.mw_transform_output:
-            # This should only happen when planning parallel steps
-            if call_res.multi is not None:
-                if len(call_res.multi) > 1:
-                    return None
-                call_res = call_res.multi[0]
-
-            # Not sure how this can happen, but we should handle it
-            if call_res.is_empty:
-                return None
-
-            # Create a new result object to pass to the middleware. We don't want to
-            # pass the CallResult object because it exposes too many internal
-            # implementation details
-            result = TransformOutputResult(
-                error=call_res.error,
-                output=call_res.output,
-                step=None,
+            for res in _transformable_results(call_res):
+                err = self._transform_output_sync(res)
+                if err is not None:
+                    return err
+            return None
+
+    def _transform_output_sync(
+        self,
+        call_res: execution_lib.CallResult,
+    ) -> types.MaybeError[None]:
+        # Not sure how this can happen, but we should handle it
+        if call_res.is_empty:
+            return None
+
+        # Create a new result object to pass to the middleware. We don't want to
+        # pass the CallResult object because it exposes too many internal
+        # implementation details
+        result = TransformOutputResult(
+            error=call_res.error,
+            output=call_res.output,
+            step=None,
+        )
+        if call_res.step is not None:
+            result.step = TransformOutputStepInfo(
+                id=call_res.step.display_name,
+                op=call_res.step.op,
+                opts=call_res.step.opts,
             )
-            if call_res.step is not None:
-                result.step = TransformOutputStepInfo(
-                    id=call_res.step.display_name,
-                    op=call_res.step.op,
-                    opts=call_res.step.opts,
-                )
 
-            try:
-                # Reverse order because this is an "after" hook.
-                for m in reversed(self._middleware):
-                    if isinstance(m, Middleware):
-                        return _mismatched_sync
-                    m.transform_output(result)
+        try:
+            # Reverse order because this is an "after" hook.
+            for m in reversed(self._middleware):
+                if isinstance(m, Middleware):
+                    return _mismatched_sync
+                m.transform_output(result)
 
-                # Update the original call result with the (possibly) mutated fields
-                call_res.error = result.error
-                call_res.output = result.output
+            # Update the original call result with the (possibly) mutated fields
+            call_res.error = result.error
+            call_res.output = result.output
 
-                return None
-            except Exception as err:
-                return err
+            return None
+        except Exception as err:
+            return err
+
+    def _compress_output(
+        self,
+        call_res: execution_lib.CallResult,
+        compression: compression_lib.Compression,
+    ) -> None:
+        with self._timings.compress:
+            for res in _transformable_results(call_res):
+                if res.error is not None or res.output is types.empty_sentinel:
+                    continue
+
+                # Only the function result and step.run outputs are user data.
+                if (
+                    res.step is None
+                    or res.step.op is server_lib.Opcode.STEP_RUN
+                ):
+                    res.output = compression.compress(
+                        res.output,
+                        self.client.json_codec,
+                    )
+
+
+def _transformable_results(
+    call_res: execution_lib.CallResult,
+) -> list[execution_lib.CallResult]:
+    if call_res.multi is None:
+        return [call_res]
+    if len(call_res.multi) == 1:
+        return call_res.multi
+
+    # Multiple results are either planned parallel steps, which don't have
+    # output yet, or checkpointed steps.
+    return [
+        res
+        for res in call_res.multi
+        if res.step is not None
+        and res.step.op
+        in (
+            server_lib.Opcode.STEP_RUN,
+            server_lib.Opcode.STEP_ERROR,
+            server_lib.Opcode.STEP_FAILED,
+        )
+    ]
@@ -2,26 +2,114 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import hashlib
 import hmac
 import http
 import threading
 import time
+import typing
 import urllib.parse
+import weakref
 
 import httpx
 
 from inngest._internal import (
-    async_lib,
     config_lib,
     const,
     errors,
+    json_lib,
+    retry_lib,
     server_lib,
     transforms,
     types,
 )
 
 
+class HTTPOptions:
+    """
+    Connection pool and transport settings for requests to Inngest.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect_timeout: int | datetime.timedelta | None = None,
+        http2: bool = False,
+        keepalive_expiry: int | datetime.timedelta = datetime.timedelta(
+            seconds=5
+        ),
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        read_timeout: int | datetime.timedelta | None = None,
+        share_transport: bool = False,
+        write_timeout: int | datetime.timedelta | None = None,
+    ) -> None:
+        """
+        Args:
+        ----
+            connect_timeout: Timeout for connecting. Defaults to the client's request timeout. int value is in ms.
+            http2: Use HTTP/2 when the server supports it. Requires the h2 package (e.g. pip install inngest[http2]).
+            keepalive_expiry: How long idle connections are kept open. int value is in ms.
+            max_connections: Maximum number of open connections per pool. None means no limit.
+            max_keepalive_connections: Maximum number of idle connections per pool. None means no limit.
+            read_timeout: Timeout for reading a response. Defaults to the client's request timeout. int value is in ms.
+            share_transport: Share connection pools between all clients created with this object. Useful when a process has many clients.
+            write_timeout: Timeout for writing a request. Defaults to the client's request timeout. int value is in ms.
+        """
+
+        self._connect_timeout = transforms.to_seconds(connect_timeout)
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            keepalive_expiry=transforms.to_seconds(keepalive_expiry),
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._read_timeout = transforms.to_seconds(read_timeout)
+        self._share_transport = share_transport
+        self._write_timeout = transforms.to_seconds(write_timeout)
+
+        # Created when the first client is created, if sharing.
+        self._lock = threading.Lock()
+        self._shared: tuple[httpx.Client, AsyncHTTPClientRegistry] | None = None
+
+    def create_timeout(self, default: float) -> httpx.Timeout:
+        return httpx.Timeout(
+            default,
+            connect=self._connect_timeout or default,
+            read=self._read_timeout or default,
+            write=self._write_timeout or default,
+        )
+
+    def get_clients(self) -> tuple[httpx.Client, AsyncHTTPClientRegistry]:
+        """
+        Get the sync client and the async client registry, which are shared if
+        share_transport is set.
+        """
+
+        if not self._share_transport:
+            return self._create_clients()
+
+        with self._lock:
+            if self._shared is None:
+                self._shared = self._create_clients()
+            return self._shared
+
+    def _create_clients(
+        self,
+    ) -> tuple[httpx.Client, AsyncHTTPClientRegistry]:
+        # Requests set their own timeouts, so the clients don't need them.
+        return (
+            httpx.Client(http2=self._http2, limits=self._limits),
+            AsyncHTTPClientRegistry(
+                lambda: httpx.AsyncClient(
+                    http2=self._http2,
+                    limits=self._limits,
+                )
+            ),
+        )
+
+
 class AuthenticatedHTTPClient:
     """
     HTTP client that:
@@ -35,12 +123,15 @@ class AuthenticatedHTTPClient:
         self,
         *,
         env: str | None,
+        http_options: HTTPOptions | None = None,
+        json_codec: json_lib.JSONCodec | None = None,
         request_timeout: int | datetime.timedelta | None = None,
+        retry_policy: retry_lib.RetryPolicy | None = None,
         signing_key: str | None,
         signing_key_fallback: str | None,
     ):
-        self._http_client = ThreadAwareAsyncHTTPClient().initialize()
-        self._http_client_sync = httpx.Client()
+        http_options = http_options or HTTPOptions()
+        self._http_client_sync, self._async_clients = http_options.get_clients()
 
         # This is probably leaking an implementation detail, and maybe we should
         # eventually remove it. In the meantime, it simplifies initial
@@ -48,15 +139,14 @@ class AuthenticatedHTTPClient:
         self.build_httpx_request = self._http_client_sync.build_request
 
         self._env = env
+        self._json_codec = json_codec or json_lib.default_codec()
+        self.retry_policy = retry_policy or retry_lib.RetryPolicy()
         self._signing_key = signing_key
         self._signing_key_fallback = signing_key_fallback
 
-        if isinstance(request_timeout, int):
-            self._default_timeout = request_timeout / 1000  # convert ms to s
-        elif isinstance(request_timeout, datetime.timedelta):
-            self._default_timeout = request_timeout.total_seconds()
-        else:
-            self._default_timeout = 30.0
+        self.timeout = http_options.create_timeout(
+            transforms.to_seconds(request_timeout) or 30.0
+        )
 
     async def get(
         self,
@@ -88,22 +178,10 @@ class AuthenticatedHTTPClient:
                 # Additional headers or overrides
                 **(headers or {}),
             },
+            timeout=self.timeout,
         )
 
-        if auth:
-            res = await fetch_with_auth_fallback(
-                self._http_client,
-                self._http_client_sync,
-                req,
-                signing_key=self._signing_key,
-                signing_key_fallback=self._signing_key_fallback,
-            )
-        else:
-            res = await fetch_with_thready_safety(
-                self._http_client,
-                self._http_client_sync,
-                req,
-            )
+        res = await self.send(req, auth=auth)
         if isinstance(res, Exception):
             return res
 
@@ -142,18 +220,10 @@ class AuthenticatedHTTPClient:
                 # Additional headers or overrides
                 **(headers or {}),
             },
+            timeout=self.timeout,
         )
 
-        if auth:
-            res = fetch_with_auth_fallback_sync(
-                self._http_client_sync,
-                req,
-                signing_key=self._signing_key,
-                signing_key_fallback=self._signing_key_fallback,
-            )
-        else:
-            res = self._http_client_sync.send(req)
-
+        res = self.send_sync(req, auth=auth)
         if isinstance(res, Exception):
             return res
 
@@ -177,25 +247,23 @@ class AuthenticatedHTTPClient:
         -------
             A httpx.Response object
         """
+        content = transforms.dump_json(body, self._json_codec)
+        if isinstance(content, Exception):
+            return content
+
         req = self.build_httpx_request(
             "POST",
             url,
+            content=content,
             headers=create_headers(
                 env=self._env,
                 framework=None,
                 server_kind=None,
             ),
-            json=body,
-            timeout=self._default_timeout,
+            timeout=self.timeout,
         )
 
-        res = await fetch_with_auth_fallback(
-            self._http_client,
-            self._http_client_sync,
-            req,
-            signing_key=self._signing_key,
-            signing_key_fallback=self._signing_key_fallback,
-        )
+        res = await self.send(req, auth=True)
         if isinstance(res, Exception):
             return res
 
@@ -219,24 +287,23 @@ class AuthenticatedHTTPClient:
         -------
             A httpx.Response object
         """
+        content = transforms.dump_json(body, self._json_codec)
+        if isinstance(content, Exception):
+            return content
+
         req = self.build_httpx_request(
             "POST",
             url,
+            content=content,
             headers=create_headers(
                 env=self._env,
                 framework=None,
                 server_kind=None,
             ),
-            json=body,
-            timeout=self._default_timeout,
+            timeout=self.timeout,
         )
 
-        res = fetch_with_auth_fallback_sync(
-            self._http_client_sync,
-            req,
-            signing_key=self._signing_key,
-            signing_key_fallback=self._signing_key_fallback,
-        )
+        res = self.send_sync(req, auth=True)
         if isinstance(res, Exception):
             return res
 
@@ -245,26 +312,125 @@ class AuthenticatedHTTPClient:
 
         return res
 
+    async def send(
+        self,
+        request: httpx.Request,
+        *,
+        auth: bool = False,
+    ) -> types.MaybeError[httpx.Response]:
+        """
+        Send an asynchronous HTTP request with retries. Unlike the other
+        methods, non-OK responses are returned rather than errors.
+
+        Args:
+        ----
+            request: Request to send
+            auth: Include the Authorization header. Never set to True if the request is not to an Inngest server
+        """
 
-class ThreadAwareAsyncHTTPClient(httpx.AsyncClient):
+        return await fetch_with_auth_fallback(
+            self._async_clients,
+            request,
+            retry_policy=self.retry_policy,
+            signing_key=self._signing_key if auth else None,
+            signing_key_fallback=self._signing_key_fallback if auth else None,
+        )
+
+    def send_sync(
+        self,
+        request: httpx.Request,
+        *,
+        auth: bool = False,
+    ) -> types.MaybeError[httpx.Response]:
+        """
+        Send a synchronous HTTP request with retries. Unlike the other methods,
+        non-OK responses are returned rather than errors.
+
+        Args:
+        ----
+            request: Request to send
+            auth: Include the Authorization header. Never set to True if the request is not to an Inngest server
+        """
+
+        return fetch_with_auth_fallback_sync(
+            self._http_client_sync,
+            request,
+            retry_policy=self.retry_policy,
+            signing_key=self._signing_key if auth else None,
+            signing_key_fallback=self._signing_key_fallback if auth else None,
+        )
+
+
+class AsyncHTTPClientRegistry:
     """
-    Thin wrapper around httpx.AsyncClient. It keeps track of the thread it was
-    created in, which is critical since asyncio is not thread safe: calling an
-    async method in a different thread will raise an exception
+    Lazily creates an async HTTP client for each event loop, since an
+    httpx.AsyncClient can't be used by a loop other than the one it was first
+    used in. A loop's client is closed when the loop shuts down its async
+    generators (e.g. at the end of asyncio.run) and dropped when the loop is
+    closed or garbage collected.
     """
 
-    _creation_thread_id: int | None = None
+    def __init__(
+        self,
+        create: typing.Callable[[], httpx.AsyncClient] = httpx.AsyncClient,
+    ) -> None:
+        """
+        Args:
+        ----
+            create: Creates the client for a loop.
+        """
+
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopClient
+        ] = weakref.WeakKeyDictionary()
+        self._create = create
+        self._lock = threading.Lock()
+
+    async def get(self) -> httpx.AsyncClient:
+        """
+        Get the client for the running loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(loop)
+            if entry is not None and not entry.client.is_closed:
+                return entry.client
 
-    def is_same_thread(self) -> bool:
-        if self._creation_thread_id is None:
-            raise Exception("did not initialize ThreadAwareAsyncHTTPClient")
+            # Drop clients for loops that were closed without shutting down
+            # their async generators.
+            for other in [k for k in self._clients if k.is_closed()]:
+                del self._clients[other]
 
-        current_thread_id = threading.get_ident()
-        return self._creation_thread_id == current_thread_id
+            entry = _LoopClient(self._create())
+            self._clients[loop] = entry
 
-    def initialize(self) -> ThreadAwareAsyncHTTPClient:
-        self._creation_thread_id = threading.get_ident()
-        return self
+        # Start the closer so that the loop tracks it.
+        await entry.closer.__anext__()
+        return entry.client
+
+    async def aclose(self) -> None:
+        """
+        Close the running loop's client, if any.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.pop(loop, None)
+        if entry is not None:
+            await entry.client.aclose()
+
+
+class _LoopClient:
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+        self.closer = self._close_on_shutdown()
+
+    async def _close_on_shutdown(self) -> typing.AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            await self.client.aclose()
 
 
 def create_headers(
@@ -278,6 +444,16 @@ def create_headers(
     request.
     """
 
+    # Copy since callers add to the headers.
+    return dict(_create_headers(env, framework, server_kind))
+
+
+@functools.lru_cache(maxsize=64)
+def _create_headers(
+    env: str | None,
+    framework: server_lib.Framework | None,
+    server_kind: server_lib.ServerKind | None,
+) -> tuple[tuple[str, str], ...]:
     headers = {
         server_lib.HeaderKey.CONTENT_TYPE.value: "application/json",
         server_lib.HeaderKey.SDK.value: f"inngest-{const.LANGUAGE}:v{const.VERSION}",
@@ -294,7 +470,7 @@ def create_headers(
             server_kind.value
         )
 
-    return headers
+    return tuple(headers.items())
 
 
 def create_serve_url(
@@ -351,29 +527,48 @@ def create_serve_url(
 
 
 async def fetch_with_auth_fallback(
-    client: ThreadAwareAsyncHTTPClient,
-    client_sync: httpx.Client,
+    clients: AsyncHTTPClientRegistry,
     request: httpx.Request,
     *,
+    retry_policy: retry_lib.RetryPolicy | None = None,
     signing_key: str | None,
     signing_key_fallback: str | None,
 ) -> types.MaybeError[httpx.Response]:
     """
     Send an HTTP request with the given signing key. If the response is a 401 or
-    403, then try again with the fallback signing key
+    403, then try again with the fallback signing key. Retries according to the
+    retry policy, if any
     """
 
+    async def send(
+        request: httpx.Request,
+    ) -> types.MaybeError[httpx.Response]:
+        return await _fetch_with_auth_fallback(
+            clients,
+            request,
+            signing_key=signing_key,
+            signing_key_fallback=signing_key_fallback,
+        )
+
+    if retry_policy is None:
+        return await send(request)
+    return await retry_lib.fetch(retry_policy, request, send)
+
+
+async def _fetch_with_auth_fallback(
+    clients: AsyncHTTPClientRegistry,
+    request: httpx.Request,
+    *,
+    signing_key: str | None,
+    signing_key_fallback: str | None,
+) -> types.MaybeError[httpx.Response]:
     if signing_key is not None:
         request.headers[server_lib.HeaderKey.AUTHORIZATION.value] = (
-            f"Bearer {transforms.hash_signing_key(signing_key)}"
+            _create_authorization(signing_key)
         )
 
     try:
-        res = await fetch_with_thready_safety(
-            client,
-            client_sync,
-            request,
-        )
+        res = await fetch_with_thready_safety(clients, request)
         if (
             res.status_code
             in (http.HTTPStatus.FORBIDDEN, http.HTTPStatus.UNAUTHORIZED)
@@ -381,14 +576,10 @@ async def fetch_with_auth_fallback(
         ):
             # Try again with the signing key fallback
             request.headers[server_lib.HeaderKey.AUTHORIZATION.value] = (
-                f"Bearer {transforms.hash_signing_key(signing_key_fallback)}"
+                _create_authorization(signing_key_fallback)
             )
 
-            res = await fetch_with_thready_safety(
-                client,
-                client_sync,
-                request,
-            )
+            res = await fetch_with_thready_safety(clients, request)
 
         return res
     except Exception as err:
@@ -401,18 +592,39 @@ def fetch_with_auth_fallback_sync(
     client: httpx.Client,
     request: httpx.Request,
     *,
+    retry_policy: retry_lib.RetryPolicy | None = None,
     signing_key: str | None,
     signing_key_fallback: str | None,
 ) -> types.MaybeError[httpx.Response]:
     """
     Send an HTTP request with the given signing key. If the response is a 401 or
-    403, then try again with the fallback signing key. Returns an error when
-    receiving a non-OK response
+    403, then try again with the fallback signing key. Retries according to the
+    retry policy, if any
     """
 
+    def send(request: httpx.Request) -> types.MaybeError[httpx.Response]:
+        return _fetch_with_auth_fallback_sync(
+            client,
+            request,
+            signing_key=signing_key,
+            signing_key_fallback=signing_key_fallback,
+        )
+
+    if retry_policy is None:
+        return send(request)
+    return retry_lib.fetch_sync(retry_policy, request, send)
+
+
+def _fetch_with_auth_fallback_sync(
+    client: httpx.Client,
+    request: httpx.Request,
+    *,
+    signing_key: str | None,
+    signing_key_fallback: str | None,
+) -> types.MaybeError[httpx.Response]:
     if signing_key is not None:
         request.headers[server_lib.HeaderKey.AUTHORIZATION.value] = (
-            f"Bearer {transforms.hash_signing_key(signing_key)}"
+            _create_authorization(signing_key)
         )
 
     try:
@@ -424,7 +636,7 @@ def fetch_with_auth_fallback_sync(
         ):
             # Try again with the signing key fallback
             request.headers[server_lib.HeaderKey.AUTHORIZATION.value] = (
-                f"Bearer {transforms.hash_signing_key(signing_key_fallback)}"
+                _create_authorization(signing_key_fallback)
             )
             res = client.send(request)
         return res
@@ -475,31 +687,54 @@ def parse_url(url: str, mode: server_lib.ServerKind) -> types.MaybeError[str]:
 
 
 async def fetch_with_thready_safety(
-    client: ThreadAwareAsyncHTTPClient,
-    client_sync: httpx.Client,
+    clients: AsyncHTTPClientRegistry,
     request: httpx.Request,
 ) -> httpx.Response:
     """
-    Safely handles the situation where the async HTTP client is called in a
-    different thread.
+    Safely handles the situation where async HTTP requests are sent from
+    multiple threads (each with its own event loop), by using the running
+    loop's client.
+    """
+
+    client = await clients.get()
+    return await client.send(request)
+
+
+@functools.lru_cache(maxsize=16)
+def _create_authorization(signing_key: str) -> str:
+    """
+    Create the Authorization header value for a signing key. Cached since
+    hashing the key is relatively slow and a process only has a few keys.
     """
 
-    if client.is_same_thread() is True:
-        # Python freaks out if you call httpx.AsyncClient's methods in multiple
-        # threads. So we'll only use it if we're in the same thread as its first
-        # method call
-        return await client.send(request)
+    return f"Bearer {transforms.hash_signing_key(signing_key)}"
+
 
-    loop = async_lib.get_event_loop()
-    if loop is None:
-        return client_sync.send(request)
+@functools.lru_cache(maxsize=16)
+def _get_signing_key_mac(signing_key: str) -> hmac.HMAC:
+    """
+    Get an HMAC keyed with the prefix-stripped signing key. The returned object
+    is shared, so callers must copy it before updating it.
+    """
 
-    return await loop.run_in_executor(
-        None,
-        lambda: client_sync.send(request),
+    return hmac.new(
+        transforms.remove_signing_key_prefix(signing_key).encode("utf-8"),
+        digestmod=hashlib.sha256,
     )
 
 
+def _create_sig(
+    body: bytes,
+    signing_key: str,
+    timestamp: int | None,
+) -> str:
+    mac = _get_signing_key_mac(signing_key).copy()
+    mac.update(body)
+    if timestamp:
+        mac.update(str(timestamp).encode("utf-8"))
+    return mac.hexdigest()
+
+
 def sign_request(
     body: bytes,
     signing_key: str,
@@ -517,13 +752,7 @@ def sign_request(
     if isinstance(canonicalized, Exception):
         raise canonicalized
 
-    mac = hmac.new(
-        transforms.remove_signing_key_prefix(signing_key).encode("utf-8"),
-        canonicalized,
-        hashlib.sha256,
-    )
-    mac.update(str(unix_ms).encode("utf-8"))
-    sig = mac.hexdigest()
+    sig = _create_sig(canonicalized, signing_key, unix_ms)
 
     # Order matters since Inngest Cloud compares strings
     return f"t={unix_ms}&s={sig}"
@@ -541,18 +770,36 @@ def sign_response(
     if unix_ms is None:
         unix_ms = round(time.time())
 
-    mac = hmac.new(
-        transforms.remove_signing_key_prefix(signing_key).encode("utf-8"),
-        body,
-        hashlib.sha256,
-    )
-    mac.update(str(unix_ms).encode("utf-8"))
-    sig = mac.hexdigest()
+    sig = _create_sig(body, signing_key, unix_ms)
 
     # Order matters since Inngest Cloud compares strings
     return f"t={unix_ms}&s={sig}"
 
 
+def _parse_sig_header(
+    headers: dict[str, str],
+) -> types.MaybeError[tuple[str | None, int | None]]:
+    """
+    Parse the signature header into its signature and timestamp.
+    """
+
+    timestamp = None
+    signature = None
+    sig_header = headers.get(server_lib.HeaderKey.SIGNATURE.value)
+    if sig_header is None:
+        return errors.HeaderMissingError(
+            f"cannot validate signature in production mode without a {server_lib.HeaderKey.SIGNATURE.value} header"
+        )
+
+    parsed = urllib.parse.parse_qs(sig_header)
+    if "t" in parsed:
+        timestamp = int(parsed["t"][0])
+    if "s" in parsed:
+        signature = parsed["s"][0]
+
+    return signature, timestamp
+
+
 def _validate_sig(
     *,
     body: bytes,
@@ -563,19 +810,10 @@ def _validate_sig(
     if mode == server_lib.ServerKind.DEV_SERVER:
         return None
 
-    timestamp = None
-    signature = None
-    sig_header = headers.get(server_lib.HeaderKey.SIGNATURE.value)
-    if sig_header is None:
-        return errors.HeaderMissingError(
-            f"cannot validate signature in production mode without a {server_lib.HeaderKey.SIGNATURE.value} header"
-        )
-    else:
-        parsed = urllib.parse.parse_qs(sig_header)
-        if "t" in parsed:
-            timestamp = int(parsed["t"][0])
-        if "s" in parsed:
-            signature = parsed["s"][0]
+    parsed = _parse_sig_header(headers)
+    if isinstance(parsed, Exception):
+        return parsed
+    signature, timestamp = parsed
 
     if signing_key is None:
         return errors.SigningKeyMissingError(
@@ -587,16 +825,10 @@ def _validate_sig(
             f"{server_lib.HeaderKey.SIGNATURE.value} header is malformed"
         )
 
-    mac = hmac.new(
-        transforms.remove_signing_key_prefix(signing_key).encode("utf-8"),
-        body,
-        hashlib.sha256,
-    )
-
-    if timestamp:
-        mac.update(str(timestamp).encode("utf-8"))
-
-    if not hmac.compare_digest(signature, mac.hexdigest()):
+    if not hmac.compare_digest(
+        signature,
+        _create_sig(body, signing_key, timestamp),
+    ):
         return errors.SigVerificationFailedError()
 
     return signing_key
@@ -606,6 +838,7 @@ def validate_request_sig(
     *,
     body: bytes,
     headers: dict[str, str],
+    load_body: typing.Callable[[], types.MaybeError[object]] | None = None,
     mode: server_lib.ServerKind,
     signing_key: str | None,
     signing_key_fallback: str | None,
@@ -614,37 +847,66 @@ def validate_request_sig(
     Validate the request signature. Falls back to the fallback signing key if
     signature validation fails with the primary signing key.
 
+    The signature is first checked against the raw body, since the body is
+    usually already canonical. Only if that fails is the body canonicalized
+    and checked again.
+
     Args:
     ----
         body: Request body.
         headers: Request headers.
+        load_body: Returns the parsed body. Pass this when the caller needs the parsed body anyway, so it's parsed once.
         mode: Server mode.
         signing_key: Primary signing key.
         signing_key_fallback: Fallback signing key.
     """
 
-    canonicalized = transforms.canonicalize(body)
+    if mode == server_lib.ServerKind.DEV_SERVER:
+        return None
+
+    parsed = _parse_sig_header(headers)
+    if isinstance(parsed, Exception):
+        return parsed
+    signature, timestamp = parsed
+
+    signing_keys = [
+        key for key in (signing_key, signing_key_fallback) if key is not None
+    ]
+    if len(signing_keys) == 0:
+        return errors.SigningKeyMissingError(
+            "cannot validate signature in production mode without a signing key"
+        )
+
+    if signature is None:
+        return Exception(
+            f"{server_lib.HeaderKey.SIGNATURE.value} header is malformed"
+        )
+
+    for key in signing_keys:
+        if hmac.compare_digest(signature, _create_sig(body, key, timestamp)):
+            return key
+
+    loaded: object = types.empty_sentinel
+    if load_body is not None and len(body) > 0:
+        loaded = load_body()
+        if isinstance(loaded, Exception):
+            return Exception("failed to canonicalize: " + str(loaded))
+
+    canonicalized = transforms.canonicalize(body, loaded=loaded)
     if isinstance(canonicalized, Exception):
         return canonicalized
+    if canonicalized == body:
+        # Already checked.
+        return errors.SigVerificationFailedError()
 
-    err = _validate_sig(
-        body=canonicalized,
-        headers=headers,
-        mode=mode,
-        signing_key=signing_key,
-    )
-    if isinstance(err, Exception) and signing_key_fallback is not None:
-        # If the signature validation failed but there's a "fallback"
-        # signing key, attempt to validate the signature with the fallback
-        # key
-        err = _validate_sig(
-            body=canonicalized,
-            headers=headers,
-            mode=mode,
-            signing_key=signing_key_fallback,
-        )
+    for key in signing_keys:
+        if hmac.compare_digest(
+            signature,
+            _create_sig(canonicalized, key, timestamp),
+        ):
+            return key
 
-    return err
+    return errors.SigVerificationFailedError()
 
 
 def validate_response_sig(
@@ -750,6 +1012,12 @@ class ServerTimings:
         # general HTTP framework stuff (e.g. everything besides FastAPI stuff)
         self.comm_handler = ServerTiming("comm_handler")
 
+        # Compressing step outputs and the function result
+        self.compress = ServerTiming("compress")
+
+        # Decompressing memoized step outputs
+        self.decompress = ServerTiming("decompress")
+
         # Calling the Inngest function
         self.function = ServerTiming("function")
 
@@ -768,6 +1036,8 @@ class ServerTimings:
         timings: list[ServerTiming | _AsyncBlockServerTiming] = [
             self.async_block,
             self.comm_handler,
+            self.compress,
+            self.decompress,
             self.function,
             self.mw_transform_input,
             self.mw_transform_output,
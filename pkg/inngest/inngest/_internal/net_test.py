@@ -1,7 +1,9 @@
+import asyncio
 import hashlib
 import hmac
 import json
 import os
+import threading
 import time
 import typing
 import unittest
@@ -233,6 +235,61 @@ class Test_RequestSignature(unittest.TestCase):
             Exception,
         )
 
+    def test_canonical_body_skips_parse(self) -> None:
+        """
+        A body that's already canonical is validated without parsing it
+        """
+
+        body = b'{"msg":"hi"}'
+        unix_ms = round(time.time() * 1000)
+        sig = _sign(body, _signing_key, unix_ms)
+        assert not isinstance(sig, Exception)
+        headers = {
+            server_lib.HeaderKey.SIGNATURE.value: f"s={sig}&t={unix_ms}",
+        }
+
+        load_body = unittest.mock.Mock(side_effect=json.loads)
+        assert (
+            net.validate_request_sig(
+                body=body,
+                headers=headers,
+                load_body=load_body,
+                mode=server_lib.ServerKind.CLOUD,
+                signing_key=_signing_key,
+                signing_key_fallback=None,
+            )
+            == _signing_key
+        )
+        load_body.assert_not_called()
+
+    def test_load_body_called_once(self) -> None:
+        """
+        A non-canonical body is parsed once, even when falling back to the
+        fallback signing key
+        """
+
+        body = json.dumps({"msg": "hi", "a": [1, 2]}).encode("utf-8")
+        unix_ms = round(time.time() * 1000)
+        sig = _sign(body, _signing_key_fallback, unix_ms)
+        assert not isinstance(sig, Exception)
+        headers = {
+            server_lib.HeaderKey.SIGNATURE.value: f"s={sig}&t={unix_ms}",
+        }
+
+        load_body = unittest.mock.Mock(return_value=json.loads(body))
+        assert (
+            net.validate_request_sig(
+                body=body,
+                headers=headers,
+                load_body=load_body,
+                mode=server_lib.ServerKind.CLOUD,
+                signing_key=_signing_key,
+                signing_key_fallback=_signing_key_fallback,
+            )
+            == _signing_key_fallback
+        )
+        load_body.assert_called_once()
+
 
 class Test_fetch_with_auth_fallback(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
@@ -286,10 +343,11 @@ class Test_fetch_with_auth_fallback(unittest.IsolatedAsyncioTestCase):
             return httpx.Response(200, content=b"", request=request)
 
         res = await net.fetch_with_auth_fallback(
-            net.ThreadAwareAsyncHTTPClient(
-                transport=self._create_async_transport(handler)
-            ).initialize(),
-            httpx.Client(transport=self._create_transport(handler)),
+            net.AsyncHTTPClientRegistry(
+                lambda: httpx.AsyncClient(
+                    transport=self._create_async_transport(handler)
+                )
+            ),
             self._req,
             signing_key=_signing_key,
             signing_key_fallback=_signing_key_fallback,
@@ -333,10 +391,11 @@ class Test_fetch_with_auth_fallback(unittest.IsolatedAsyncioTestCase):
             return httpx.Response(200, content=b"", request=request)
 
         res = await net.fetch_with_auth_fallback(
-            net.ThreadAwareAsyncHTTPClient(
-                transport=self._create_async_transport(handler)
-            ).initialize(),
-            httpx.Client(transport=self._create_transport(handler)),
+            net.AsyncHTTPClientRegistry(
+                lambda: httpx.AsyncClient(
+                    transport=self._create_async_transport(handler)
+                )
+            ),
             self._req,
             signing_key=_signing_key,
             signing_key_fallback=_signing_key_fallback,
@@ -380,10 +439,11 @@ class Test_fetch_with_auth_fallback(unittest.IsolatedAsyncioTestCase):
             return httpx.Response(200, content=b"", request=request)
 
         res = await net.fetch_with_auth_fallback(
-            net.ThreadAwareAsyncHTTPClient(
-                transport=self._create_async_transport(handler)
-            ).initialize(),
-            httpx.Client(transport=self._create_transport(handler)),
+            net.AsyncHTTPClientRegistry(
+                lambda: httpx.AsyncClient(
+                    transport=self._create_async_transport(handler)
+                )
+            ),
             self._req,
             signing_key="signkey-prod-aaaaaa",
             signing_key_fallback="signkey-prod-bbbbbb",
@@ -422,10 +482,11 @@ class Test_fetch_with_auth_fallback(unittest.IsolatedAsyncioTestCase):
             return httpx.Response(200, content=b"", request=request)
 
         res = await net.fetch_with_auth_fallback(
-            net.ThreadAwareAsyncHTTPClient(
-                transport=self._create_async_transport(handler)
-            ).initialize(),
-            httpx.Client(transport=self._create_transport(handler)),
+            net.AsyncHTTPClientRegistry(
+                lambda: httpx.AsyncClient(
+                    transport=self._create_async_transport(handler)
+                )
+            ),
             self._req,
             signing_key=None,
             signing_key_fallback=None,
@@ -446,6 +507,81 @@ class Test_fetch_with_auth_fallback(unittest.IsolatedAsyncioTestCase):
         assert req_count == 1
 
 
+class Test_AsyncHTTPClientRegistry(unittest.TestCase):
+    def test_client_per_loop(self) -> None:
+        registry = net.AsyncHTTPClientRegistry()
+
+        async def get_twice() -> httpx.AsyncClient:
+            client = await registry.get()
+            assert await registry.get() is client
+            return client
+
+        client = asyncio.run(get_twice())
+
+        # Closed when asyncio.run shuts down the loop.
+        assert client.is_closed
+
+        # Each thread's loop gets its own client.
+        other_clients: list[httpx.AsyncClient] = []
+        thread = threading.Thread(
+            target=lambda: other_clients.append(asyncio.run(get_twice()))
+        )
+        thread.start()
+        thread.join()
+        assert other_clients[0] is not client
+        assert other_clients[0].is_closed
+
+
+class Test_HTTPOptions(unittest.TestCase):
+    def test_share_transport(self) -> None:
+        options = net.HTTPOptions(share_transport=True)
+        a = net.AuthenticatedHTTPClient(
+            env=None,
+            http_options=options,
+            signing_key=None,
+            signing_key_fallback=None,
+        )
+        b = net.AuthenticatedHTTPClient(
+            env=None,
+            http_options=options,
+            signing_key=None,
+            signing_key_fallback=None,
+        )
+        assert a._http_client_sync is b._http_client_sync
+        assert a._async_clients is b._async_clients
+
+        c = net.AuthenticatedHTTPClient(
+            env=None,
+            signing_key=None,
+            signing_key_fallback=None,
+        )
+        assert c._http_client_sync is not a._http_client_sync
+
+    def test_timeout(self) -> None:
+        client = net.AuthenticatedHTTPClient(
+            env=None,
+            http_options=net.HTTPOptions(connect_timeout=1_000),
+            request_timeout=10_000,
+            signing_key=None,
+            signing_key_fallback=None,
+        )
+        assert client.timeout == httpx.Timeout(10, connect=1)
+
+
+class Test_create_headers(unittest.TestCase):
+    def test_copy(self) -> None:
+        headers = net.create_headers(
+            env="my-env", framework=None, server_kind=None
+        )
+        headers["x-foo"] = "bar"
+
+        headers = net.create_headers(
+            env="my-env", framework=None, server_kind=None
+        )
+        assert "x-foo" not in headers
+        assert headers[server_lib.HeaderKey.ENV.value] == "my-env"
+
+
 class Test_parse_url(unittest.TestCase):
     def test_no_scheme(self) -> None:
         assert (
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import random
+import threading
+import time
+import typing
+
+import httpx
+
+from inngest._internal import transforms, types
+
+
+class RetryBudget:
+    """
+    Token bucket that limits retries across every request that shares it, so
+    that an unhealthy server doesn't cause a retry storm. Each retry takes a
+    token and tokens are refilled at a fixed rate. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 100,
+        refill_per_second: float = 10,
+    ) -> None:
+        """
+        Args:
+        ----
+            capacity: Maximum number of tokens, which is the largest burst of retries.
+            refill_per_second: Number of tokens added per second.
+        """
+
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if refill_per_second < 0:
+            raise ValueError("refill_per_second must not be negative")
+
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._refill_per_second = refill_per_second
+        self._refilled_at = time.monotonic()
+        self._tokens = float(capacity)
+
+    def acquire(self) -> bool:
+        """
+        Take a token. Returns False if there are none.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens
+                + (now - self._refilled_at) * self._refill_per_second,
+            )
+            self._refilled_at = now
+
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+# Shared by every RetryPolicy that doesn't specify a budget.
+_default_budget = RetryBudget()
+
+
+class RetryMetrics:
+    """
+    Counts of what a RetryPolicy did. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+
+        # Requests that failed without another attempt, by reason.
+        self.give_ups: dict[str, int] = {}
+
+    def to_dict(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "give_ups": dict(self.give_ups),
+                "retries": self.retries,
+            }
+
+    def _add_attempt(self) -> None:
+        with self._lock:
+            self.attempts += 1
+
+    def _add_give_up(self, reason: str) -> None:
+        with self._lock:
+            self.give_ups[reason] = self.give_ups.get(reason, 0) + 1
+
+    def _add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+
+class RetryPolicy:
+    """
+    How requests to Inngest are retried. A request is retried when it fails to
+    get a response or gets a 429 or 5xx status code.
+    """
+
+    def __init__(
+        self,
+        *,
+        attempt_timeout: int | datetime.timedelta | None = None,
+        base_delay: int | datetime.timedelta = datetime.timedelta(
+            milliseconds=100
+        ),
+        budget: RetryBudget | None = None,
+        deadline: int | datetime.timedelta | None = None,
+        max_attempts: int = 5,
+        max_delay: int | datetime.timedelta = datetime.timedelta(seconds=10),
+    ) -> None:
+        """
+        Args:
+        ----
+            attempt_timeout: Timeout for each attempt. Defaults to the client's request timeout. int value is in ms.
+            base_delay: Delay before the first retry. Doubles for each retry, plus jitter. int value is in ms.
+            budget: Limits retries across requests. Defaults to a budget shared by the whole process.
+            deadline: Total time for all attempts and the delays between them. Attempts are cut short to end by the deadline. int value is in ms.
+            max_attempts: Maximum number of attempts, including the first.
+            max_delay: Maximum delay between attempts. int value is in ms.
+        """
+
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.attempt_timeout = transforms.to_seconds(attempt_timeout)
+        self.base_delay = transforms.to_seconds(base_delay) or 0.0
+        self.budget = budget or _default_budget
+        self.deadline = transforms.to_seconds(deadline)
+        self.max_attempts = max_attempts
+        self.max_delay = transforms.to_seconds(max_delay) or 0.0
+        self.metrics = RetryMetrics()
+
+    def compute_delay(self, attempt: int) -> float:
+        """
+        Get the number of seconds to wait after the given (0-indexed) attempt.
+        """
+
+        # Jitter between 0 and the base delay
+        jitter = random.random() * self.base_delay  # noqa:S311
+
+        # Exponential backoff with jitter
+        delay: float = self.base_delay * (2**attempt) + jitter
+        return min(delay, self.max_delay)
+
+
+async def fetch(
+    policy: RetryPolicy,
+    request: httpx.Request,
+    send: typing.Callable[
+        [httpx.Request], typing.Awaitable[types.MaybeError[httpx.Response]]
+    ],
+) -> types.MaybeError[httpx.Response]:
+    """
+    Send the request, retrying according to the policy. Returns the last
+    attempt's result.
+    """
+
+    attempts = _Attempts(policy, request)
+    while True:
+        res = await send(request)
+        delay = attempts.next_delay(res)
+        if delay is None:
+            return res
+        await asyncio.sleep(delay)
+
+
+def fetch_sync(
+    policy: RetryPolicy,
+    request: httpx.Request,
+    send: typing.Callable[[httpx.Request], types.MaybeError[httpx.Response]],
+) -> types.MaybeError[httpx.Response]:
+    """
+    Send the request, retrying according to the policy. Returns the last
+    attempt's result.
+    """
+
+    attempts = _Attempts(policy, request)
+    while True:
+        res = send(request)
+        delay = attempts.next_delay(res)
+        if delay is None:
+            return res
+        time.sleep(delay)
+
+
+class _Attempts:
+    """
+    Tracks the attempts of a single request. Shared by the async and sync
+    retry loops.
+    """
+
+    def __init__(self, policy: RetryPolicy, request: httpx.Request) -> None:
+        self._attempt = 0
+        self._policy = policy
+        self._request = request
+
+        self._deadline: float | None = None
+        if policy.deadline is not None:
+            self._deadline = time.monotonic() + policy.deadline
+
+        self._start_attempt()
+
+    def next_delay(
+        self,
+        res: types.MaybeError[httpx.Response],
+    ) -> float | None:
+        """
+        Get the delay before the next attempt and start it. Returns None if
+        there shouldn't be another attempt.
+        """
+
+        if not _is_retriable(res):
+            return None
+
+        policy = self._policy
+        if self._attempt + 1 >= policy.max_attempts:
+            policy.metrics._add_give_up("max_attempts")
+            return None
+
+        delay = policy.compute_delay(self._attempt)
+        if (
+            self._deadline is not None
+            and time.monotonic() + delay >= self._deadline
+        ):
+            policy.metrics._add_give_up("deadline")
+            return None
+
+        if not policy.budget.acquire():
+            policy.metrics._add_give_up("budget")
+            return None
+
+        policy.metrics._add_retry()
+        self._attempt += 1
+
+        # Called before sleeping, but the attempt timeout is relative to the
+        # deadline so the sleep is accounted for.
+        self._start_attempt(delay)
+        return delay
+
+    def _start_attempt(self, delay: float = 0) -> None:
+        self._policy.metrics._add_attempt()
+
+        timeout = self._policy.attempt_timeout
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic() - delay
+            if timeout is None or remaining < timeout:
+                timeout = remaining
+
+        if timeout is not None:
+            # httpx reads the timeout from the request when sending it.
+            self._request.extensions["timeout"] = httpx.Timeout(
+                timeout
+            ).as_dict()
+
+
+def _is_retriable(res: types.MaybeError[httpx.Response]) -> bool:
+    if isinstance(res, Exception):
+        # Only retry errors from failing to get a response.
+        return isinstance(res, httpx.RequestError) or isinstance(
+            res.__cause__, httpx.RequestError
+        )
+
+    # Don't retry other 4xx status codes because the request is malformed and
+    # retrying will just fail again.
+    return res.status_code == 429 or res.status_code >= 500
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+import httpx
+
+from inngest._internal import retry_lib, types
+
+
+class _Server:
+    """
+    Fake send function that returns the given status codes in order.
+    """
+
+    def __init__(self, *status_codes: int) -> None:
+        self.requests = 0
+        self.timeouts: list[object] = []
+        self._status_codes = status_codes
+
+    def send(self, request: httpx.Request) -> types.MaybeError[httpx.Response]:
+        self.timeouts.append(request.extensions.get("timeout"))
+        status_code = self._status_codes[self.requests]
+        self.requests += 1
+        if status_code == 0:
+            return httpx.ConnectError("connection refused")
+        return httpx.Response(status_code)
+
+    async def send_async(
+        self,
+        request: httpx.Request,
+    ) -> types.MaybeError[httpx.Response]:
+        return self.send(request)
+
+
+def _request() -> httpx.Request:
+    return httpx.Request("POST", "http://localhost")
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_retries(self) -> None:
+        policy = retry_lib.RetryPolicy(base_delay=0)
+        server = _Server(0, 500, 429, 200)
+
+        res = retry_lib.fetch_sync(policy, _request(), server.send)
+
+        assert isinstance(res, httpx.Response)
+        assert res.status_code == 200
+        assert server.requests == 4
+        assert policy.metrics.to_dict() == {
+            "attempts": 4,
+            "give_ups": {},
+            "retries": 3,
+        }
+
+    def test_async(self) -> None:
+        policy = retry_lib.RetryPolicy(base_delay=0)
+        server = _Server(500, 200)
+
+        res = asyncio.run(
+            retry_lib.fetch(policy, _request(), server.send_async)
+        )
+
+        assert isinstance(res, httpx.Response)
+        assert res.status_code == 200
+        assert server.requests == 2
+
+    def test_no_retry_on_4xx(self) -> None:
+        policy = retry_lib.RetryPolicy(base_delay=0)
+        server = _Server(400)
+
+        res = retry_lib.fetch_sync(policy, _request(), server.send)
+
+        assert isinstance(res, httpx.Response)
+        assert res.status_code == 400
+        assert server.requests == 1
+
+    def test_max_attempts(self) -> None:
+        policy = retry_lib.RetryPolicy(base_delay=0, max_attempts=2)
+        server = _Server(500, 500, 200)
+
+        res = retry_lib.fetch_sync(policy, _request(), server.send)
+
+        assert isinstance(res, httpx.Response)
+        assert res.status_code == 500
+        assert server.requests == 2
+        assert policy.metrics.give_ups == {"max_attempts": 1}
+
+    def test_deadline(self) -> None:
+        policy = retry_lib.RetryPolicy(
+            attempt_timeout=60_000,
+            base_delay=100,
+            deadline=150,
+            max_delay=100,
+        )
+        server = _Server(500, 500, 200)
+
+        res = retry_lib.fetch_sync(policy, _request(), server.send)
+
+        # The 2nd retry would end after the deadline.
+        assert isinstance(res, httpx.Response)
+        assert res.status_code == 500
+        assert server.requests == 2
+        assert policy.metrics.give_ups == {"deadline": 1}
+
+        # Attempts are cut short to end by the deadline.
+        for timeout in server.timeouts:
+            assert isinstance(timeout, dict)
+            assert timeout["read"] <= 0.15
+
+    def test_budget(self) -> None:
+        budget = retry_lib.RetryBudget(capacity=1, refill_per_second=0)
+        policy = retry_lib.RetryPolicy(base_delay=0, budget=budget)
+        other_policy = retry_lib.RetryPolicy(base_delay=0, budget=budget)
+
+        retry_lib.fetch_sync(policy, _request(), _Server(500, 200).send)
+
+        # The budget is shared, so the other policy can't retry.
+        server = _Server(500, 200)
+        res = retry_lib.fetch_sync(other_policy, _request(), server.send)
+
+        assert isinstance(res, httpx.Response)
+        assert res.status_code == 500
+        assert server.requests == 1
+        assert other_policy.metrics.give_ups == {"budget": 1}
@@ -1,7 +1,23 @@
+from __future__ import annotations
+
+import base64
+import collections
+import threading
 import typing
+import zlib
 
 import pydantic
 
+try:
+    import numpy
+
+    _has_numpy = True
+except ImportError:
+    _has_numpy = False
+
+# Marks a JSON object as an encoded buffer. The value is the buffer's kind.
+_buffer_marker: typing.Final = "__BUFFER__"
+
 
 class Serializer(typing.Protocol):
     def serialize(self, obj: object, typ: object) -> object:
@@ -30,13 +46,37 @@ class Serializer(typing.Protocol):
 
 
 class PydanticSerializer(Serializer):
+    """
+    Serializes with Pydantic. Building a TypeAdapter is expensive, so adapters
+    are cached by type. Thread-safe.
+    """
+
+    def __init__(self, *, max_cached_types: int = 1_000) -> None:
+        """
+        Args:
+        ----
+            max_cached_types: Maximum number of types to keep TypeAdapters for. The least recently used type is evicted first.
+        """
+
+        if max_cached_types < 1:
+            raise ValueError("max_cached_types must be at least 1")
+
+        self._adapters: collections.OrderedDict[
+            object, pydantic.TypeAdapter[object]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._max_cached_types = max_cached_types
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def serialize(self, obj: object, typ: object) -> object:
         """
         Serialize a Pydantic object to a JSON object (dict, list, None, etc.).
         """
 
-        adapter = pydantic.TypeAdapter(object)
-        return adapter.dump_python(obj, mode="json")
+        # Serialized by the object's runtime type, so typ isn't needed.
+        return _object_adapter.dump_python(obj, mode="json")
 
     def deserialize(self, obj: object, typ: object) -> object:
         """
@@ -44,5 +84,180 @@ class PydanticSerializer(Serializer):
         object.
         """
 
+        return self._get_adapter(typ, is_counted=True).validate_python(obj)
+
+    def prepare(self, typ: object) -> None:
+        """
+        Build and cache the TypeAdapter for a type ahead of time, so that the
+        first deserialization doesn't pay for it. Doesn't affect the cache
+        counters.
+        """
+
+        if _is_hashable(typ):
+            self._get_adapter(typ, is_counted=False)
+
+    def _get_adapter(
+        self,
+        typ: object,
+        *,
+        is_counted: bool,
+    ) -> pydantic.TypeAdapter[object]:
+        if not _is_hashable(typ):
+            # Can't be cached (e.g. Annotated with unhashable metadata).
+            if is_counted:
+                with self._lock:
+                    self.cache_misses += 1
+            return pydantic.TypeAdapter[object](typ)
+
+        with self._lock:
+            adapter = self._adapters.get(typ)
+            if adapter is not None:
+                self._adapters.move_to_end(typ)
+                if is_counted:
+                    self.cache_hits += 1
+                return adapter
+            if is_counted:
+                self.cache_misses += 1
+
+        # Built outside the lock since it's slow. Concurrent misses for the
+        # same type may build it more than once, but only 1 is kept.
         adapter = pydantic.TypeAdapter[object](typ)
-        return adapter.validate_python(obj)
+
+        with self._lock:
+            adapter = self._adapters.setdefault(typ, adapter)
+            while len(self._adapters) > self._max_cached_types:
+                self._adapters.popitem(last=False)
+        return adapter
+
+
+class BufferSerializer(Serializer):
+    """
+    Encodes NumPy arrays and other binary data (bytes, bytearray, memoryview)
+    as a compact JSON object with the base64-encoded raw buffer, instead of a
+    JSON list. Everything else is handled by the fallback serializer.
+
+    Decoded arrays are created with numpy.frombuffer, so they're read-only
+    views over the decoded buffer rather than copies. NumPy arrays require
+    the numpy package (`pip install inngest[numpy]`). Object arrays aren't
+    supported.
+
+    Like any serializer, this is only used when the step or function has an
+    output_type.
+    """
+
+    def __init__(
+        self,
+        *,
+        compression_threshold: int | None = None,
+        fallback: Serializer | None = None,
+    ) -> None:
+        """
+        Args:
+        ----
+            compression_threshold: Compress buffers with zlib when they have at least this many bytes. Compressed buffers are only used if they're smaller. Defaults to no compression.
+            fallback: Serializer for everything that isn't a buffer. Defaults to PydanticSerializer.
+        """
+
+        if compression_threshold is not None and compression_threshold < 0:
+            raise ValueError("compression_threshold must not be negative")
+
+        self._compression_threshold = compression_threshold
+        self._fallback = fallback or PydanticSerializer()
+
+    def serialize(self, obj: object, typ: object) -> object:
+        """
+        Serialize a buffer to an encoded JSON object. Other objects are
+        serialized by the fallback serializer.
+        """
+
+        if _has_numpy and isinstance(obj, numpy.ndarray):
+            if obj.dtype.hasobject:
+                raise TypeError("cannot serialize an array of Python objects")
+
+            # Non-contiguous arrays (e.g. slices) need a copy to get a single
+            # buffer. The copy is always at least 1-dimensional, so the shape
+            # comes from the original array.
+            arr = numpy.ascontiguousarray(obj)
+            return self._encode(
+                "ndarray",
+                memoryview(arr.reshape(-1).view(numpy.uint8)),
+                dtype=numpy.lib.format.dtype_to_descr(arr.dtype),
+                shape=list(obj.shape),
+            )
+
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            buf = memoryview(obj)
+            if not buf.c_contiguous:
+                buf = memoryview(buf.tobytes())
+            return self._encode("bytes", buf.cast("B"))
+
+        return self._fallback.serialize(obj, typ)
+
+    def deserialize(self, obj: object, typ: object) -> object:
+        """
+        Deserialize an encoded JSON object into a buffer. Other objects are
+        deserialized by the fallback serializer.
+        """
+
+        if not isinstance(obj, dict) or _buffer_marker not in obj:
+            return self._fallback.deserialize(obj, typ)
+
+        kind = obj[_buffer_marker]
+        data = base64.b64decode(obj["data"])
+        compression = obj.get("compression")
+        if compression == "zlib":
+            data = zlib.decompress(data)
+        elif compression is not None:
+            raise ValueError(f"unknown buffer compression: {compression}")
+
+        if kind == "ndarray":
+            if not _has_numpy:
+                raise ImportError(
+                    "numpy is not installed. Install it with `pip install inngest[numpy]`"
+                )
+            dtype = numpy.lib.format.descr_to_dtype(obj["dtype"])
+            return numpy.frombuffer(data, dtype=dtype).reshape(
+                tuple(obj["shape"])
+            )
+
+        if kind == "bytes":
+            if typ is bytearray:
+                return bytearray(data)
+            if typ is memoryview:
+                return memoryview(data)
+            return data
+
+        raise ValueError(f"unknown buffer kind: {kind}")
+
+    def _encode(
+        self,
+        kind: str,
+        buf: memoryview,
+        **fields: object,
+    ) -> dict[str, object]:
+        encoded: dict[str, object] = {_buffer_marker: kind, **fields}
+
+        data: bytes | memoryview = buf
+        if (
+            self._compression_threshold is not None
+            and buf.nbytes >= self._compression_threshold
+        ):
+            compressed = zlib.compress(buf)
+            if len(compressed) < buf.nbytes:
+                data = compressed
+                encoded["compression"] = "zlib"
+
+        encoded["data"] = base64.b64encode(data).decode("ascii")
+        return encoded
+
+
+def _is_hashable(value: object) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+# Serializes objects by their runtime type.
+_object_adapter = pydantic.TypeAdapter[object](object)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import typing
+import unittest
+
+import pydantic
+
+try:
+    import numpy
+
+    _has_numpy = True
+except ImportError:
+    _has_numpy = False
+
+import test_core
+
+import inngest
+
+from . import comm_lib, serializer_lib, server_lib, transforms
+
+
+class _User(pydantic.BaseModel):
+    name: str
+
+
+class TestPydanticSerializer(unittest.TestCase):
+    def test_cache(self) -> None:
+        serializer = serializer_lib.PydanticSerializer()
+
+        for _ in range(3):
+            user = serializer.deserialize({"name": "Alice"}, _User)
+            assert user == _User(name="Alice")
+
+        assert serializer.cache_hits == 2
+        assert serializer.cache_misses == 1
+
+    def test_max_cached_types(self) -> None:
+        serializer = serializer_lib.PydanticSerializer(max_cached_types=1)
+
+        serializer.deserialize(1, int)
+        serializer.deserialize("a", str)
+        serializer.deserialize(1, int)
+
+        assert serializer.cache_hits == 0
+        assert serializer.cache_misses == 3
+
+    def test_unhashable(self) -> None:
+        serializer = serializer_lib.PydanticSerializer()
+        typ = typing.Annotated[int, {"unhashable": "metadata"}]
+
+        for _ in range(2):
+            assert serializer.deserialize(1, typ) == 1
+        assert serializer.cache_hits == 0
+        assert serializer.cache_misses == 2
+
+    def test_prepare_output_type(self) -> None:
+        serializer = serializer_lib.PydanticSerializer()
+        client = inngest.Inngest(
+            app_id="app",
+            is_production=False,
+            serializer=serializer,
+        )
+
+        @client.create_function(
+            fn_id="fn",
+            output_type=_User,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> _User:
+            return _User(name="Alice")
+
+        # The adapter was built when the function was created.
+        client._deserialize({"name": "Alice"}, _User)
+        assert serializer.cache_hits == 1
+        assert serializer.cache_misses == 0
+
+
+class TestBufferSerializer(unittest.TestCase):
+    def test_bytes(self) -> None:
+        serializer = serializer_lib.BufferSerializer()
+
+        encoded = serializer.serialize(b"\x00\x01\x02", bytes)
+
+        # The encoded buffer survives a JSON round trip.
+        encoded = json.loads(json.dumps(encoded))
+        assert encoded == {"__BUFFER__": "bytes", "data": "AAEC"}
+        assert serializer.deserialize(encoded, bytes) == b"\x00\x01\x02"
+        assert serializer.deserialize(encoded, bytearray) == bytearray(
+            b"\x00\x01\x02"
+        )
+
+    def test_compression(self) -> None:
+        serializer = serializer_lib.BufferSerializer(compression_threshold=100)
+
+        small = serializer.serialize(b"a" * 10, bytes)
+        large = serializer.serialize(b"a" * 1_000, bytes)
+
+        assert isinstance(small, dict)
+        assert "compression" not in small
+        assert isinstance(large, dict)
+        assert large["compression"] == "zlib"
+        assert serializer.deserialize(large, bytes) == b"a" * 1_000
+
+    def test_fallback(self) -> None:
+        serializer = serializer_lib.BufferSerializer()
+
+        encoded = serializer.serialize(_User(name="Alice"), _User)
+
+        assert encoded == {"name": "Alice"}
+        assert serializer.deserialize(encoded, _User) == _User(name="Alice")
+
+    @unittest.skipIf(not _has_numpy, "numpy is not installed")
+    def test_ndarray(self) -> None:
+        serializer = serializer_lib.BufferSerializer(compression_threshold=0)
+        arr = numpy.arange(12, dtype=numpy.float32).reshape(3, 4)
+
+        # Slicing makes the array non-contiguous.
+        for value in [arr, arr[:, 1:3], numpy.array(1.5)]:
+            encoded = json.loads(
+                json.dumps(serializer.serialize(value, numpy.ndarray))
+            )
+            decoded = serializer.deserialize(encoded, numpy.ndarray)
+
+            assert isinstance(decoded, numpy.ndarray)
+            assert decoded.dtype == numpy.asarray(value).dtype
+            assert numpy.array_equal(decoded, value)
+
+    def test_step_output(self) -> None:
+        client = inngest.Inngest(
+            app_id="app",
+            is_production=False,
+            serializer=serializer_lib.BufferSerializer(),
+        )
+        outputs: list[object] = []
+
+        @client.create_function(
+            fn_id="fn",
+            retries=0,
+            trigger=inngest.TriggerEvent(event="app/fn"),
+        )
+        def fn(ctx: inngest.ContextSync) -> None:
+            outputs.append(
+                ctx.step.run("a", lambda: b"\x00\x01", output_type=bytes)
+            )
+
+        handler = comm_lib.CommHandler(
+            client=client,
+            framework=server_lib.Framework.FLASK,
+            functions=[fn],
+            streaming=None,
+        )
+
+        # The step's output is encoded in the response.
+        res = handler.post_sync(test_core.execution_request({}))
+        assert res.status_code == 206
+        assert isinstance(res.body, list)
+        encoded = res.body[0]["data"]
+        assert encoded == {"__BUFFER__": "bytes", "data": "AAE="}
+
+        # The memoized output is decoded on replay.
+        res = handler.post_sync(
+            test_core.execution_request(
+                {transforms.hash_step_id("a"): {"data": encoded}}
+            )
+        )
+        assert res.status_code == 200
+        assert outputs == [b"\x00\x01"]
@@ -15,7 +15,7 @@ from .consts import (
     ServerKind,
     SyncKind,
 )
-from .event import Event
+from .event import Event, EventLike, to_events
 from .execution_request import (
     ServerRequest,
     ServerRequestCtx,
@@ -57,6 +57,7 @@ __all__ = [
     "DeployType",
     "ErrorCode",
     "Event",
+    "EventLike",
     "Framework",
     "FunctionConfig",
     "HeaderKey",
@@ -88,4 +89,5 @@ __all__ = [
     "TriggerEvent",
     "UNSPECIFIED_STEP_ID",
     "UnauthenticatedInspection",
+    "to_events",
 ]
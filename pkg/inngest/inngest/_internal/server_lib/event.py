@@ -4,7 +4,7 @@ import typing
 
 import pydantic
 
-from inngest._internal import types
+from inngest._internal import errors, types
 
 
 class Event(types.BaseModel):
@@ -26,6 +26,92 @@ class Event(types.BaseModel):
 
         return v or {}
 
+    @classmethod
+    def from_json(cls, raw: object) -> types.MaybeError[Event]:
+        """
+        Create an event from already-parsed JSON. Only the envelope (id, name,
+        ts) is validated: anything a JSON parser produced is already valid
+        data, so recursively validating it would only cost time proportional
+        to the payload size. The data dict is used as-is (not copied).
+
+        Args:
+        ----
+            raw: A JSON object, as returned by a JSON parser.
+        """
+
+        if isinstance(raw, dict):
+            id_ = raw.get("id", "")
+            name = raw.get("name")
+            ts = raw.get("ts", 0)
+
+            # Fast path for the common case, since creating the envelope model
+            # costs as much as encoding a small event.
+            if type(id_) is str and type(name) is str and type(ts) is int:
+                return cls._from_envelope(raw, id_, name, ts)
+
+        envelope = _EventEnvelope.from_raw(raw)
+        if isinstance(envelope, Exception):
+            return envelope
+
+        # Safe to cast since the envelope validated that raw is a dict.
+        return cls._from_envelope(
+            typing.cast(dict[str, object], raw),
+            envelope.id,
+            envelope.name,
+            envelope.ts,
+        )
+
+    @classmethod
+    def _from_envelope(
+        cls,
+        raw: dict[str, object],
+        id_: str,
+        name: str,
+        ts: int,
+    ) -> types.MaybeError[Event]:
+        data = raw.get("data")
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            return errors.BodyInvalidError("event data must be an object")
+
+        return cls.model_construct(data=data, id=id_, name=name, ts=ts)
+
+
+class _EventEnvelope(types.BaseModel):
+    id: str = ""
+    name: str
+    ts: int = 0
+
 
 # Necessary because of the recursive JSON type
 Event.model_rebuild()
+
+
+# An event or a mapping with the same fields.
+EventLike = Event | typing.Mapping[str, object]
+
+
+def to_events(
+    raw: EventLike | typing.Sequence[EventLike],
+) -> types.MaybeError[list[Event]]:
+    """
+    Convert events and mappings to events. Only a mapping's envelope (id,
+    name, ts) is validated, like Event.from_json.
+    """
+
+    if isinstance(raw, (Event, typing.Mapping)):
+        raw = [raw]
+
+    events: list[Event] = []
+    for item in raw:
+        if isinstance(item, Event):
+            events.append(item)
+            continue
+
+        event = Event.from_json(item if isinstance(item, dict) else dict(item))
+        if isinstance(event, Exception):
+            return event
+        events.append(event)
+
+    return events
@@ -37,3 +37,30 @@ def test_data_invalid() -> None:
             ],
             name="foo",
         )
+
+
+def test_from_json() -> None:
+    data = {"foo": {"bar": [1, 2, 3]}}
+    event = Event.from_json(
+        {"data": data, "id": "abc", "name": "foo", "ts": 123, "v": "1"}
+    )
+    assert isinstance(event, Event)
+    assert event.id == "abc"
+    assert event.name == "foo"
+    assert event.ts == 123
+
+    # Data isn't copied.
+    assert event.data is data
+
+
+def test_from_json_data_null() -> None:
+    event = Event.from_json({"data": None, "name": "foo"})
+    assert isinstance(event, Event)
+    assert event.data == {}
+
+
+def test_from_json_invalid() -> None:
+    assert isinstance(Event.from_json({"data": {}}), Exception)
+    assert isinstance(Event.from_json({"name": 1}), Exception)
+    assert isinstance(Event.from_json({"data": [1], "name": "foo"}), Exception)
+    assert isinstance(Event.from_json([]), Exception)
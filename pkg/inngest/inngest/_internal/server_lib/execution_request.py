@@ -7,11 +7,37 @@ from .event import Event
 
 class ServerRequest(types.BaseModel):
     ctx: ServerRequestCtx
-    event: Event
-    events: list[Event] | None = None
+
+    # Events are kept as parsed JSON and only converted to Event objects when
+    # needed (see get_event and get_events). Fully validating every event's
+    # data is expensive for large payloads and batches, and the routing fields
+    # in ctx are all that's needed to dispatch the request.
+    event: dict[str, object]
+    events: list[dict[str, object]] | None = None
+
     steps: dict[str, object]
     use_api: bool
 
+    def get_event(self) -> types.MaybeError[Event]:
+        return Event.from_json(self.event)
+
+    def get_events(self) -> types.MaybeError[list[Event]] | None:
+        """
+        Returns None if the events aren't in the request (i.e. they need to be
+        fetched from the API).
+        """
+
+        if self.events is None:
+            return None
+
+        events = []
+        for raw in self.events:
+            event = Event.from_json(raw)
+            if isinstance(event, Exception):
+                return event
+            events.append(event)
+        return events
+
 
 class ServerRequestCtx(types.BaseModel):
     attempt: int
@@ -1,5 +1,6 @@
 from .base import (
     NestedStepInterrupt,
+    Output,
     ParsedStepID,
     ResponseInterrupt,
     SkipInterrupt,
@@ -7,14 +8,16 @@ from .base import (
     StepInfo,
     StepMemos,
     StepResponse,
+    unwrap_memo,
 )
-from .group import Group, GroupSync, in_parallel
+from .group import Group, GroupSync, in_parallel, run_concurrently
 from .step_async import Step
 from .step_sync import StepSync
 
 __all__ = [
     "Group",
     "NestedStepInterrupt",
+    "Output",
     "GroupSync",
     "ParsedStepID",
     "ResponseInterrupt",
@@ -26,4 +29,6 @@ __all__ = [
     "StepResponse",
     "StepSync",
     "in_parallel",
+    "run_concurrently",
+    "unwrap_memo",
 ]
@@ -8,6 +8,7 @@ import pydantic
 
 from inngest._internal import (
     client_lib,
+    errors,
     middleware_lib,
     server_lib,
     transforms,
@@ -38,46 +39,110 @@ class Output(types.BaseModel):
     error: MemoizedError | None = None
 
 
+def unwrap_memo(memo: Output) -> object:
+    """
+    Return a memo's data, or raise its error.
+    """
+
+    if memo.error is not None:
+        raise errors.StepError(
+            message=memo.error.message,
+            name=memo.error.name,
+            stack=memo.error.stack,
+        )
+    return memo.data
+
+
 class StepMemos:
-    """Holds memoized step output."""
+    """
+    Holds memoized step output. Memos are stored raw and only validated into
+    `Output` objects when they're needed.
+    """
 
     @property
     def size(self) -> int:
+        """
+        Number of memos that haven't been popped yet.
+        """
+
         return len(self._memos)
 
-    def __init__(self, memos: dict[str, Output]) -> None:
-        self._memos = memos
+    def __init__(self, memos: typing.Mapping[str, Output]) -> None:
+        # Values are either raw memos or already-validated Output objects.
+        self._memos: dict[str, object] = dict(memos)
+
+    def ids(self) -> frozenset[str]:
+        """
+        IDs of the memos that haven't been popped yet.
+        """
+
+        return frozenset(self._memos)
 
     def values(self) -> typing.Iterator[Output]:
-        return iter(self._memos.values())
+        # Validate all remaining memos since the caller (e.g. middleware) may
+        # mutate them. Popping returns the same, possibly mutated, objects.
+        for k, v in self._memos.items():
+            if not isinstance(v, Output):
+                self._memos[k] = _to_output(v)
 
-    def pop(self, hashed_id: str) -> Output | types.EmptySentinel:
-        if hashed_id in self._memos:
-            memo = self._memos[hashed_id]
+        return typing.cast(typing.Iterator[Output], iter(self._memos.values()))
 
-            # Remove memo
-            self._memos = {
-                k: v for k, v in self._memos.items() if k != hashed_id
-            }
+    def find(self, predicate: typing.Callable[[object], bool]) -> list[str]:
+        """
+        IDs of unpopped memos whose data matches the predicate. Doesn't
+        validate the memos.
+        """
 
-            return memo
+        return [k for k, v in self._memos.items() if predicate(_memo_data(v))]
 
-        return types.empty_sentinel
+    def update_data(
+        self,
+        hashed_id: str,
+        fn: typing.Callable[[object], object],
+    ) -> None:
+        """
+        Replace a memo's data with the result of calling fn with it.
+        """
+
+        memo = self._memos[hashed_id]
+        if isinstance(memo, Output):
+            memo.data = fn(memo.data)
+        elif isinstance(memo, dict):
+            # Copy since raw memos are shared with the request body.
+            self._memos[hashed_id] = {**memo, "data": fn(memo.get("data"))}
+
+    def pop(self, hashed_id: str) -> Output | types.EmptySentinel:
+        memo = self._memos.pop(hashed_id, types.empty_sentinel)
+        if isinstance(memo, types.EmptySentinel):
+            return memo
+        if isinstance(memo, Output):
+            return memo
+        return _to_output(memo)
 
     @classmethod
     def from_raw(cls, raw: dict[str, object]) -> StepMemos:
-        memos = {}
-        for k, v in raw.items():
-            output = Output.from_raw(v)
-            if isinstance(output, Exception):
-                # Not all steps nest their output in an Output-compatible object
-                # (i.e. they don't nest output in a data field). For example,
-                # `step.run` nests its output in a data field but
-                # `step.waitForEvent` will not nest its fulfilling event.
-                output = Output(data=v)
+        memos = cls({})
+        memos._memos = dict(raw)
+        return memos
+
+
+def _memo_data(memo: object) -> object:
+    if isinstance(memo, Output):
+        return memo.data
+    if isinstance(memo, dict):
+        return memo.get("data")
+    return None
+
 
-            memos[k] = output
-        return cls(memos)
+def _to_output(raw: object) -> Output:
+    output = Output.from_raw(raw)
+    if isinstance(output, Exception):
+        # Not all steps nest their output in an Output-compatible object (i.e.
+        # they don't nest output in a data field). For example, `step.run`
+        # nests its output in a data field but `step.waitForEvent` will not
+        # nest its fulfilling event.
+        output = Output(data=raw)
+    return output
 
 
 class StepBase:
@@ -125,6 +190,29 @@ class StepBase:
             index=(id_count - 1) if id_count > 1 else None,
         )
 
+    def _parse_step_ids(self, step_id: str, count: int) -> list[ParsedStepID]:
+        """
+        Parse a user-specified step ID that's used count times in a row. Same
+        as calling _parse_step_id count times, but only takes the counter's lock
+        once.
+        """
+
+        first = self._step_id_counter.reserve(step_id, count)
+        parsed: list[ParsedStepID] = []
+        for id_count in range(first, first + count):
+            pre_hashed = step_id
+            if id_count > 1:
+                pre_hashed = f"{step_id}:{id_count - 1}"
+
+            parsed.append(
+                ParsedStepID(
+                    hashed=transforms.hash_step_id(pre_hashed),
+                    user_facing=step_id,
+                    index=(id_count - 1) if id_count > 1 else None,
+                )
+            )
+        return parsed
+
 
 @dataclasses.dataclass
 class ParsedStepID:
@@ -157,6 +245,17 @@ class StepIDCounter:
             self._counts[hashed_id] += 1
             return self._counts[hashed_id]
 
+    def reserve(self, hashed_id: str, count: int) -> int:
+        """
+        Increment the count by count and return the first of the reserved
+        counts.
+        """
+
+        with self._mutex:
+            first = self._counts.get(hashed_id, 0) + 1
+            self._counts[hashed_id] = first + count - 1
+            return first
+
 
 class ResponseInterrupt(BaseException):
     """
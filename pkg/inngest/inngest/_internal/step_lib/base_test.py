@@ -0,0 +1,100 @@
+import unittest
+import unittest.mock
+
+from inngest._internal import types
+
+from .base import Output, StepBase, StepIDCounter, StepMemos
+
+
+class TestStepMemos(unittest.TestCase):
+    def test_pop(self) -> None:
+        memos = StepMemos.from_raw(
+            {
+                "a": {"data": 1},
+                "b": {"error": {"message": "oh no", "name": "Error"}},
+                "c": {"name": "app/event", "data": {}},
+                "d": None,
+            }
+        )
+        assert memos.size == 4
+
+        a = memos.pop("a")
+        assert isinstance(a, Output)
+        assert a.data == 1
+        assert memos.size == 3
+
+        b = memos.pop("b")
+        assert isinstance(b, Output)
+        assert b.error is not None
+        assert b.error.message == "oh no"
+
+        # Not nested in a data field.
+        c = memos.pop("c")
+        assert isinstance(c, Output)
+        assert c.data == {"name": "app/event", "data": {}}
+
+        d = memos.pop("d")
+        assert isinstance(d, Output)
+        assert d.data is None
+
+        assert memos.size == 0
+        assert memos.pop("a") is types.empty_sentinel
+
+    def test_lazy(self) -> None:
+        memos = StepMemos.from_raw({"a": {"data": 1}, "b": {"data": 2}})
+
+        with unittest.mock.patch.object(
+            Output,
+            "from_raw",
+            wraps=Output.from_raw,
+        ) as from_raw:
+            memos.pop("a")
+            from_raw.assert_called_once_with({"data": 1})
+
+    def test_values_mutation(self) -> None:
+        """
+        Mutations made while iterating over values (e.g. by middleware) are
+        visible when the memo is popped.
+        """
+
+        memos = StepMemos.from_raw({"a": {"data": 1}, "b": {"data": 2}})
+        memos.pop("a")
+
+        values = list(memos.values())
+        assert len(values) == 1
+        for v in values:
+            v.data = "changed"
+
+        b = memos.pop("b")
+        assert isinstance(b, Output)
+        assert b.data == "changed"
+
+
+class TestParseStepIDs(unittest.TestCase):
+    def test_same_as_reused_step_id(self) -> None:
+        """
+        Parsing a step ID N times at once is the same as parsing it N times in
+        a row.
+        """
+
+        looped = StepBase(
+            unittest.mock.Mock(),
+            unittest.mock.Mock(),
+            StepIDCounter(),
+            None,
+        )
+        batched = StepBase(
+            unittest.mock.Mock(),
+            unittest.mock.Mock(),
+            StepIDCounter(),
+            None,
+        )
+
+        expected = [looped._parse_step_id("a") for _ in range(5)]
+        actual = [
+            batched._parse_step_id("a"),
+            *batched._parse_step_ids("a", 3),
+            batched._parse_step_id("a"),
+        ]
+        assert actual == expected
+        assert [p.index for p in actual] == [None, 1, 2, 3, 4]
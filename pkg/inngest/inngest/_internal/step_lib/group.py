@@ -1,19 +1,29 @@
+import asyncio
+import concurrent.futures
+import contextlib
 import contextvars
+import threading
 import typing
 
-from inngest._internal import server_lib, types
+from inngest._internal import server_lib, transforms, types
 
 from .base import ResponseInterrupt, SkipInterrupt, StepResponse
 
 # Create a context variable to track if we're in a parallel group.
 in_parallel = contextvars.ContextVar("in_parallel", default=False)
 
+# Create a context variable to track if new step.run calls in a parallel group
+# should run in the current request instead of being planned.
+run_concurrently = contextvars.ContextVar("run_concurrently", default=False)
+
 
 class Group:
     async def parallel(
         self,
         callables: tuple[typing.Callable[[], typing.Awaitable[types.T]], ...],
         parallel_mode: server_lib.ParallelMode = server_lib.ParallelMode.WAIT,
+        *,
+        concurrency: int | None = None,
     ) -> tuple[types.T, ...]:
         """
         Run multiple steps in parallel.
@@ -22,30 +32,24 @@ class Group:
         ----
             callables: An arbitrary number of step callbacks to run. These are callables that contain the step (e.g. `lambda: step.run("my_step", my_step_fn)`.
             parallel_mode: Execution mode. Defaults to `ParallelMode.WAIT`
+            concurrency: Run new step.run calls concurrently in the current request, at most this many at a time, instead of planning a separate request for each. Their outputs and errors are reported together. Step IDs should be unique within the group since concurrent steps are discovered in a nondeterministic order.
         """
 
+        _validate_concurrency(concurrency)
+
         token = in_parallel.set(True)
 
         try:
-            outputs = tuple[types.T]()
-            responses: list[StepResponse] = []
-
             # Discover steps in callables.
-            for cb in callables:
-                try:
-                    output = await cb()
-                    outputs = (*outputs, output)
-                except ResponseInterrupt as interrupt:
-                    responses = [*responses, *interrupt.responses]
-                except SkipInterrupt:
-                    pass
+            results = await _discover(callables, concurrency)
+            outputs, responses, _ = _unpack(results)
 
             if len(responses) > 0:
                 for r in responses:
                     r.step.set_parallel_mode(parallel_mode)
                 raise ResponseInterrupt(responses)
 
-            return outputs
+            return tuple(outputs)
         finally:
             # No longer tell steps that they're running in parallel.
             in_parallel.reset(token)
@@ -56,6 +60,8 @@ class GroupSync:
         self,
         callables: tuple[typing.Callable[[], types.T], ...],
         parallel_mode: server_lib.ParallelMode = server_lib.ParallelMode.WAIT,
+        *,
+        concurrency: int | None = None,
     ) -> tuple[types.T, ...]:
         """
         Run multiple steps in parallel in a synchronous context (e.g. not asyncio).
@@ -64,31 +70,303 @@ class GroupSync:
         ----
             callables: An arbitrary number of step callbacks to run. These are callables that contain the step (e.g. `lambda: step.run("my_step", my_step_fn)`.
             parallel_mode: Execution mode. Defaults to `ParallelMode.WAIT`
+            concurrency: Run new step.run calls concurrently in the current request, using at most this many threads, instead of planning a separate request for each. Their outputs and errors are reported together. Step IDs should be unique within the group since concurrent steps are discovered in a nondeterministic order.
         """
 
+        _validate_concurrency(concurrency)
+
         # Tell steps that they're running in parallel.
         token = in_parallel.set(True)
 
         try:
-            outputs = tuple[types.T]()
-            responses: list[StepResponse] = []
-
-            # Discover steps in callables.
-            for cb in callables:
-                try:
-                    output = cb()
-                    outputs = (*outputs, output)
-                except ResponseInterrupt as interrupt:
-                    responses = [*responses, *interrupt.responses]
-                except SkipInterrupt:
-                    pass
+            with _thread_pool(concurrency, len(callables)) as pool:
+                # Discover steps in callables.
+                results = _discover_sync(callables, pool)
+            outputs, responses, _ = _unpack(results)
 
             if len(responses) > 0:
                 for r in responses:
                     r.step.set_parallel_mode(parallel_mode)
                 raise ResponseInterrupt(responses)
 
-            return outputs
+            return tuple(outputs)
         finally:
             # No longer tell steps that they're running in parallel.
             in_parallel.reset(token)
+
+
+async def map_chunks(
+    step_id: str,
+    callables: typing.Sequence[typing.Callable[[], typing.Awaitable[types.T]]],
+    chunk_size: int,
+    concurrency: int | None,
+    max_chunk_bytes: int | None,
+) -> list[types.T]:
+    """
+    Run callables as a parallel group, one chunk at a time. Stops at the first
+    chunk with new steps, so that a single response has at most chunk_size
+    steps. Later chunks are reached by later requests, once the earlier chunks
+    are memoized. Within a chunk, no more steps are started once the reported
+    outputs reach max_chunk_bytes.
+    """
+
+    _validate_chunk_size(chunk_size)
+    _validate_concurrency(concurrency)
+    budget = _OutputBudget(max_chunk_bytes)
+
+    token = in_parallel.set(True)
+
+    try:
+        outputs: list[types.T] = []
+        is_complete = True
+        for start in range(0, len(callables), chunk_size):
+            results = await _discover(
+                callables[start : start + chunk_size],
+                concurrency,
+                budget,
+            )
+            chunk_outputs, responses, is_chunk_complete = _unpack(results)
+            if len(responses) > 0:
+                raise ResponseInterrupt(responses)
+
+            outputs.extend(chunk_outputs)
+            is_complete = is_complete and is_chunk_complete
+
+        if not is_complete:
+            # Some steps were skipped because a different step is targeted.
+            raise SkipInterrupt(step_id)
+
+        return outputs
+    finally:
+        in_parallel.reset(token)
+
+
+def map_chunks_sync(
+    step_id: str,
+    callables: typing.Sequence[typing.Callable[[], types.T]],
+    chunk_size: int,
+    concurrency: int | None,
+    max_chunk_bytes: int | None,
+) -> list[types.T]:
+    """
+    Run callables as a parallel group, one chunk at a time. Stops at the first
+    chunk with new steps, so that a single response has at most chunk_size
+    steps. Later chunks are reached by later requests, once the earlier chunks
+    are memoized. Within a chunk, no more steps are started once the reported
+    outputs reach max_chunk_bytes.
+    """
+
+    _validate_chunk_size(chunk_size)
+    _validate_concurrency(concurrency)
+    budget = _OutputBudget(max_chunk_bytes)
+
+    token = in_parallel.set(True)
+
+    try:
+        outputs: list[types.T] = []
+        is_complete = True
+        with _thread_pool(concurrency, min(chunk_size, len(callables))) as pool:
+            for start in range(0, len(callables), chunk_size):
+                results = _discover_sync(
+                    callables[start : start + chunk_size],
+                    pool,
+                    budget,
+                )
+                chunk_outputs, responses, is_chunk_complete = _unpack(results)
+                if len(responses) > 0:
+                    raise ResponseInterrupt(responses)
+
+                outputs.extend(chunk_outputs)
+                is_complete = is_complete and is_chunk_complete
+
+        if not is_complete:
+            # Some steps were skipped because a different step is targeted.
+            raise SkipInterrupt(step_id)
+
+        return outputs
+    finally:
+        in_parallel.reset(token)
+
+
+# A callable's output, or the responses it was interrupted with. Neither is
+# set when the callable was skipped.
+_Result = tuple[types.T | types.EmptySentinel, list[StepResponse]]
+
+
+class _OutputBudget:
+    """
+    Tracks the size of the step outputs reported by a map. Thread-safe.
+    """
+
+    def __init__(self, max_bytes: int | None) -> None:
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_chunk_bytes must be at least 1")
+
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._used_bytes = 0
+
+    def is_spent(self) -> bool:
+        if self._max_bytes is None:
+            return False
+        with self._lock:
+            return self._used_bytes >= self._max_bytes
+
+    def add(self, responses: list[StepResponse]) -> None:
+        if self._max_bytes is None:
+            return
+
+        size = 0
+        for r in responses:
+            if r.output is None:
+                # E.g. planned steps.
+                continue
+
+            dumped = transforms.dump_json(r.output)
+            if isinstance(dumped, Exception):
+                # Reported as an error when the response is sent.
+                continue
+            size += len(dumped)
+
+        with self._lock:
+            self._used_bytes += size
+
+
+def _validate_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+
+def _validate_concurrency(concurrency: int | None) -> None:
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def _unpack(
+    results: list[_Result[types.T] | BaseException],
+) -> tuple[list[types.T], list[StepResponse], bool]:
+    """
+    Returns the outputs, the responses, and whether every callable returned.
+    """
+
+    outputs: list[types.T] = []
+    responses: list[StepResponse] = []
+    is_complete = True
+    for result in results:
+        if isinstance(result, BaseException):
+            # Same as running sequentially, where the first error stops the
+            # group.
+            raise result
+
+        output, interrupted = result
+        if isinstance(output, types.EmptySentinel):
+            is_complete = False
+        else:
+            outputs.append(output)
+        responses.extend(interrupted)
+
+    return outputs, responses, is_complete
+
+
+async def _discover(
+    callables: typing.Sequence[typing.Callable[[], typing.Awaitable[types.T]]],
+    concurrency: int | None,
+    budget: _OutputBudget | None = None,
+) -> list[_Result[types.T] | BaseException]:
+    async def call(
+        cb: typing.Callable[[], typing.Awaitable[types.T]],
+    ) -> _Result[types.T]:
+        if budget is not None and budget.is_spent():
+            # Left for a later request.
+            return types.empty_sentinel, []
+
+        try:
+            return await cb(), []
+        except ResponseInterrupt as interrupt:
+            if budget is not None:
+                budget.add(interrupt.responses)
+            return types.empty_sentinel, interrupt.responses
+        except SkipInterrupt:
+            return types.empty_sentinel, []
+
+    if concurrency is None:
+        return [await call(cb) for cb in callables]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call_bounded(
+        cb: typing.Callable[[], typing.Awaitable[types.T]],
+    ) -> _Result[types.T]:
+        async with semaphore:
+            return await call(cb)
+
+    # Tasks copy the current context when they're created.
+    token = run_concurrently.set(True)
+    try:
+        return await asyncio.gather(
+            *(call_bounded(cb) for cb in callables),
+            return_exceptions=True,
+        )
+    finally:
+        run_concurrently.reset(token)
+
+
+def _discover_sync(
+    callables: typing.Sequence[typing.Callable[[], types.T]],
+    pool: concurrent.futures.ThreadPoolExecutor | None,
+    budget: _OutputBudget | None = None,
+) -> list[_Result[types.T] | BaseException]:
+    def call(cb: typing.Callable[[], types.T]) -> _Result[types.T]:
+        if budget is not None and budget.is_spent():
+            # Left for a later request.
+            return types.empty_sentinel, []
+
+        try:
+            return cb(), []
+        except ResponseInterrupt as interrupt:
+            if budget is not None:
+                budget.add(interrupt.responses)
+            return types.empty_sentinel, interrupt.responses
+        except SkipInterrupt:
+            return types.empty_sentinel, []
+
+    if pool is None:
+        return [call(cb) for cb in callables]
+
+    token = run_concurrently.set(True)
+    try:
+        # Each thread needs its own copy of the context.
+        futures = [
+            pool.submit(contextvars.copy_context().run, call, cb)
+            for cb in callables
+        ]
+    finally:
+        run_concurrently.reset(token)
+
+    results: list[_Result[types.T] | BaseException] = []
+    for future in futures:
+        err = future.exception()
+        results.append(err if err is not None else future.result())
+    return results
+
+
+@contextlib.contextmanager
+def _thread_pool(
+    concurrency: int | None,
+    size: int,
+) -> typing.Iterator[concurrent.futures.ThreadPoolExecutor | None]:
+    """
+    A dedicated pool rather than the handler's thread pool, since the handler
+    may be running in one of its threads and waiting on a full pool would
+    deadlock.
+    """
+
+    if concurrency is None:
+        yield None
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(min(concurrency, size), 1),
+        thread_name_prefix="inngest-parallel",
+    ) as pool:
+        yield pool
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+import unittest
+
+import inngest
+from inngest.experimental import mocked
+
+client = inngest.Inngest(app_id="my-app", is_production=False)
+client_mock = mocked.Inngest(app_id="test")
+
+
+class _Tracker:
+    """
+    Tracks how many steps run at the same time.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._running = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self._running += 1
+            self.peak = max(self.peak, self._running)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._running -= 1
+
+
+class TestGroupConcurrency(unittest.TestCase):
+    def test_async(self) -> None:
+        tracker = _Tracker()
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        async def fn(ctx: inngest.Context) -> tuple[int, ...]:
+            nonlocal handler_calls
+            handler_calls += 1
+
+            async def work(value: int) -> int:
+                tracker.start()
+                await asyncio.sleep(0.02)
+                tracker.stop()
+                return value
+
+            return await ctx.group.parallel(
+                tuple(
+                    functools.partial(ctx.step.run, f"step-{i}", work, i)
+                    for i in range(5)
+                ),
+                concurrency=2,
+            )
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.status is mocked.Status.COMPLETED
+        assert res.output == (0, 1, 2, 3, 4)
+
+        # Every step ran in the first request, and the second request returned.
+        assert handler_calls == 2
+        assert tracker.calls == 5
+        assert tracker.peak == 2
+
+    def test_sync(self) -> None:
+        tracker = _Tracker()
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        def fn(ctx: inngest.ContextSync) -> tuple[int, ...]:
+            nonlocal handler_calls
+            handler_calls += 1
+
+            def work(value: int) -> int:
+                tracker.start()
+                time.sleep(0.02)
+                tracker.stop()
+                return value
+
+            return ctx.group.parallel(
+                tuple(
+                    functools.partial(ctx.step.run, f"step-{i}", work, i)
+                    for i in range(5)
+                ),
+                concurrency=3,
+            )
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.status is mocked.Status.COMPLETED
+        assert res.output == (0, 1, 2, 3, 4)
+        assert handler_calls == 2
+        assert tracker.calls == 5
+        assert tracker.peak == 3
+
+    def test_planned_by_default(self) -> None:
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        def fn(ctx: inngest.ContextSync) -> tuple[str, ...]:
+            nonlocal handler_calls
+            handler_calls += 1
+
+            return ctx.group.parallel(
+                tuple(
+                    functools.partial(ctx.step.run, f"step-{i}", str, i)
+                    for i in range(5)
+                ),
+            )
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.output == ("0", "1", "2", "3", "4")
+
+        # 1 request to plan, 1 per step, and 1 to return.
+        assert handler_calls == 7
+
+
+class TestMap(unittest.TestCase):
+    def test_async(self) -> None:
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        async def fn(ctx: inngest.Context) -> list[int]:
+            nonlocal handler_calls
+            handler_calls += 1
+
+            async def double(value: int) -> int:
+                await asyncio.sleep(0)
+                return value * 2
+
+            return await ctx.step.map(
+                "double",
+                double,
+                range(10),
+                chunk_size=4,
+                concurrency=2,
+            )
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.status is mocked.Status.COMPLETED
+        assert res.output == [i * 2 for i in range(10)]
+
+        # 1 request per chunk and 1 to return.
+        assert handler_calls == 4
+
+    def test_sync_planned(self) -> None:
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        def fn(ctx: inngest.ContextSync) -> list[str]:
+            nonlocal handler_calls
+            handler_calls += 1
+            return ctx.step.map("str", str, range(10), chunk_size=4)
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.status is mocked.Status.COMPLETED
+        assert res.output == [str(i) for i in range(10)]
+
+        # Each chunk is planned by 1 request and run by 1 request per step.
+        # Then 1 request to return.
+        assert handler_calls == (1 + 4) + (1 + 4) + (1 + 2) + 1
+
+    def test_max_chunk_bytes(self) -> None:
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        async def fn(ctx: inngest.Context) -> list[str]:
+            nonlocal handler_calls
+            handler_calls += 1
+
+            async def pad(value: int) -> str:
+                return str(value) * 1_000
+
+            return await ctx.step.map(
+                "pad",
+                pad,
+                range(6),
+                chunk_size=10,
+                concurrency=1,
+                max_chunk_bytes=2_500,
+            )
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.status is mocked.Status.COMPLETED
+        assert res.output == [str(i) * 1_000 for i in range(6)]
+
+        # Each request stops starting steps once 3 outputs (about 3 KB) are
+        # reported. Then 1 request to return.
+        assert handler_calls == 3
+
+    def test_max_chunk_bytes_sync(self) -> None:
+        handler_calls = 0
+
+        @client.create_function(
+            fn_id="test",
+            trigger=inngest.TriggerEvent(event="test"),
+        )
+        def fn(ctx: inngest.ContextSync) -> list[str]:
+            nonlocal handler_calls
+            handler_calls += 1
+            return ctx.step.map(
+                "pad",
+                lambda value: str(value) * 1_000,
+                range(6),
+                chunk_size=10,
+                concurrency=1,
+                max_chunk_bytes=2_500,
+            )
+
+        res = mocked.trigger(fn, inngest.Event(name="test"), client_mock)
+        assert res.status is mocked.Status.COMPLETED
+        assert res.output == [str(i) * 1_000 for i in range(6)]
+        assert handler_calls == 3
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import typing
 
 import typing_extensions
@@ -8,7 +9,7 @@ import typing_extensions
 from inngest._internal import errors, server_lib, transforms, types
 from inngest._internal.client_lib import models as client_models
 
-from . import base
+from . import base, group
 
 # Avoid circular import at runtime
 if typing.TYPE_CHECKING:
@@ -114,6 +115,9 @@ class StepSync(base.StepBase):
             app_id = self._client.app_id
 
         parsed_step_id = self._parse_step_id(step_id)
+        memo = self._execution.report_memoized_step(parsed_step_id.hashed)
+        if memo is not None:
+            return base.unwrap_memo(memo)
 
         timeout_str = transforms.to_maybe_duration_str(timeout)
         if isinstance(timeout_str, Exception):
@@ -170,7 +174,74 @@ class StepSync(base.StepBase):
             output_type: Only set if returning a non-JSON-serializable object. Related to the client's serializer argument.
         """
 
-        parsed_step_id = self._parse_step_id(step_id)
+        return self._run(
+            self._parse_step_id(step_id),
+            handler,
+            handler_args,
+            output_type,
+        )
+
+    def map(
+        self,
+        step_id: str,
+        handler: typing.Callable[[types.TItem], types.T],
+        items: typing.Iterable[types.TItem],
+        *,
+        chunk_size: int = 100,
+        concurrency: int | None = None,
+        max_chunk_bytes: int | None = 4 * 1024 * 1024,
+        output_type: object = types.EmptySentinel,
+    ) -> list[types.T]:
+        """
+        Run a step for each item, in parallel. Returns the outputs in the same
+        order as the items.
+
+        Each item's step uses the step ID with its index appended, the same as
+        calling step.run with the same step ID in a loop.
+
+        Args:
+        ----
+            step_id: Durable step ID. Should usually be unique within a function, but it's OK to reuse as long as your function is deterministic.
+            handler: The logic to run for each item. This MUST return a JSON-serializable value (i.e. can be passed to `json.dumps`).
+            items: Items to pass to the handler. Must be the same on every request, like everything else that determines which steps run.
+            chunk_size: Maximum number of new steps to report at once. Larger chunks need fewer requests but make larger responses.
+            concurrency: Run new steps concurrently in the current request, at most this many at a time, instead of planning a separate request for each.
+            max_chunk_bytes: Stop starting new steps in a chunk once the outputs reported in the current request reach this many bytes (as JSON). The rest run in later requests. Steps that already started are still reported, so with concurrency a response can exceed this by up to concurrency - 1 outputs. None disables the limit.
+            output_type: Only set if returning a non-JSON-serializable object. Related to the client's serializer argument.
+        """
+
+        items = list(items)
+        callables = [
+            functools.partial(
+                self._run, parsed_step_id, handler, (item,), output_type
+            )
+            for parsed_step_id, item in zip(
+                self._parse_step_ids(step_id, len(items)), items
+            )
+        ]
+        return group.map_chunks_sync(
+            step_id,
+            callables,
+            chunk_size,
+            concurrency,
+            max_chunk_bytes,
+        )
+
+    def _run(
+        self,
+        parsed_step_id: base.ParsedStepID,
+        handler: typing.Callable[
+            [typing_extensions.Unpack[types.TTuple]],
+            types.T,
+        ],
+        handler_args: tuple[typing_extensions.Unpack[types.TTuple]],
+        output_type: object,
+    ) -> types.T:
+        memo = self._execution.report_memoized_step(parsed_step_id.hashed)
+        if memo is not None:
+            return self._client._deserialize(
+                base.unwrap_memo(memo), output_type
+            )  # type: ignore[return-value]
 
         step_info = base.StepInfo(
             display_name=parsed_step_id.user_facing,
@@ -191,13 +262,6 @@ class StepSync(base.StepBase):
             try:
                 output = handler(*handler_args)
                 output = self._client._serialize(output, output_type)  # type: ignore[assignment]
-
-                raise base.ResponseInterrupt(
-                    base.StepResponse(
-                        output=output,
-                        step=step_info,
-                    )
-                )
             except (errors.NonRetriableError, errors.RetryAfterError) as err:
                 # Bubble up these error types to the function level
                 raise err
@@ -232,6 +296,12 @@ class StepSync(base.StepBase):
                     )
                 )
 
+            response = base.StepResponse(output=output, step=step_info)
+            memo = self._execution.checkpoint(response)
+            if memo is None:
+                raise base.ResponseInterrupt(response)
+            return self._client._deserialize(memo.data, output_type)  # type: ignore[return-value]
+
     def send_event(
         self,
         step_id: str,
@@ -332,6 +402,9 @@ class StepSync(base.StepBase):
         """
 
         parsed_step_id = self._parse_step_id(step_id)
+        memo = self._execution.report_memoized_step(parsed_step_id.hashed)
+        if memo is not None:
+            return base.unwrap_memo(memo)  # type: ignore
 
         step_info = base.StepInfo(
             display_name=parsed_step_id.user_facing,
@@ -371,6 +444,15 @@ class StepSync(base.StepBase):
         """
 
         parsed_step_id = self._parse_step_id(step_id)
+        memo = self._execution.report_memoized_step(parsed_step_id.hashed)
+        if memo is not None:
+            output = base.unwrap_memo(memo)
+            if output is None:
+                # Timeout
+                return None
+
+            # Fulfilled by an event
+            return server_lib.Event.model_validate(output)
 
         timeout_str = transforms.to_duration_str(timeout)
         if isinstance(timeout_str, Exception):
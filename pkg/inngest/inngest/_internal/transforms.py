@@ -1,14 +1,16 @@
 import datetime
+import functools
 import hashlib
 import inspect
-import json
 import re
 import traceback
 import typing
 
 import jcs
 
-from inngest._internal import errors, server_lib, types
+from inngest._internal import errors, json_lib, server_lib, types
+
+_stdlib_json_codec = json_lib.StdlibJSONCodec()
 
 
 def get_traceback(err: Exception) -> str:
@@ -27,23 +29,56 @@ def hash_signing_key(key: str) -> str:
     ).hexdigest()
 
 
+# Replays hash the same step IDs on every request.
+@functools.lru_cache(maxsize=10_000)
 def hash_step_id(step_id: str) -> str:
     return hashlib.sha1(step_id.encode("utf-8")).hexdigest()  # noqa: S324
 
 
-def dump_json(obj: object) -> types.MaybeError[str]:
+def dump_json(
+    obj: object,
+    codec: json_lib.JSONCodec | None = None,
+) -> types.MaybeError[bytes]:
+    if codec is None:
+        codec = json_lib.default_codec()
+
     try:
-        return json.dumps(obj)
+        return codec.dumps(obj)
     except Exception as err:
         return errors.OutputUnserializableError(str(err))
 
 
-def canonicalize(value: bytes) -> types.MaybeError[bytes]:
+def load_json(
+    value: str | bytes,
+    codec: json_lib.JSONCodec | None = None,
+) -> types.MaybeError[object]:
+    if codec is None:
+        codec = json_lib.default_codec()
+
+    try:
+        return codec.loads(value)
+    except Exception as err:
+        return err
+
+
+def canonicalize(
+    value: bytes,
+    *,
+    loaded: object = types.empty_sentinel,
+) -> types.MaybeError[bytes]:
+    """
+    Canonicalize JSON bytes. If the caller already parsed the bytes, pass the
+    result as `loaded` to avoid parsing them again. The parse must be exact
+    (e.g. no integers decoded as floats), so this always uses the standard
+    library.
+    """
+
     if len(value) == 0:
         return value
 
     try:
-        loaded = json.loads(value)
+        if loaded is types.empty_sentinel:
+            loaded = _stdlib_json_codec.loads(value)
         value_jcs = jcs.canonicalize(loaded)
         if not isinstance(value_jcs, bytes):
             return Exception("failed to canonicalize")
@@ -130,6 +165,18 @@ def to_maybe_duration_str(
     return to_duration_str(ms)
 
 
+def to_seconds(value: int | datetime.timedelta | None) -> float | None:
+    """
+    Convert a duration option (int value is in ms) to seconds.
+    """
+
+    if isinstance(value, int):
+        return value / 1000  # convert ms to s
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    return None
+
+
 def to_iso_utc(value: datetime.datetime) -> str:
     return (
         value.astimezone(datetime.timezone.utc).strftime(
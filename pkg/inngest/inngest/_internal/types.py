@@ -13,6 +13,7 @@ else:
     Logger = object
 
 T = typing.TypeVar("T")
+TItem = typing.TypeVar("TItem")
 TTuple = typing_extensions.TypeVarTuple("TTuple")
 
 
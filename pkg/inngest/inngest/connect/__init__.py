@@ -9,7 +9,7 @@ in a long-lived process. If you're using a serverless platform, you should use
 our "serve" functions instead.
 """
 
-from ._internal.connect import connect
+from ._internal.connect import connect, serve_multiprocess
 from ._internal.models import ConnectionState
 
-__all__ = ["connect", "ConnectionState"]
+__all__ = ["connect", "ConnectionState", "serve_multiprocess"]
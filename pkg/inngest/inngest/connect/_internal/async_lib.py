@@ -35,3 +35,20 @@ def run_sync(
         return asyncio.run_coroutine_threadsafe(coro, loop)
     except RuntimeError as e:
         return e
+
+
+def shutdown_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Cancel all remaining tasks on the loop and close it. Called from the
+    loop's thread after it stops running.
+    """
+
+    try:
+        pending = asyncio.all_tasks(loop)
+        for t in pending:
+            t.cancel()
+
+        # Closes the loop's HTTP client.
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
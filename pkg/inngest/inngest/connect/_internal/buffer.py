@@ -3,11 +3,18 @@ import dataclasses
 import time
 import typing
 
+from .journal import ReplyJournal
+
 
 @dataclasses.dataclass
 class _BufferItem:
-    data: bytes
+    # None when the item was evicted from memory but is still in the journal.
+    data: bytes | None
+
     id: str
+    size: int
+
+    # Monotonic time when the item was added.
     timestamp: float
 
 
@@ -22,6 +29,9 @@ class SizeConstrainedBuffer:
         - Maximum size enforcement: Oldest items are evicted when full
         - Timestamp tracking: Items can be retrieved by age for TTL-based flushing
         - O(1) add/delete/get operations using OrderedDict
+        - Optional journal: Items are also appended to a memory-mapped file.
+          Items evicted from memory stay in the journal, and items left in the
+          journal by a previous process are loaded when the buffer is created
 
     Used by _ExecutionHandler to implement reliable message delivery even
     across connection interruptions.
@@ -32,6 +42,7 @@ class SizeConstrainedBuffer:
         max_size_bytes: int,
         on_evict: typing.Callable[[str], None] | None = None,
         on_reject: typing.Callable[[str], None] | None = None,
+        journal: ReplyJournal | None = None,
     ):
         """
         Initialize the buffer with a maximum size constraint.
@@ -40,61 +51,104 @@ class SizeConstrainedBuffer:
             max_size_bytes: Maximum total size of all items' data.
             on_evict: Existing item is evicted to make room for a new one.
             on_reject: New item is rejected because it exceeds the max buffer size by itself.
+            journal: Journal that items are also written to.
         """
 
+        # Size of the items held in memory.
         self._current_size = 0
+
+        # All items, oldest first.
         self._items: collections.OrderedDict[str, _BufferItem] = (
             collections.OrderedDict()
         )
+
+        # IDs of the items held in memory, oldest first.
+        self._resident: collections.OrderedDict[str, None] = (
+            collections.OrderedDict()
+        )
+
+        self._journal = journal
         self._on_evict = on_evict
         self._on_reject = on_reject
+        self._replayed: list[str] = []
 
         self._max_size_bytes = max_size_bytes
         if self._max_size_bytes <= 0:
             raise ValueError("max_size_bytes must be greater than 0")
 
+        if journal is not None:
+            # Convert the journal's wall-clock timestamps to monotonic time.
+            offset = time.monotonic() - time.time()
+            for journal_item in journal.replayed():
+                self._items[journal_item.id] = _BufferItem(
+                    data=None,
+                    id=journal_item.id,
+                    size=len(journal_item.data),
+                    timestamp=journal_item.timestamp + offset,
+                )
+                self._replayed.append(journal_item.id)
+
     def add(self, item_id: str, data: bytes) -> bool:
         """
         Add item to buffer. If adding would exceed size limit, evicts oldest
         items until there is enough space. Returns True if item was added
         successfully. If the item is larger than the max size, it is not added
-        to the buffer.
+        to the buffer (unless it fits in the journal).
         """
 
         item_size = len(data)
 
+        # Remove existing item with same ID if it exists.
+        self.delete(item_id)
+
+        journaled = self._journal is not None and self._journal.append(
+            item_id, data
+        )
+
         if item_size > self._max_size_bytes:
+            if journaled:
+                # Only keep it in the journal.
+                self._items[item_id] = _BufferItem(
+                    data=None,
+                    id=item_id,
+                    size=item_size,
+                    timestamp=time.monotonic(),
+                )
+                return True
+
             if self._on_reject is not None:
                 self._on_reject(item_id)
             return False
 
-        # Remove existing item with same ID if it exists.
-        if item_id in self._items:
-            self._current_size -= len(self._items[item_id].data)
-            del self._items[item_id]
-
         # If adding would exceed limit, evict oldest items until there's enough
         # space.
         while (
             self._current_size + item_size > self._max_size_bytes
-            and self._items
+            and self._resident
         ):
-            # Remove oldest item.
-            _, oldest_item = self._items.popitem(last=False)
-            self._current_size -= len(oldest_item.data)
-            if self._on_evict is not None:
-                self._on_evict(oldest_item.id)
+            self._evict_oldest()
 
         # Add new item.
         item = _BufferItem(
             data=data,
             id=item_id,
-            timestamp=time.time(),
+            size=item_size,
+            timestamp=time.monotonic(),
         )
         self._items[item_id] = item
+        self._resident[item_id] = None
         self._current_size += item_size
         return True
 
+    def close(self) -> None:
+        """
+        Close the journal. Its items are loaded by the next buffer that opens
+        it.
+        """
+
+        if self._journal is not None:
+            self._journal.close()
+
     def get(self, item_id: str) -> bytes | None:
         """
         Get item by ID without removing it.
@@ -103,19 +157,23 @@ class SizeConstrainedBuffer:
         item = self._items.get(item_id)
         if item is None:
             return None
-        return item.data
+        return self._read(item)
 
     def delete(self, item_id: str) -> bool:
         """
         Delete item by ID. Returns True if item was found and deleted.
         """
 
-        if item_id not in self._items:
+        if self._journal is not None:
+            self._journal.delete(item_id)
+
+        item = self._items.pop(item_id, None)
+        if item is None:
             return False
 
-        item = self._items[item_id]
-        self._current_size -= len(item.data)
-        del self._items[item_id]
+        if item.data is not None:
+            self._current_size -= item.size
+            del self._resident[item_id]
         return True
 
     def get_older_than(self, seconds: float) -> list[tuple[str, bytes]]:
@@ -123,11 +181,52 @@ class SizeConstrainedBuffer:
         Get all items that were inserted at least `seconds` ago.
         """
 
-        cutoff_time = time.time() - seconds
+        cutoff_time = time.monotonic() - seconds
         result = []
 
+        # Items are ordered by insertion time, so stop at the first item
+        # that's too new.
         for item in self._items.values():
-            if item.timestamp <= cutoff_time:
-                result.append((item.id, item.data))
+            if item.timestamp > cutoff_time:
+                break
+
+            data = self._read(item)
+            if data is not None:
+                result.append((item.id, data))
 
         return result
+
+    def pop_replayed(self) -> list[tuple[str, bytes]]:
+        """
+        Get the items that were loaded from the journal when the buffer was
+        created. Only returns them once.
+        """
+
+        result = []
+        for item_id in self._replayed:
+            data = self.get(item_id)
+            if data is not None:
+                result.append((item_id, data))
+        self._replayed = []
+        return result
+
+    def _evict_oldest(self) -> None:
+        item_id, _ = self._resident.popitem(last=False)
+        item = self._items[item_id]
+        self._current_size -= item.size
+
+        if self._journal is not None and item_id in self._journal:
+            # Still in the journal, so it isn't lost.
+            item.data = None
+            return
+
+        del self._items[item_id]
+        if self._on_evict is not None:
+            self._on_evict(item_id)
+
+    def _read(self, item: _BufferItem) -> bytes | None:
+        if item.data is not None:
+            return item.data
+        if self._journal is None:
+            return None
+        return self._journal.read(item.id)
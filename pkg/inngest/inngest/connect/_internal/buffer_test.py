@@ -1,4 +1,9 @@
+import os
+import tempfile
+import time
+
 from .buffer import SizeConstrainedBuffer
+from .journal import ReplyJournal
 
 
 def test_evict_oldest_items() -> None:
@@ -40,3 +45,59 @@ def test_item_larger_than_max_size() -> None:
 
     assert buffer.add("1", b"A" * 2) is False
     assert buffer.get("1") is None
+
+
+def test_get_older_than() -> None:
+    buffer = SizeConstrainedBuffer(10)
+    buffer.add("1", b"A")
+    time.sleep(0.05)
+    buffer.add("2", b"A")
+
+    assert [item_id for item_id, _ in buffer.get_older_than(0.04)] == ["1"]
+    assert [item_id for item_id, _ in buffer.get_older_than(0)] == ["1", "2"]
+
+
+def test_journal() -> None:
+    """
+    Items evicted from memory stay in the journal, and items left in the
+    journal are loaded by the next buffer.
+    """
+
+    evicted: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "replies.journal")
+        journal = ReplyJournal(path, 1024)
+        buffer = SizeConstrainedBuffer(
+            2,
+            journal=journal,
+            on_evict=evicted.append,
+        )
+        assert buffer.add("1", b"A") is True
+        assert buffer.add("2", b"A") is True
+        assert buffer.add("3", b"A") is True
+
+        # Larger than the in-memory buffer, but fits in the journal.
+        assert buffer.add("4", b"A" * 10) is True
+
+        assert evicted == []
+        assert buffer.get("1") == b"A"
+        assert buffer.get("4") == b"A" * 10
+        assert [item_id for item_id, _ in buffer.get_older_than(0)] == [
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+
+        # Acked.
+        assert buffer.delete("2") is True
+        buffer.close()
+
+        buffer = SizeConstrainedBuffer(2, journal=ReplyJournal(path, 1024))
+        assert [item_id for item_id, _ in buffer.pop_replayed()] == [
+            "1",
+            "3",
+            "4",
+        ]
+        assert buffer.pop_replayed() == []
+        buffer.close()
@@ -48,8 +48,7 @@ class ConnInitHandler(BaseHandler):
         *,
         api_origin: str,
         env: str | None,
-        http_client: net.ThreadAwareAsyncHTTPClient,
-        http_client_sync: httpx.Client,
+        http_clients: net.AsyncHTTPClientRegistry,
         logger: types.Logger,
         rewrite_gateway_endpoint: typing.Callable[[str], str] | None,
         signing_key: str | None,
@@ -59,8 +58,7 @@ class ConnInitHandler(BaseHandler):
         super().__init__(logger, state)
         self._api_origin = api_origin
         self._env = env
-        self._http_client = http_client
-        self._http_client_sync = http_client_sync
+        self._http_clients = http_clients
         self._logger = logger
         self._rewrite_gateway_endpoint = rewrite_gateway_endpoint
         self._signing_key = signing_key
@@ -136,8 +134,7 @@ class ConnInitHandler(BaseHandler):
 
                 try:
                     res = await net.fetch_with_auth_fallback(
-                        self._http_client,
-                        self._http_client_sync,
+                        self._http_clients,
                         httpx.Request(
                             content=req.SerializeToString(),
                             extensions={
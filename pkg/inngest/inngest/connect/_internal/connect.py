@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import contextvars
 import dataclasses
 import signal
+import socket
 import typing
 
 import inngest
 
 from .connection import WorkerConnection, WorkerConnectionImpl
+from .consts import DEFAULT_MAX_JOURNAL_SIZE_BYTES
+from .executor_pool import ExecutorPolicy
+from .supervisor import Supervisor, WorkerContext
 
 
 def connect(
@@ -18,6 +23,10 @@ def connect(
     rewrite_gateway_endpoint: typing.Callable[[str], str] | None = None,
     shutdown_signals: list[signal.Signals] | None = None,
     max_worker_concurrency: int | None = None,
+    executor_loops: int = 1,
+    executor_policy: ExecutorPolicy = "least_loaded",
+    reply_journal_path: str | None = None,
+    reply_journal_max_bytes: int | None = None,
 ) -> WorkerConnection:
     """
     Create a persistent connection to an Inngest server.
@@ -29,6 +38,10 @@ def connect(
         rewrite_gateway_endpoint: A function that rewrites the Inngest server gateway endpoint.
         shutdown_signals: A list of graceful shutdown signals to handle. Defaults to [SIGTERM, SIGINT].
         max_worker_concurrency: The maximum number of worker concurrency to use. Defaults to None.
+        executor_loops: Number of event loops that run functions. The first is the caller's loop and each additional loop runs on its own thread with its own thread pool. Defaults to 1.
+        executor_policy: How requests are spread across executor loops. "least_loaded" picks the loop with the fewest in-flight requests and "run_id" sends every request for a run to the same loop.
+        reply_journal_path: File for a journal of unacked function results. Results are kept there if they're evicted from memory, and results left by a previous process are flushed on start. Defaults to no journal.
+        reply_journal_max_bytes: Maximum size of the journal file. Defaults to 500 MB.
     """
 
     overrides = _get_test_overrides()
@@ -39,11 +52,93 @@ def connect(
         rewrite_gateway_endpoint=rewrite_gateway_endpoint,
         shutdown_signals=shutdown_signals,
         max_worker_concurrency=max_worker_concurrency,
+        executor_loops=executor_loops,
+        executor_policy=executor_policy,
+        reply_journal_path=reply_journal_path,
+        reply_journal_max_bytes=reply_journal_max_bytes
+        or DEFAULT_MAX_JOURNAL_SIZE_BYTES,
         extend_lease_interval=overrides.extend_lease_interval,
         heartbeat_interval_sec=overrides.heartbeat_interval_sec,
     )
 
 
+def serve_multiprocess(
+    apps: list[tuple[inngest.Inngest, list[inngest.Function[typing.Any]]]],
+    *,
+    processes: int,
+    instance_id: str | None = None,
+    rewrite_gateway_endpoint: typing.Callable[[str], str] | None = None,
+    shutdown_signals: list[signal.Signals] | None = None,
+    max_worker_concurrency: int | None = None,
+    executor_loops: int = 1,
+    executor_policy: ExecutorPolicy = "least_loaded",
+    reply_journal_path: str | None = None,
+    reply_journal_max_bytes: int | None = None,
+    on_pending_request_count: typing.Callable[[int], None] | None = None,
+) -> None:
+    """
+    Run Connect workers in multiple processes, each with its own connection to
+    an Inngest server. Crashed workers are restarted with backoff, shutdown
+    signals are forwarded to every worker, and workers drain one by one when
+    their gateway closes. Blocks until the workers are closed.
+
+    Must be called from the main thread, outside of an event loop. Workers
+    are forked, so it isn't supported on Windows.
+
+    Args:
+    ----
+        apps: A list of tuples, where each tuple contains an Inngest client and a list of functions.
+        processes: Number of worker processes.
+        instance_id: A stable identifier for identifying connected apps. Each worker's instance ID is suffixed with its index (e.g. "my-host-0"). It defaults to the hostname of the machine.
+        rewrite_gateway_endpoint: A function that rewrites the Inngest server gateway endpoint.
+        shutdown_signals: A list of graceful shutdown signals to handle. Defaults to [SIGTERM, SIGINT].
+        max_worker_concurrency: The maximum number of worker concurrency to use, per worker. Defaults to None.
+        executor_loops: Number of event loops that run functions, per worker. Defaults to 1.
+        executor_policy: How requests are spread across executor loops.
+        reply_journal_path: File for a journal of unacked function results. Each worker's file is suffixed with its index (e.g. "replies.journal.0"). Defaults to no journal.
+        reply_journal_max_bytes: Maximum size of each worker's journal file. Defaults to 500 MB.
+        on_pending_request_count: Called in the supervisor process with the total number of pending requests across workers when it changes.
+    """
+
+    if len(apps) == 0:
+        raise Exception("no apps provided")
+    if instance_id is None:
+        instance_id = socket.gethostname()
+
+    overrides = _get_test_overrides()
+
+    def run_worker(ctx: WorkerContext) -> None:
+        conn = WorkerConnectionImpl(
+            apps=apps,
+            instance_id=f"{instance_id}-{ctx.slot}",
+            rewrite_gateway_endpoint=rewrite_gateway_endpoint,
+            shutdown_signals=shutdown_signals,
+            max_worker_concurrency=max_worker_concurrency,
+            executor_loops=executor_loops,
+            executor_policy=executor_policy,
+            reply_journal_path=None
+            if reply_journal_path is None
+            else f"{reply_journal_path}.{ctx.slot}",
+            reply_journal_max_bytes=reply_journal_max_bytes
+            or DEFAULT_MAX_JOURNAL_SIZE_BYTES,
+            extend_lease_interval=overrides.extend_lease_interval,
+            heartbeat_interval_sec=overrides.heartbeat_interval_sec,
+            drain_lock=ctx.drain_lock,
+        )
+        conn._state.pending_request_count.on_change(
+            lambda _, count: ctx.set_pending_request_count(count)
+        )
+        asyncio.run(conn.start())
+
+    Supervisor(
+        logger=apps[0][0].logger,
+        processes=processes,
+        target=run_worker,
+        on_pending_request_count=on_pending_request_count,
+        shutdown_signals=shutdown_signals,
+    ).run()
+
+
 @dataclasses.dataclass
 class _TestOverrides:
     extend_lease_interval: int | None = None
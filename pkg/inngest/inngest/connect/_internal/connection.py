@@ -19,24 +19,26 @@ import socket
 import threading
 import typing
 
-import httpx
-
 import inngest
 from inngest._internal import comm_lib, const, net, server_lib
 
+from . import async_lib
 from .configs_lib import get_max_worker_concurrency
 from .conn_init_starter import ConnInitHandler
 from .consts import (
+    DEFAULT_MAX_JOURNAL_SIZE_BYTES,
     DEFAULT_SHUTDOWN_SIGNALS,
     FRAMEWORK,
     HEARTBEAT_INTERVAL_SEC,
 )
-from .drain_handler import DrainHandler
+from .drain_handler import DrainHandler, DrainLock
 from .errors import UnreachableError
 from .execution_handler import ExecutionHandler
+from .executor_pool import ExecutorPolicy, ExecutorPool
 from .heartbeat_handler import HeartbeatHandler
 from .init_handshake_handler import InitHandshakeHandler
 from .isolated_worker import IsolatedWorker
+from .journal import ReplyJournal
 from .models import AppConfig, ConnectionState, State
 from .value_watcher import ValueWatcher
 
@@ -100,18 +102,26 @@ class WorkerConnectionImpl(WorkerConnection):
         rewrite_gateway_endpoint: typing.Callable[[str], str] | None = None,
         shutdown_signals: list[signal.Signals] | None = None,
         max_worker_concurrency: int | None = None,
+        executor_loops: int = 1,
+        executor_policy: ExecutorPolicy = "least_loaded",
+        reply_journal_path: str | None = None,
+        reply_journal_max_bytes: int = DEFAULT_MAX_JOURNAL_SIZE_BYTES,
         heartbeat_interval_sec: int | None = None,
         extend_lease_interval: int | None = None,
+        drain_lock: DrainLock | None = None,
     ) -> None:
         """
         Args:
         ----
+            drain_lock: Lock shared with other worker processes so that they drain one by one. Only used by serve_multiprocess.
             heartbeat_interval_sec: Override the heartbeat interval. Only used for testing.
             extend_lease_interval: Override the extend lease interval. Only used for testing.
         """
 
         if len(apps) == 0:
             raise Exception("no apps provided")
+        if executor_loops < 1:
+            raise ValueError("executor_loops must be at least 1")
         default_client = apps[0][0]
         self._logger = default_client.logger
         self._api_origin = default_client.api_origin
@@ -138,7 +148,11 @@ class WorkerConnectionImpl(WorkerConnection):
             self._signing_key = default_client.signing_key
             self._fallback_signing_key = default_client.signing_key_fallback
 
-        self._comm_handlers: dict[str, comm_lib.CommHandler] = {}
+        # One dict of CommHandlers (keyed by app ID) per executor loop. Each
+        # CommHandler has its own thread pool.
+        executor_comm_handlers: list[dict[str, comm_lib.CommHandler]] = [
+            {} for _ in range(executor_loops)
+        ]
         self._app_configs: dict[str, AppConfig] = {}
         for a in apps:
             (client, fns) = a
@@ -164,12 +178,13 @@ class WorkerConnectionImpl(WorkerConnection):
                 version=client.app_version,
             )
 
-            self._comm_handlers[client.app_id] = comm_lib.CommHandler(
-                client=client,
-                framework=FRAMEWORK,
-                functions=fns,
-                streaming=const.Streaming.DISABLE,  # Probably doesn't make sense for Connect.
-            )
+            for comm_handlers in executor_comm_handlers:
+                comm_handlers[client.app_id] = comm_lib.CommHandler(
+                    client=client,
+                    framework=FRAMEWORK,
+                    functions=fns,
+                    streaming=const.Streaming.DISABLE,  # Probably doesn't make sense for Connect.
+                )
 
         if instance_id is None:
             instance_id = socket.gethostname()
@@ -179,9 +194,20 @@ class WorkerConnectionImpl(WorkerConnection):
             max_worker_concurrency = get_max_worker_concurrency()
         self._max_worker_concurrency = max_worker_concurrency
 
+        self._executor_pool = ExecutorPool(
+            executor_comm_handlers,
+            self._logger,
+            executor_policy,
+        )
+        self._journal: ReplyJournal | None = None
+        if reply_journal_path is not None:
+            self._journal = ReplyJournal(
+                reply_journal_path,
+                reply_journal_max_bytes,
+            )
+
         self._rewrite_gateway_endpoint = rewrite_gateway_endpoint
-        self._http_client = net.ThreadAwareAsyncHTTPClient().initialize()
-        self._http_client_sync = httpx.Client()
+        self._http_clients = net.AsyncHTTPClientRegistry()
 
         def on_conn_state_change(
             old_state: ConnectionState,
@@ -212,9 +238,9 @@ class WorkerConnectionImpl(WorkerConnection):
 
         self._execution_handler = ExecutionHandler(
             api_origin=self._api_origin,
-            comm_handlers=self._comm_handlers,
-            http_client=self._http_client,
-            http_client_sync=self._http_client_sync,
+            executor_pool=self._executor_pool,
+            http_clients=self._http_clients,
+            journal=self._journal,
             logger=self._logger,
             state=self._state,
             signing_key=self._signing_key,
@@ -225,8 +251,7 @@ class WorkerConnectionImpl(WorkerConnection):
             ConnInitHandler(
                 api_origin=self._api_origin,
                 env=default_client.env,
-                http_client=self._http_client,
-                http_client_sync=self._http_client_sync,
+                http_clients=self._http_clients,
                 logger=self._logger,
                 rewrite_gateway_endpoint=self._rewrite_gateway_endpoint,
                 signing_key=self._signing_key,
@@ -248,7 +273,7 @@ class WorkerConnectionImpl(WorkerConnection):
                 extend_lease_interval=extend_lease_interval,
             ),
             self._execution_handler,
-            DrainHandler(self._logger, self._state),
+            DrainHandler(self._logger, self._state, drain_lock),
         ]
 
         self._isolated_worker = IsolatedWorker(
@@ -271,8 +296,9 @@ class WorkerConnectionImpl(WorkerConnection):
         await self._state.conn_state.wait_for(state)
 
     async def start(self) -> None:
-        # User functions execute on the caller's loop (main thread).
-        self._execution_handler._main_loop = asyncio.get_running_loop()
+        # User functions execute on the caller's loop (main thread) and any
+        # additional executor loops.
+        self._executor_pool.start(asyncio.get_running_loop())
 
         # Created here so `_close` can call `call_soon_threadsafe` on it
         # before the thread starts. The loop isn't *run* until `run_connect`.
@@ -294,7 +320,7 @@ class WorkerConnectionImpl(WorkerConnection):
                     lambda v: v != ConnectionState.CLOSED,
                 )
             finally:
-                _shutdown_loop(self._loop)
+                async_lib.shutdown_loop(self._loop)
 
         self._thread = threading.Thread(target=run_connect, daemon=True)
         self._thread.start()
@@ -303,8 +329,15 @@ class WorkerConnectionImpl(WorkerConnection):
         await self._state.conn_state.wait_for(ConnectionState.CLOSED)
         await asyncio.to_thread(self._thread.join)
 
-        await self._http_client.aclose()
-        self._http_client_sync.close()
+        # In-flight work was drained before CLOSED, so the executor loops are
+        # idle.
+        await asyncio.to_thread(self._executor_pool.close)
+
+        if self._journal is not None:
+            # Unacked replies stay in the journal for the next start.
+            self._journal.close()
+
+        await self._http_clients.aclose()
 
         if thread_exc is not None:
             raise thread_exc
@@ -343,17 +376,3 @@ class WorkerConnectionImpl(WorkerConnection):
 
         if self._thread is not None:
             await asyncio.to_thread(self._thread.join)
-
-
-def _shutdown_loop(loop: asyncio.AbstractEventLoop) -> None:
-    """
-    Cancel all remaining tasks on the loop and close it. Called from the worker
-    thread after `run_until_complete` returns.
-    """
-
-    try:
-        pending = asyncio.all_tasks(loop)
-        for t in pending:
-            t.cancel()
-    finally:
-        loop.close()
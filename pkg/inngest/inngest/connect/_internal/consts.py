@@ -37,6 +37,33 @@ POST_CONNECT_SETTLE_SEC = 1
 # Delay before reconnecting after a connection error (seconds)
 RECONNECTION_DELAY_SEC = 5
 
+# How often a worker process checks whether it's its turn to drain (seconds)
+DRAIN_LOCK_POLL_INTERVAL_SEC = 0.1
+
+# Maximum time a worker process holds the drain lock while it reconnects
+# (seconds). Other workers drain after this even if it hasn't reconnected.
+DRAIN_TURN_TIMEOUT_SEC = 30
+
+# Backoff before restarting a crashed worker process (seconds). It doubles
+# after each crash, up to the max.
+WORKER_RESTART_BACKOFF_MIN_SEC = 1
+WORKER_RESTART_BACKOFF_MAX_SEC = 30
+
+# A worker process that ran at least this long resets its restart backoff
+# (seconds).
+WORKER_RESTART_BACKOFF_RESET_SEC = 60
+
+# Maximum number of unacked messages flushed via HTTP at once
+FLUSH_MAX_CONCURRENCY = 16
+
+# Maximum number of attempts to flush an unacked message via HTTP
+FLUSH_MAX_ATTEMPTS = 5
+
+# Backoff between attempts to flush an unacked message (seconds). It doubles
+# after each failed attempt, up to the max.
+FLUSH_BACKOFF_MIN_SEC = 1
+FLUSH_BACKOFF_MAX_SEC = 30
+
 # Maximum time to wait for in-flight work to finish during shutdown (seconds).
 # Must accommodate the longest possible execution (up to 2 hours).
 GRACEFUL_SHUTDOWN_TIMEOUT_SEC = 2 * 60 * 60
@@ -53,3 +80,6 @@ MAX_MESSAGE_SIZE = 5 * 1024 * 1024  # 5 MB
 # limit cause oldest messages to be evicted. This should probably be
 # user-configurable.
 DEFAULT_MAX_BUFFER_SIZE_BYTES = 1024 * 1024 * 500  # 500MB
+
+# Default maximum size of the unacked message journal file (bytes).
+DEFAULT_MAX_JOURNAL_SIZE_BYTES = 1024 * 1024 * 500  # 500MB
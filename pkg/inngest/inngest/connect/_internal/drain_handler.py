@@ -1,8 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
 from inngest._internal import types
 
-from . import connect_pb2
+from . import async_lib, connect_pb2
 from .base_handler import BaseHandler
-from .models import State
+from .consts import DRAIN_LOCK_POLL_INTERVAL_SEC, DRAIN_TURN_TIMEOUT_SEC
+from .models import ConnectionState, State
+
+
+class DrainLock(typing.Protocol):
+    """
+    Lock shared by the worker processes of a multiprocess supervisor (e.g. a
+    multiprocessing.Lock).
+    """
+
+    def acquire(self, block: bool = ..., /) -> bool: ...
+
+    def release(self) -> None: ...
 
 
 class DrainHandler(BaseHandler):
@@ -19,16 +36,27 @@ class DrainHandler(BaseHandler):
 
     This allows the server to gracefully drain connections without
     interrupting in-flight work.
+
+    When a drain lock is given (multiprocess supervisor), only the process
+    holding the lock reconnects. It holds the lock until it's connected to
+    the new gateway, so the workers drain one by one.
     """
 
+    _drain_task: asyncio.Task[None] | None = None
+
     def __init__(
         self,
         logger: types.Logger,
         state: State,
+        drain_lock: DrainLock | None = None,
     ) -> None:
         super().__init__(logger, state)
+        self._drain_lock = drain_lock
         self._logger = logger
 
+    async def after_close_drained(self) -> None:
+        await async_lib.cancel_and_wait(self._drain_task)
+
     def handle_msg(
         self,
         msg: connect_pb2.ConnectMessage,
@@ -38,7 +66,42 @@ class DrainHandler(BaseHandler):
         if msg.kind != connect_pb2.GatewayMessageType.GATEWAY_CLOSING:
             return
 
-        self._logger.debug("Draining")
+        if self._drain_lock is None:
+            self._logger.debug("Draining")
+
+            # Clear the connection to trigger reconnection logic elsewhere
+            self._state.close_ws()
+            return
+
+        if self._drain_task is not None and not self._drain_task.done():
+            # Already waiting for our turn.
+            return
+
+        self._drain_task = asyncio.create_task(
+            self._drain_with_lock(self._drain_lock)
+        )
+
+    async def _drain_with_lock(self, drain_lock: DrainLock) -> None:
+        # Poll instead of blocking in a thread. If this task is cancelled
+        # while a thread is blocked on the lock, nothing would release it.
+        while not drain_lock.acquire(False):  # noqa: ASYNC110
+            await asyncio.sleep(DRAIN_LOCK_POLL_INTERVAL_SEC)
+
+        try:
+            self._logger.debug("Draining")
+
+            # Clear the connection to trigger reconnection logic elsewhere
+            self._state.close_ws()
 
-        # Clear the connection to trigger reconnection logic elsewhere
-        self._state.close_ws()
+            try:
+                await self._state.conn_state.wait_for(
+                    ConnectionState.ACTIVE,
+                    timeout=DRAIN_TURN_TIMEOUT_SEC,
+                )
+            except asyncio.TimeoutError:
+                self._logger.warning(
+                    "Timed out waiting to reconnect after drain",
+                    extra={"timeout_sec": DRAIN_TURN_TIMEOUT_SEC},
+                )
+        finally:
+            drain_lock.release()
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+import unittest.mock
+
+from . import connect_pb2
+from .drain_handler import DrainHandler
+from .models import ConnectionState, State
+from .value_watcher import ValueWatcher
+
+
+def _create_state() -> State:
+    return State(
+        conn_id=ValueWatcher(None),
+        conn_init=ValueWatcher(None),
+        conn_state=ValueWatcher(ConnectionState.ACTIVE),
+        exclude_gateways=ValueWatcher([]),
+        extend_lease_interval=ValueWatcher(None),
+        fatal_error=ValueWatcher(None),
+        init_handshake_complete=ValueWatcher(True),
+        pending_request_count=ValueWatcher(0),
+        ws=ValueWatcher(None),
+    )
+
+
+class TestDrainHandler(unittest.IsolatedAsyncioTestCase):
+    async def test_drain_one_by_one(self) -> None:
+        lock = threading.Lock()
+        states = [_create_state(), _create_state()]
+        handlers = [
+            DrainHandler(unittest.mock.Mock(), state, lock) for state in states
+        ]
+        msg = connect_pb2.ConnectMessage(
+            kind=connect_pb2.GatewayMessageType.GATEWAY_CLOSING,
+        )
+        for h in handlers:
+            h.start()
+            h.handle_msg(msg, connect_pb2.AuthData(), "conn")
+
+        await asyncio.sleep(0.3)
+
+        # Only the first worker started reconnecting.
+        assert states[0].conn_state.value == ConnectionState.RECONNECTING
+        assert states[1].conn_state.value == ConnectionState.ACTIVE
+
+        # The second worker drains once the first reconnects.
+        states[0].conn_state.value = ConnectionState.ACTIVE
+        await states[1].conn_state.wait_for(
+            ConnectionState.RECONNECTING,
+            timeout=1,
+        )
+
+        states[1].conn_state.value = ConnectionState.ACTIVE
+        for h in handlers:
+            h.close()
+            await asyncio.wait_for(h.closed(), timeout=1)
+        assert lock.locked() is False
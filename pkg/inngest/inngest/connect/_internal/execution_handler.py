@@ -1,4 +1,6 @@
 import asyncio
+import dataclasses
+import time
 import typing
 import urllib.parse
 
@@ -9,7 +11,17 @@ from inngest._internal import comm_lib, net, server_lib, types
 from . import async_lib, connect_pb2, pb_utils, ws_utils
 from .base_handler import BaseHandler
 from .buffer import SizeConstrainedBuffer
-from .consts import DEFAULT_MAX_BUFFER_SIZE_BYTES
+from .consts import (
+    DEFAULT_MAX_BUFFER_SIZE_BYTES,
+    FLUSH_BACKOFF_MAX_SEC,
+    FLUSH_BACKOFF_MIN_SEC,
+    FLUSH_MAX_ATTEMPTS,
+    FLUSH_MAX_CONCURRENCY,
+)
+from .errors import NonRetryableError
+from .executor_pool import ExecutorPool
+from .journal import ReplyJournal
+from .lease_scheduler import LeaseScheduler
 from .models import State
 from .value_watcher import ValueWatcher
 
@@ -19,6 +31,22 @@ PendingRequest: typing.TypeAlias = tuple[
 ]
 
 
+@dataclasses.dataclass
+class FlushStats:
+    """
+    Totals for flushing unacked messages via HTTP.
+    """
+
+    # Messages that were given up on.
+    failed: int = 0
+
+    flushed: int = 0
+    flushed_bytes: int = 0
+
+    # Failed attempts that will be retried.
+    retries: int = 0
+
+
 class _PendingRequestManager:
     def __init__(self, pending_request_count: ValueWatcher[int]) -> None:
         self._pending_request_count = pending_request_count
@@ -68,7 +96,8 @@ class ExecutionHandler(BaseHandler):
 
     Additional responsibilities:
         - Lease extension: Long-running functions need periodic lease renewals
-          to prevent the server from timing out and retrying the request.
+          to prevent the server from timing out and retrying the request. Each
+          lease is extended when it's due rather than all at once.
         - Unacked message flushing: If WORKER_REPLY_ACK isn't received in time,
           the reply is flushed via HTTP as a fallback.
         - Pending request tracking: Graceful shutdown waits for all pending
@@ -79,37 +108,30 @@ class ExecutionHandler(BaseHandler):
     _lease_extender_task: asyncio.Task[None] | None = None
     _unacked_msg_flush_poller_task: asyncio.Task[None] | None = None
 
-    # Caller's (main) event loop. User functions are dispatched here so they
-    # run on the main thread instead of the worker thread.
-    _main_loop: asyncio.AbstractEventLoop | None = None
-
     def __init__(
         self,
         api_origin: str,
-        comm_handlers: dict[str, comm_lib.CommHandler],
-        http_client: net.ThreadAwareAsyncHTTPClient,
-        http_client_sync: httpx.Client,
+        executor_pool: ExecutorPool,
+        http_clients: net.AsyncHTTPClientRegistry,
         logger: types.Logger,
         signing_key: str | None,
         signing_key_fallback: str | None,
         state: State,
+        journal: ReplyJournal | None = None,
     ) -> None:
         super().__init__(logger, state)
         self._api_origin = api_origin
         self._buffer = SizeConstrainedBuffer(
             DEFAULT_MAX_BUFFER_SIZE_BYTES,
-            on_evict=lambda item_id: logger.warning(
-                "Evicted unacked message from buffer to make room",
-                extra={"request_id": item_id},
-            ),
+            journal=journal,
+            on_evict=self._on_evict,
             on_reject=lambda item_id: logger.warning(
                 "Message too large for buffer",
                 extra={"request_id": item_id},
             ),
         )
-        self._comm_handlers = comm_handlers
-        self._http_client = http_client
-        self._http_client_sync = http_client_sync
+        self._executor_pool = executor_pool
+        self._http_clients = http_clients
         self._logger = logger
         self._signing_key = signing_key
         self._signing_key_fallback = signing_key_fallback
@@ -120,6 +142,23 @@ class ExecutionHandler(BaseHandler):
             state.pending_request_count
         )
 
+        # Bounds the number of concurrent flush requests.
+        self._flush_semaphore = asyncio.Semaphore(FLUSH_MAX_CONCURRENCY)
+
+        # Failed flushes, keyed by request ID. Values are the number of
+        # attempts and the monotonic time of the next attempt.
+        self._flush_retries: dict[str, tuple[int, float]] = {}
+
+        self.flush_stats = FlushStats()
+
+        # Each pending request's lease is extended when it's due, rather than
+        # extending every lease at once.
+        self._leases = LeaseScheduler()
+
+        # Set when a lease is scheduled, so that the lease extender can wake
+        # up if it's due before the extender's current wait ends.
+        self._lease_scheduled = asyncio.Event()
+
     def start(self) -> types.MaybeError[None]:
         err = super().start()
         if err is not None:
@@ -185,8 +224,7 @@ class ExecutionHandler(BaseHandler):
             )
             return
 
-        comm_handler = self._comm_handlers.get(req_data.app_name)
-        if comm_handler is None:
+        if self._executor_pool.get_comm_handler(req_data.app_name) is None:
             self._logger.error(
                 "Unknown app",
                 extra={"app_id": req_data.app_name},
@@ -194,20 +232,37 @@ class ExecutionHandler(BaseHandler):
             return
 
         # Store the task.
-        task = asyncio.create_task(
-            self._execute_request(req_data, comm_handler)
-        )
+        task = asyncio.create_task(self._execute_request(req_data))
         self._pending_requests.add(req_data.request_id, req_data, task)
+        self._schedule_lease(req_data.request_id)
 
         # Remove the task when it completes.
-        task.add_done_callback(
-            lambda _: self._pending_requests.pop(req_data.request_id)
+        task.add_done_callback(lambda _: self._on_done(req_data.request_id))
+
+    def _on_evict(self, request_id: str) -> None:
+        self._logger.warning(
+            "Evicted unacked message from buffer to make room",
+            extra={"request_id": request_id},
+        )
+        self._flush_retries.pop(request_id, None)
+
+    def _on_done(self, request_id: str) -> None:
+        self._pending_requests.pop(request_id)
+        self._leases.remove(request_id)
+
+    def _schedule_lease(self, request_id: str) -> None:
+        # The interval is set by the init handshake, which happens before any
+        # requests arrive. If it isn't, the lease is due now and the extender
+        # reschedules it once it knows the interval.
+        self._leases.schedule(
+            request_id,
+            self._state.extend_lease_interval.value or 0,
         )
+        self._lease_scheduled.set()
 
     async def _execute_request(
         self,
         req_data: connect_pb2.GatewayExecutorRequestData,
-        comm_handler: comm_lib.CommHandler,
     ) -> None:
         """
         Execute a single function request.
@@ -238,30 +293,26 @@ class ExecutionHandler(BaseHandler):
                 ).SerializeToString(),
             )
             if err is None:
-                if self._main_loop is None:
-                    raise Exception("_main_loop not set")
-
-                # Run the Inngest function on the main thread.
-                future = asyncio.run_coroutine_threadsafe(
-                    comm_handler.post(
-                        comm_lib.CommRequest(
-                            body=req_data.request_payload,
-                            headers={},
-                            is_connect=True,
-                            public_path=None,
-                            query_params={
-                                server_lib.QueryParamKey.FUNCTION_ID.value: req_data.function_slug,
-                                server_lib.QueryParamKey.STEP_ID.value: req_data.step_id,
-                            },
-                            raw_request=req_data,
-                            request_url="",
-                            serve_origin=None,
-                            serve_path=None,
-                        )
+                # Run the Inngest function on one of the executor loops (the
+                # main thread's loop by default).
+                comm_res = await self._executor_pool.execute(
+                    req_data.app_name,
+                    req_data.run_id,
+                    comm_lib.CommRequest(
+                        body=req_data.request_payload,
+                        headers={},
+                        is_connect=True,
+                        public_path=None,
+                        query_params={
+                            server_lib.QueryParamKey.FUNCTION_ID.value: req_data.function_slug,
+                            server_lib.QueryParamKey.STEP_ID.value: req_data.step_id,
+                        },
+                        raw_request=req_data,
+                        request_url="",
+                        serve_origin=None,
+                        serve_path=None,
                     ),
-                    self._main_loop,
                 )
-                comm_res = await asyncio.wrap_future(future)
             else:
                 self._logger.error(
                     "Execution failed", extra={"error": str(err)}
@@ -391,6 +442,15 @@ class ExecutionHandler(BaseHandler):
             )
             return
 
+        latency = self._leases.on_ack(req_data.request_id)
+        self._logger.debug(
+            "Received lease extend ack",
+            extra={
+                "latency_ms": None if latency is None else latency * 1000,
+                "request_id": req_data.request_id,
+            },
+        )
+
         if req_data.new_lease_id:
             # Each lease extension ack includes a new lease ID. If we don't use the
             # new lease ID the next time we extend, we'll have a bad time.
@@ -431,25 +491,47 @@ class ExecutionHandler(BaseHandler):
             extra={"request_id": req_data.request_id},
         )
         self._buffer.delete(req_data.request_id)
+        self._flush_retries.pop(req_data.request_id, None)
 
     async def _lease_extender(self) -> None:
+        extend_lease_interval = (
+            await self._state.extend_lease_interval.wait_for_not_none()
+        )
+
         while self.closed_event.is_set() is False:
             await self._state.ws.wait_for_not_none()
-            extend_lease_interval = (
-                await self._state.extend_lease_interval.wait_for_not_none()
-            )
 
-            await asyncio.sleep(extend_lease_interval)
+            # Wait until the next lease is due, or until a lease is scheduled
+            # (it may be due sooner).
+            next_due = self._leases.next_due()
+            timeout = None
+            if next_due is not None:
+                timeout = max(0, next_due - time.monotonic())
+            try:
+                await asyncio.wait_for(
+                    self._lease_scheduled.wait(),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._lease_scheduled.clear()
 
-            if self._pending_requests.count() == 0:
+            request_ids = self._leases.pop_due()
+            if len(request_ids) == 0:
                 continue
 
             self._logger.debug(
                 "Extending leases",
-                extra={"count": self._pending_requests.count()},
+                extra={"count": len(request_ids)},
             )
 
-            for req_data, _ in self._pending_requests.get_all():
+            for request_id in request_ids:
+                pending_req = self._pending_requests.get(request_id)
+                if pending_req is None:
+                    # Completed while waiting for its turn.
+                    continue
+
+                req_data = pending_req[0]
                 err = await ws_utils.safe_send(
                     self._logger,
                     self._state,
@@ -472,6 +554,12 @@ class ExecutionHandler(BaseHandler):
                     self._logger.error(
                         "Failed to extend lease", extra={"error": str(err)}
                     )
+                else:
+                    self._leases.on_sent(request_id)
+
+                # The request may have completed during the send.
+                if self._pending_requests.get(request_id) is not None:
+                    self._leases.schedule(request_id, extend_lease_interval)
 
     async def _unacked_msg_flush_poller(self) -> None:
         """
@@ -479,25 +567,101 @@ class ExecutionHandler(BaseHandler):
         messages on an interval.
         """
 
+        # Replies left in the journal by a previous process can't be acked
+        # over this connection, so flush them right away.
+        await self._flush_messages(self._buffer.pop_replayed())
+
         # How long a message should exist before being flushed. We picked the
         # lease interval, but there may be a better value.
         flush_ttl = await self._state.extend_lease_interval.wait_for_not_none()
 
         while self.closed_event.is_set() is False:
-            for request_id, reply_msg in self._buffer.get_older_than(flush_ttl):
-                try:
-                    err = await self._flush_message(reply_msg)
-                    if err is not None:
-                        self._logger.error(
-                            "Failed to flush message", extra={"error": str(err)}
-                        )
-                finally:
-                    # We only attempt to flush once, so we can delete the
-                    # message.
-                    self._buffer.delete(request_id)
-
+            await self._flush_messages(self._buffer.get_older_than(flush_ttl))
             await asyncio.sleep(1)
 
+    async def _flush_messages(self, messages: list[tuple[str, bytes]]) -> None:
+        """
+        Flush messages concurrently, skipping messages that are waiting to be
+        retried.
+        """
+
+        now = time.monotonic()
+        messages = [
+            (request_id, msg)
+            for request_id, msg in messages
+            if self._flush_retries.get(request_id, (0, 0))[1] <= now
+        ]
+        if len(messages) == 0:
+            return
+
+        before = dataclasses.replace(self.flush_stats)
+        start = time.monotonic()
+        await asyncio.gather(
+            *(
+                self._flush_with_retry(request_id, msg)
+                for request_id, msg in messages
+            )
+        )
+        duration = time.monotonic() - start
+
+        flushed = self.flush_stats.flushed - before.flushed
+        self._logger.debug(
+            "Flushed unacked messages",
+            extra={
+                "duration_ms": duration * 1000,
+                "failed": self.flush_stats.failed - before.failed,
+                "flushed": flushed,
+                "per_sec": flushed / duration if duration > 0 else None,
+                "retries": self.flush_stats.retries - before.retries,
+            },
+        )
+
+    async def _flush_with_retry(self, request_id: str, msg: bytes) -> None:
+        async with self._flush_semaphore:
+            if self._buffer.get(request_id) is None:
+                # Acked while waiting for a turn.
+                return
+
+            err = await self._flush_message(msg)
+
+        if err is None:
+            self.flush_stats.flushed += 1
+            self.flush_stats.flushed_bytes += len(msg)
+            self._flush_retries.pop(request_id, None)
+            self._buffer.delete(request_id)
+            return
+
+        attempts = self._flush_retries.get(request_id, (0, 0))[0] + 1
+        if attempts >= FLUSH_MAX_ATTEMPTS or isinstance(err, NonRetryableError):
+            self.flush_stats.failed += 1
+            self._logger.error(
+                "Failed to flush message",
+                extra={
+                    "attempts": attempts,
+                    "error": str(err),
+                    "request_id": request_id,
+                },
+            )
+            self._flush_retries.pop(request_id, None)
+            self._buffer.delete(request_id)
+            return
+
+        delay = min(
+            FLUSH_BACKOFF_MIN_SEC * 2 ** (attempts - 1),
+            FLUSH_BACKOFF_MAX_SEC,
+        )
+        self.flush_stats.retries += 1
+        self._flush_retries[request_id] = (attempts, time.monotonic() + delay)
+        self._logger.warning(
+            "Failed to flush message. Retrying...",
+            extra={
+                "attempts": attempts,
+                "delay_sec": delay,
+                "error": str(err),
+                "request_id": request_id,
+            },
+        )
+
     async def _flush_message(self, msg: bytes) -> types.MaybeError[None]:
         """
         Flush a single message via HTTP.
@@ -506,8 +670,7 @@ class ExecutionHandler(BaseHandler):
         url = urllib.parse.urljoin(self._api_origin, "/v0/connect/flush")
 
         res = await net.fetch_with_auth_fallback(
-            self._http_client,
-            self._http_client_sync,
+            self._http_clients,
             httpx.Request(
                 content=msg,
                 extensions={
@@ -525,7 +688,15 @@ class ExecutionHandler(BaseHandler):
         if isinstance(res, Exception):
             return res
         if res.status_code == 401 or res.status_code == 403:
-            return Exception("unauthorized")
+            return NonRetryableError("unauthorized")
+        if (
+            400 <= res.status_code < 500
+            and res.status_code != 408
+            and res.status_code != 429
+        ):
+            return NonRetryableError(
+                f"unexpected status code: {res.status_code}"
+            )
         if res.status_code < 200 or res.status_code >= 300:
             return Exception(f"unexpected status code: {res.status_code}")
 
@@ -0,0 +1,158 @@
+import asyncio
+import datetime
+import unittest.mock
+
+import test_core
+
+from inngest._internal import net, types
+
+from . import connect_pb2
+from .consts import FLUSH_MAX_CONCURRENCY
+from .errors import NonRetryableError
+from .execution_handler import ExecutionHandler
+from .executor_pool import ExecutorPool
+from .models import ConnectionState, State
+from .value_watcher import ValueWatcher
+
+
+def _create_handler(ws: object) -> ExecutionHandler:
+    logger = unittest.mock.Mock()
+    return ExecutionHandler(
+        api_origin="http://localhost",
+        executor_pool=ExecutorPool([{}], logger),
+        http_clients=net.AsyncHTTPClientRegistry(),
+        logger=logger,
+        signing_key=None,
+        signing_key_fallback=None,
+        state=State(
+            conn_id=ValueWatcher(None),
+            conn_init=ValueWatcher(None),
+            conn_state=ValueWatcher(ConnectionState.ACTIVE),
+            exclude_gateways=ValueWatcher([]),
+            extend_lease_interval=ValueWatcher(1),
+            fatal_error=ValueWatcher(None),
+            init_handshake_complete=ValueWatcher(True),
+            pending_request_count=ValueWatcher(0),
+            ws=ValueWatcher(ws),  # type: ignore[arg-type]
+        ),
+    )
+
+
+class TestLeaseExtender(unittest.IsolatedAsyncioTestCase):
+    async def test_skips_completed_requests(self) -> None:
+        extended: list[str] = []
+
+        class _MockWS(unittest.mock.AsyncMock):
+            async def send(self, msg: bytes) -> None:
+                parsed = connect_pb2.ConnectMessage.FromString(msg)
+                assert (
+                    parsed.kind
+                    == connect_pb2.GatewayMessageType.WORKER_REQUEST_EXTEND_LEASE
+                )
+                extended.append(
+                    connect_pb2.WorkerRequestExtendLeaseData.FromString(
+                        parsed.payload
+                    ).request_id
+                )
+
+        handler = _create_handler(_MockWS())
+        handler.start()
+
+        never_done = asyncio.Event()
+
+        async def execute() -> None:
+            await never_done.wait()
+
+        tasks: list[asyncio.Task[None]] = []
+        for request_id in ["a", "b"]:
+            task = asyncio.create_task(execute())
+            tasks.append(task)
+            handler._pending_requests.add(
+                request_id,
+                connect_pb2.GatewayExecutorRequestData(request_id=request_id),
+                task,
+            )
+            handler._schedule_lease(request_id)
+
+        # Completes before its lease is due.
+        handler._on_done("b")
+
+        def assertion() -> None:
+            assert extended == ["a"]
+
+        await test_core.wait_for(
+            assertion, timeout=datetime.timedelta(seconds=3)
+        )
+
+        # Acks record the extension's latency.
+        handler.handle_msg(
+            connect_pb2.ConnectMessage(
+                kind=connect_pb2.GatewayMessageType.WORKER_REQUEST_EXTEND_LEASE_ACK,
+                payload=connect_pb2.WorkerRequestExtendLeaseAckData(
+                    new_lease_id="lease-2",
+                    request_id="a",
+                ).SerializeToString(),
+            ),
+            connect_pb2.AuthData(),
+            "conn",
+        )
+        assert handler._leases.latency("a") is not None
+
+        # Rescheduled for the next interval.
+        await asyncio.sleep(1.2)
+        assert extended == ["a", "a"]
+
+        for task in tasks:
+            task.cancel()
+        handler._on_done("a")
+        handler.close()
+        await asyncio.wait_for(handler.closed(), timeout=3)
+
+
+class TestFlush(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrency_and_retries(self) -> None:
+        handler = _create_handler(None)
+        for i in range(40):
+            handler._buffer.add(str(i), str(i).encode())
+        handler._buffer.add("bad", b"bad")
+
+        in_flight = 0
+        max_in_flight = 0
+        attempts: list[bytes] = []
+
+        async def flush_message(msg: bytes) -> types.MaybeError[None]:
+            nonlocal in_flight, max_in_flight
+            attempts.append(msg)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            if msg == b"bad":
+                return NonRetryableError("unauthorized")
+            if msg == b"0" and attempts.count(msg) == 1:
+                return Exception("oh no")
+            return None
+
+        handler._flush_message = flush_message  # type: ignore[method-assign]
+
+        await handler._flush_messages(handler._buffer.get_older_than(0))
+        assert max_in_flight == FLUSH_MAX_CONCURRENCY
+        assert handler.flush_stats.flushed == 39
+        assert handler.flush_stats.failed == 1
+        assert handler.flush_stats.retries == 1
+
+        # Non-retryable failures are dropped and retryable failures are kept.
+        assert handler._buffer.get("bad") is None
+        assert handler._buffer.get("0") == b"0"
+
+        # Not retried until the backoff passes.
+        await handler._flush_messages(handler._buffer.get_older_than(0))
+        assert attempts.count(b"0") == 1
+
+        handler._flush_retries["0"] = (1, 0)
+        await handler._flush_messages(handler._buffer.get_older_than(0))
+        assert attempts.count(b"0") == 2
+        assert handler.flush_stats.flushed == 40
+        assert handler._buffer.get("0") is None
+        assert handler._flush_retries == {}
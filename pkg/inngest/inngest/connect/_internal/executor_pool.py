@@ -0,0 +1,173 @@
+"""
+Event loops that run Inngest functions for Connect.
+
+The first executor always uses the caller's (main) event loop. Each additional
+executor runs its own event loop on its own thread, with its own CommHandlers
+(and therefore its own thread pool for non-async functions).
+
+Thread ownership:
+    `ExecutorPool.execute` is only called from the isolated worker thread, so
+    in-flight counts don't need a lock. `start` and `close` are called from the
+    main thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import typing
+import zlib
+
+from inngest._internal import comm_lib, types
+
+from . import async_lib
+from .errors import UnreachableError
+
+ExecutorPolicy: typing.TypeAlias = typing.Literal["least_loaded", "run_id"]
+
+
+@dataclasses.dataclass
+class _Executor:
+    # Keyed by app ID.
+    comm_handlers: dict[str, comm_lib.CommHandler]
+
+    # Number of requests currently dispatched to this executor.
+    in_flight: int = 0
+
+    loop: asyncio.AbstractEventLoop | None = None
+    thread: threading.Thread | None = None
+
+
+class ExecutorPool:
+    """
+    Dispatches function executions across executor event loops.
+    """
+
+    def __init__(
+        self,
+        comm_handlers: list[dict[str, comm_lib.CommHandler]],
+        logger: types.Logger,
+        policy: ExecutorPolicy = "least_loaded",
+    ) -> None:
+        """
+        Args:
+        ----
+            comm_handlers: CommHandlers (keyed by app ID) for each executor. The first executor runs on the main loop.
+            logger: Logger.
+            policy: How to pick the executor for a request. "run_id" sends every request for a run to the same executor.
+        """
+
+        if len(comm_handlers) == 0:
+            raise ValueError("at least 1 executor is required")
+
+        self._executors = [_Executor(comm_handlers=h) for h in comm_handlers]
+        self._logger = logger
+        self._policy = policy
+
+    def __len__(self) -> int:
+        return len(self._executors)
+
+    def get_comm_handler(self, app_id: str) -> comm_lib.CommHandler | None:
+        return self._executors[0].comm_handlers.get(app_id)
+
+    def in_flight(self) -> list[int]:
+        return [e.in_flight for e in self._executors]
+
+    def start(self, main_loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Use the main loop for the first executor and start a thread for each
+        of the others.
+        """
+
+        self._executors[0].loop = main_loop
+
+        for i, executor in enumerate(self._executors[1:], start=1):
+            if executor.thread is not None:
+                continue
+
+            loop = asyncio.new_event_loop()
+            executor.loop = loop
+            executor.thread = threading.Thread(
+                daemon=True,
+                name=f"inngest-connect-executor-{i}",
+                target=_run_loop,
+                args=(loop,),
+            )
+            executor.thread.start()
+
+        if len(self._executors) > 1:
+            self._logger.debug(
+                "Started executor loops",
+                extra={"count": len(self._executors)},
+            )
+
+    def close(self) -> None:
+        """
+        Stop the executor threads. Blocks until they exit, so in-flight work
+        should already be drained.
+        """
+
+        for executor in self._executors[1:]:
+            if executor.loop is None or executor.thread is None:
+                continue
+
+            try:
+                executor.loop.call_soon_threadsafe(executor.loop.stop)
+            except RuntimeError:
+                # Loop already closed.
+                pass
+            executor.thread.join()
+            executor.loop = None
+            executor.thread = None
+
+        self._executors[0].loop = None
+
+    async def execute(
+        self,
+        app_id: str,
+        run_id: str,
+        request: comm_lib.CommRequest,
+    ) -> comm_lib.CommResponse:
+        """
+        Run the request on an executor's loop and wait for its response.
+        Cancelling the caller cancels the execution.
+        """
+
+        executor = self._select(run_id)
+        if executor.loop is None:
+            raise Exception("executor pool not started")
+
+        comm_handler = executor.comm_handlers.get(app_id)
+        if comm_handler is None:
+            raise UnreachableError(f"unknown app: {app_id}")
+
+        executor.in_flight += 1
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                comm_handler.post(request),
+                executor.loop,
+            )
+            return await asyncio.wrap_future(future)
+        finally:
+            executor.in_flight -= 1
+
+    def _select(self, run_id: str) -> _Executor:
+        if len(self._executors) == 1:
+            return self._executors[0]
+
+        if self._policy == "run_id" and run_id != "":
+            # Use a stable hash since str hashes are randomized per process.
+            i = zlib.crc32(run_id.encode("utf-8")) % len(self._executors)
+            return self._executors[i]
+
+        # Ties go to the first executor, which is the main loop.
+        return min(self._executors, key=lambda e: e.in_flight)
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        async_lib.shutdown_loop(loop)
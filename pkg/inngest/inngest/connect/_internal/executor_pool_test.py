@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import typing
+import unittest
+
+from inngest._internal import comm_lib
+
+from .executor_pool import ExecutorPolicy, ExecutorPool
+
+_logger = logging.getLogger(__name__)
+
+
+class _FakeCommHandler:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.thread_names: list[str] = []
+
+    async def post(self, req: comm_lib.CommRequest) -> comm_lib.CommResponse:
+        self.thread_names.append(threading.current_thread().name)
+        await asyncio.to_thread(self.release.wait)
+        return comm_lib.CommResponse(body={"ok": True})
+
+
+def _create_pool(
+    count: int,
+    policy: ExecutorPolicy = "least_loaded",
+) -> tuple[ExecutorPool, list[_FakeCommHandler]]:
+    fakes = [_FakeCommHandler() for _ in range(count)]
+    pool = ExecutorPool(
+        [{"app": typing.cast(comm_lib.CommHandler, fake)} for fake in fakes],
+        _logger,
+        policy,
+    )
+    return pool, fakes
+
+
+def _create_request() -> comm_lib.CommRequest:
+    return comm_lib.CommRequest(
+        body=b"",
+        headers={},
+        public_path=None,
+        query_params={},
+        raw_request=None,
+        request_url="",
+        serve_origin=None,
+        serve_path=None,
+    )
+
+
+class TestExecutorPool(unittest.IsolatedAsyncioTestCase):
+    async def test_least_loaded(self) -> None:
+        pool, fakes = _create_pool(3)
+        pool.start(asyncio.get_running_loop())
+        try:
+            tasks = [
+                asyncio.create_task(
+                    pool.execute("app", f"run-{i}", _create_request())
+                )
+                for i in range(6)
+            ]
+            await asyncio.sleep(0.1)
+
+            # Spread evenly, with the first executor on the main loop.
+            assert pool.in_flight() == [2, 2, 2]
+            assert (
+                fakes[0].thread_names == [threading.current_thread().name] * 2
+            )
+            assert fakes[1].thread_names == ["inngest-connect-executor-1"] * 2
+            assert fakes[2].thread_names == ["inngest-connect-executor-2"] * 2
+
+            for fake in fakes:
+                fake.release.set()
+            for res in await asyncio.gather(*tasks):
+                assert res.status_code == 200
+            assert pool.in_flight() == [0, 0, 0]
+        finally:
+            await asyncio.to_thread(pool.close)
+
+    async def test_run_id(self) -> None:
+        pool, fakes = _create_pool(3, "run_id")
+        pool.start(asyncio.get_running_loop())
+        try:
+            for fake in fakes:
+                fake.release.set()
+            for _ in range(3):
+                await pool.execute("app", "run-a", _create_request())
+
+            # Every request for the run went to the same executor.
+            assert sorted(len(fake.thread_names) for fake in fakes) == [0, 0, 3]
+        finally:
+            await asyncio.to_thread(pool.close)
+
+    async def test_cancel(self) -> None:
+        pool, fakes = _create_pool(2)
+        pool.start(asyncio.get_running_loop())
+        try:
+            task_a = asyncio.create_task(
+                pool.execute("app", "run-a", _create_request())
+            )
+            task_b = asyncio.create_task(
+                pool.execute("app", "run-b", _create_request())
+            )
+            await asyncio.sleep(0.1)
+            assert pool.in_flight() == [1, 1]
+
+            # Cancelling the caller frees up its executor.
+            task_b.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task_b
+            assert pool.in_flight() == [1, 0]
+
+            fakes[0].release.set()
+            await task_a
+            assert pool.in_flight() == [0, 0]
+        finally:
+            for fake in fakes:
+                fake.release.set()
+            await asyncio.to_thread(pool.close)
+
+    def test_close_stops_threads(self) -> None:
+        pool, _ = _create_pool(3)
+        loop = asyncio.new_event_loop()
+        try:
+            pool.start(loop)
+            names = {t.name for t in threading.enumerate()}
+            assert "inngest-connect-executor-1" in names
+            assert "inngest-connect-executor-2" in names
+
+            pool.close()
+            names = {t.name for t in threading.enumerate()}
+            assert "inngest-connect-executor-1" not in names
+            assert "inngest-connect-executor-2" not in names
+        finally:
+            loop.close()
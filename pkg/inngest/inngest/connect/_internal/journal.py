@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import dataclasses
+import mmap
+import os
+import struct
+import time
+import zlib
+
+# Record header: kind, ID length, data length, wall-clock timestamp, and CRC32
+# of the timestamp, ID and data.
+_header = struct.Struct("<BHIdI")
+
+# Record kinds. The byte after the last record is always _KIND_END, so
+# replaying stops there. A torn write fails its CRC and also stops replay.
+_KIND_END = 0
+_KIND_LIVE = 1
+_KIND_DEAD = 2
+
+# Compact once dead records take up at least this many bytes and more than the
+# live records.
+_COMPACT_MIN_DEAD_BYTES = 1024 * 1024
+
+
+@dataclasses.dataclass
+class _Record:
+    offset: int
+    size: int
+
+
+@dataclasses.dataclass
+class JournalItem:
+    data: bytes
+    id: str
+
+    # Wall-clock time when the item was appended.
+    timestamp: float
+
+
+class ReplyJournal:
+    """
+    Append-only, memory-mapped file of unacked execution replies. The file is
+    preallocated to max_size_bytes (sparse on most filesystems).
+
+    Appending a reply copies it into the mapped file, so replies survive a
+    crash of the process (but not necessarily of the OS). Deleting a reply
+    marks its record dead in place. Dead records are dropped by compacting,
+    which rewrites the live records to a new file.
+    """
+
+    def __init__(self, path: str, max_size_bytes: int) -> None:
+        """
+        Args:
+        ----
+            path: Journal file. Created if it doesn't exist.
+            max_size_bytes: Maximum size of the journal file.
+        """
+
+        if max_size_bytes <= _header.size:
+            raise ValueError("max_size_bytes is too small")
+
+        self._max_size_bytes = max_size_bytes
+        self._path = path
+
+        self._dead_bytes = 0
+        self._end = 0
+        self._records: dict[str, _Record] = {}
+
+        self._mmap = _open(path, max_size_bytes)
+        self._replayed = self._replay()
+
+    @property
+    def used_bytes(self) -> int:
+        return self._end
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def replayed(self) -> list[JournalItem]:
+        """
+        Live items found when the journal was opened, oldest first.
+        """
+
+        return list(self._replayed)
+
+    def append(
+        self,
+        item_id: str,
+        data: bytes,
+        *,
+        timestamp: float | None = None,
+    ) -> bool:
+        """
+        Append an item. Returns False if it doesn't fit, even after
+        compacting.
+        """
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        self.delete(item_id)
+
+        encoded_id = item_id.encode("utf-8")
+        size = _header.size + len(encoded_id) + len(data)
+        if self._end + size > self._max_size_bytes:
+            if self._dead_bytes == 0:
+                return False
+            self.compact()
+            if self._end + size > self._max_size_bytes:
+                return False
+
+        packed_ts = struct.pack("<d", timestamp)
+        crc = zlib.crc32(data, zlib.crc32(encoded_id, zlib.crc32(packed_ts)))
+        offset = self._end
+        _header.pack_into(
+            self._mmap,
+            offset,
+            _KIND_LIVE,
+            len(encoded_id),
+            len(data),
+            timestamp,
+            crc,
+        )
+        start = offset + _header.size
+        self._mmap[start : start + len(encoded_id)] = encoded_id
+        start += len(encoded_id)
+        self._mmap[start : start + len(data)] = data
+
+        self._end += size
+        self._write_end()
+        self._records[item_id] = _Record(offset=offset, size=size)
+        return True
+
+    def read(self, item_id: str) -> bytes | None:
+        record = self._records.get(item_id)
+        if record is None:
+            return None
+
+        _, id_len, data_len, _, _ = _header.unpack_from(
+            self._mmap, record.offset
+        )
+        start = record.offset + _header.size + id_len
+        return self._mmap[start : start + data_len]
+
+    def delete(self, item_id: str) -> bool:
+        """
+        Mark an item's record dead. Returns True if the item was found.
+        """
+
+        record = self._records.pop(item_id, None)
+        if record is None:
+            return False
+
+        self._mmap[record.offset] = _KIND_DEAD
+        self._dead_bytes += record.size
+
+        if len(self._records) == 0:
+            # Nothing to keep, so start over without rewriting the file.
+            self._end = 0
+            self._dead_bytes = 0
+            self._write_end()
+        elif (
+            self._dead_bytes >= _COMPACT_MIN_DEAD_BYTES
+            and self._dead_bytes > self._end - self._dead_bytes
+        ):
+            self.compact()
+
+        return True
+
+    def compact(self) -> None:
+        """
+        Rewrite the live records to a new file and replace the journal with
+        it.
+        """
+
+        tmp_path = f"{self._path}.tmp"
+        new_mmap = _open(tmp_path, self._max_size_bytes)
+        new_records: dict[str, _Record] = {}
+        end = 0
+        for item_id, record in sorted(
+            self._records.items(), key=lambda r: r[1].offset
+        ):
+            new_mmap[end : end + record.size] = self._mmap[
+                record.offset : record.offset + record.size
+            ]
+            new_records[item_id] = _Record(offset=end, size=record.size)
+            end += record.size
+        if end < self._max_size_bytes:
+            new_mmap[end] = _KIND_END
+        new_mmap.flush()
+
+        self._mmap.close()
+        os.replace(tmp_path, self._path)
+        self._mmap = new_mmap
+        self._records = new_records
+        self._end = end
+        self._dead_bytes = 0
+
+    def close(self) -> None:
+        if self._mmap.closed:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+
+    def _replay(self) -> list[JournalItem]:
+        items: dict[str, JournalItem] = {}
+        offset = 0
+        while offset + _header.size <= self._max_size_bytes:
+            kind, id_len, data_len, timestamp, crc = _header.unpack_from(
+                self._mmap, offset
+            )
+            if kind not in (_KIND_LIVE, _KIND_DEAD):
+                break
+
+            size = _header.size + id_len + data_len
+            if offset + size > self._max_size_bytes:
+                break
+
+            start = offset + _header.size
+            encoded_id = self._mmap[start : start + id_len]
+            data = self._mmap[start + id_len : start + id_len + data_len]
+            packed_ts = struct.pack("<d", timestamp)
+            if crc != zlib.crc32(
+                data, zlib.crc32(encoded_id, zlib.crc32(packed_ts))
+            ):
+                # Torn write.
+                break
+
+            if kind == _KIND_LIVE:
+                item_id = encoded_id.decode("utf-8")
+                items.pop(item_id, None)
+                items[item_id] = JournalItem(
+                    data=data,
+                    id=item_id,
+                    timestamp=timestamp,
+                )
+                self._records[item_id] = _Record(offset=offset, size=size)
+            else:
+                self._dead_bytes += size
+
+            offset += size
+
+        self._end = offset
+        self._write_end()
+        return list(items.values())
+
+    def _write_end(self) -> None:
+        if self._end < self._max_size_bytes:
+            self._mmap[self._end] = _KIND_END
+
+
+def _open(path: str, size: int) -> mmap.mmap:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if os.fstat(fd).st_size != size:
+            os.ftruncate(fd, size)
+        return mmap.mmap(fd, size)
+    finally:
+        # The mapping keeps its own reference to the file.
+        os.close(fd)
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from . import journal as journal_lib
+from .journal import ReplyJournal
+
+
+class TestReplyJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "replies.journal")
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_replay(self) -> None:
+        journal = ReplyJournal(self.path, 1024)
+        assert journal.append("a", b"A", timestamp=1)
+        assert journal.append("b", b"BB", timestamp=2)
+        assert journal.append("c", b"CCC", timestamp=3)
+        assert journal.delete("b")
+        assert journal.read("a") == b"A"
+        assert journal.read("b") is None
+        journal.close()
+
+        journal = ReplyJournal(self.path, 1024)
+        assert [(i.id, i.data, i.timestamp) for i in journal.replayed()] == [
+            ("a", b"A", 1),
+            ("c", b"CCC", 3),
+        ]
+
+        # Appending continues after the replayed records.
+        assert journal.append("d", b"D")
+        journal.close()
+        journal = ReplyJournal(self.path, 1024)
+        assert [i.id for i in journal.replayed()] == ["a", "c", "d"]
+        journal.close()
+
+    def test_torn_write(self) -> None:
+        journal = ReplyJournal(self.path, 1024)
+        journal.append("a", b"A")
+        journal.append("b", b"B")
+        end = journal.used_bytes
+        journal.close()
+
+        # Corrupt the last byte of the last record.
+        with open(self.path, "r+b") as f:
+            f.seek(end - 1)
+            f.write(b"X")
+
+        journal = ReplyJournal(self.path, 1024)
+        assert [i.id for i in journal.replayed()] == ["a"]
+        journal.close()
+
+    def test_budget_and_compaction(self) -> None:
+        journal = ReplyJournal(self.path, 200)
+        assert journal.append("a", b"A" * 100)
+
+        # Doesn't fit.
+        assert journal.append("b", b"B" * 100) is False
+
+        # Fits after the dead record is compacted away.
+        assert journal.append("c", b"C" * 10)
+        assert journal.delete("a")
+        assert journal.append("b", b"B" * 100)
+        assert journal.read("b") == b"B" * 100
+        assert journal.read("c") == b"C" * 10
+        journal.close()
+
+        journal = ReplyJournal(self.path, 200)
+        assert [i.id for i in journal.replayed()] == ["c", "b"]
+        journal.close()
+
+    def test_compact_on_delete(self) -> None:
+        journal = ReplyJournal(self.path, 10 * 1024 * 1024)
+        journal.append("keep", b"K")
+        for i in range(3):
+            journal.append(str(i), b"X" * (journal_lib._COMPACT_MIN_DEAD_BYTES))
+        for i in range(3):
+            journal.delete(str(i))
+
+        # Only the live record is left.
+        assert journal.used_bytes < 100
+        assert journal.read("keep") == b"K"
+        journal.close()
+
+    def test_reset_when_empty(self) -> None:
+        journal = ReplyJournal(self.path, 1024)
+        journal.append("a", b"A")
+        journal.delete("a")
+        assert journal.used_bytes == 0
+        journal.close()
+
+        journal = ReplyJournal(self.path, 1024)
+        assert journal.replayed() == []
+        journal.close()
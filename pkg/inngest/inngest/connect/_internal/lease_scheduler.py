@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import random
+import time
+
+
+@dataclasses.dataclass
+class LeaseStats:
+    # Number of WORKER_REQUEST_EXTEND_LEASE_ACK messages received.
+    acks: int = 0
+
+    # Number of WORKER_REQUEST_EXTEND_LEASE messages sent.
+    extensions: int = 0
+
+    # Time from sending an extension to receiving its ack (seconds).
+    max_latency: float = 0
+    total_latency: float = 0
+
+    # Time from an extension being due to it being sent (seconds).
+    max_lag: float = 0
+
+
+class LeaseScheduler:
+    """
+    Schedules lease extensions per request, keyed by each lease's due time.
+    Extensions are due one interval (minus jitter) after the request started
+    or its last extension, so requests that start together drift apart instead
+    of being extended in one burst. Not thread-safe.
+    """
+
+    def __init__(self, *, jitter: float = 0.1) -> None:
+        """
+        Args:
+        ----
+            jitter: Maximum fraction of the interval to subtract from each due time.
+        """
+
+        if jitter < 0 or jitter >= 1:
+            raise ValueError("jitter must be in [0, 1)")
+
+        self._jitter = jitter
+
+        # Min-heap of (due time, request ID). Entries whose due time doesn't
+        # match _due are stale and skipped when popped.
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+
+        # Monotonic time when each request's last extension was sent.
+        self._sent_at: dict[str, float] = {}
+
+        self._latencies: dict[str, float] = {}
+        self.stats = LeaseStats()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def schedule(
+        self,
+        request_id: str,
+        interval: float,
+        *,
+        now: float | None = None,
+    ) -> float:
+        """
+        Schedule the request's next extension. Returns its due time.
+        """
+
+        if now is None:
+            now = time.monotonic()
+
+        due = now + interval * (1 - self._jitter * random.random())  # noqa: S311
+        self._due[request_id] = due
+        heapq.heappush(self._heap, (due, request_id))
+        return due
+
+    def remove(self, request_id: str) -> None:
+        """
+        Stop extending the request's lease (e.g. because it completed).
+        """
+
+        self._due.pop(request_id, None)
+        self._latencies.pop(request_id, None)
+        self._sent_at.pop(request_id, None)
+
+    def next_due(self) -> float | None:
+        self._drop_stale()
+        if len(self._heap) == 0:
+            return None
+        return self._heap[0][0]
+
+    def pop_due(self, *, now: float | None = None) -> list[str]:
+        """
+        Unschedule and return the requests whose extensions are due, most
+        overdue first. Callers should reschedule them after extending.
+        """
+
+        if now is None:
+            now = time.monotonic()
+
+        request_ids: list[str] = []
+        while True:
+            self._drop_stale()
+            if len(self._heap) == 0 or self._heap[0][0] > now:
+                break
+
+            due, request_id = heapq.heappop(self._heap)
+            del self._due[request_id]
+            self.stats.max_lag = max(self.stats.max_lag, now - due)
+            request_ids.append(request_id)
+
+        return request_ids
+
+    def on_sent(self, request_id: str, *, now: float | None = None) -> None:
+        if now is None:
+            now = time.monotonic()
+
+        self._sent_at[request_id] = now
+        self.stats.extensions += 1
+
+    def on_ack(
+        self,
+        request_id: str,
+        *,
+        now: float | None = None,
+    ) -> float | None:
+        """
+        Record an extension's ack. Returns the extension's latency in seconds,
+        or None if no extension was sent for the request.
+        """
+
+        sent_at = self._sent_at.pop(request_id, None)
+        if sent_at is None:
+            return None
+
+        if now is None:
+            now = time.monotonic()
+
+        latency = now - sent_at
+        self._latencies[request_id] = latency
+        self.stats.acks += 1
+        self.stats.max_latency = max(self.stats.max_latency, latency)
+        self.stats.total_latency += latency
+        return latency
+
+    def latency(self, request_id: str) -> float | None:
+        """
+        Latency of the request's last acked extension, in seconds.
+        """
+
+        return self._latencies.get(request_id)
+
+    def _drop_stale(self) -> None:
+        while len(self._heap) > 0:
+            due, request_id = self._heap[0]
+            if self._due.get(request_id) == due:
+                return
+            heapq.heappop(self._heap)
@@ -0,0 +1,56 @@
+import pytest
+
+from .lease_scheduler import LeaseScheduler
+
+
+def test_due_order() -> None:
+    leases = LeaseScheduler(jitter=0)
+    leases.schedule("b", 20, now=0)
+    leases.schedule("a", 10, now=0)
+
+    assert leases.next_due() == 10
+    assert leases.pop_due(now=5) == []
+    assert leases.pop_due(now=10) == ["a"]
+    assert leases.pop_due(now=30) == ["b"]
+    assert leases.next_due() is None
+
+    # Popped requests are late by the difference.
+    assert leases.stats.max_lag == 10
+
+
+def test_jitter_spreads_due_times() -> None:
+    leases = LeaseScheduler(jitter=0.5)
+    due_times = {leases.schedule(str(i), 10, now=0) for i in range(100)}
+
+    assert all(5 <= due <= 10 for due in due_times)
+    assert len(due_times) > 1
+
+
+def test_remove_and_reschedule() -> None:
+    leases = LeaseScheduler(jitter=0)
+    leases.schedule("a", 10, now=0)
+    leases.schedule("b", 10, now=0)
+
+    # Completed requests are skipped.
+    leases.remove("a")
+    assert len(leases) == 1
+
+    # Rescheduling replaces the previous due time.
+    leases.schedule("b", 10, now=5)
+    assert leases.pop_due(now=10) == []
+    assert leases.pop_due(now=15) == ["b"]
+
+
+def test_latency() -> None:
+    leases = LeaseScheduler()
+    assert leases.on_ack("a", now=1) is None
+
+    leases.on_sent("a", now=1)
+    assert leases.on_ack("a", now=1.25) == pytest.approx(0.25)
+    assert leases.latency("a") == pytest.approx(0.25)
+    assert leases.stats.acks == 1
+    assert leases.stats.extensions == 1
+    assert leases.stats.max_latency == pytest.approx(0.25)
+
+    leases.remove("a")
+    assert leases.latency("a") is None
@@ -0,0 +1,350 @@
+"""
+Supervisor for Connect workers that run in separate processes.
+
+Thread ownership:
+    Everything in `Supervisor` runs on the supervisor process's main thread.
+    Worker processes are forked and share only the drain lock (and its
+    holder's slot) and the pending request counts.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import dataclasses
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.context
+import os
+import signal
+import time
+import types as builtin_types
+import typing
+
+from inngest._internal import types
+
+from .consts import (
+    DEFAULT_SHUTDOWN_SIGNALS,
+    WORKER_RESTART_BACKOFF_MAX_SEC,
+    WORKER_RESTART_BACKOFF_MIN_SEC,
+    WORKER_RESTART_BACKOFF_RESET_SEC,
+)
+from .drain_handler import DrainLock
+
+# How often the supervisor checks its workers when none of them exit
+# (seconds).
+_POLL_INTERVAL_SEC = 0.5
+
+# Drain lock holder slot when no worker holds it.
+_NO_HOLDER = -1
+
+
+class _SlotDrainLock:
+    """
+    A worker's view of the shared drain lock. Records the worker's slot while
+    it holds the lock, so that the supervisor can release the lock if the
+    worker exits without releasing it.
+
+    A worker that dies between acquiring the lock and recording its slot
+    leaves the lock held. That window is a few bytecodes, unlike the drain
+    itself.
+    """
+
+    def __init__(
+        self,
+        lock: DrainLock,
+        holder: ctypes.c_int,
+        slot: int,
+    ) -> None:
+        self._holder = holder
+        self._lock = lock
+        self._slot = slot
+
+    def acquire(self, block: bool = True, /) -> bool:
+        if not self._lock.acquire(block):
+            return False
+        self._holder.value = self._slot
+        return True
+
+    def release(self) -> None:
+        self._holder.value = _NO_HOLDER
+        self._lock.release()
+
+
+@dataclasses.dataclass
+class WorkerContext:
+    """
+    Passed to each worker process.
+    """
+
+    # Shared by all workers so that they drain one by one.
+    drain_lock: DrainLock
+
+    # Indexed by slot.
+    pending_request_counts: ctypes.Array[ctypes.c_int]
+
+    # Stable across restarts, so it's suitable for deriving an instance ID.
+    slot: int
+
+    def set_pending_request_count(self, count: int) -> None:
+        self.pending_request_counts[self.slot] = count
+
+
+@dataclasses.dataclass
+class _Worker:
+    slot: int
+
+    # Consecutive crashes, used for restart backoff.
+    crashes: int = 0
+
+    process: multiprocessing.context.ForkProcess | None = None
+
+    # Monotonic time when the worker should be (re)started.
+    start_at: float | None = 0
+
+    # Monotonic time when the current process started.
+    started_at: float = 0
+
+
+class Supervisor:
+    """
+    Forks worker processes, restarts them with backoff when they exit, and
+    forwards shutdown signals to them.
+    """
+
+    _closing = False
+
+    def __init__(
+        self,
+        *,
+        logger: types.Logger,
+        processes: int,
+        target: typing.Callable[[WorkerContext], None],
+        on_pending_request_count: typing.Callable[[int], None] | None = None,
+        shutdown_signals: list[signal.Signals] | None = None,
+    ) -> None:
+        """
+        Args:
+        ----
+            logger: Logger.
+            processes: Number of worker processes.
+            target: Run in each worker process. Should block until the worker's connection is closed.
+            on_pending_request_count: Called with the total number of pending requests across workers when it changes.
+            shutdown_signals: Signals that close the workers. Defaults to [SIGTERM, SIGINT].
+        """
+
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+
+        try:
+            self._ctx = multiprocessing.get_context("fork")
+        except ValueError:
+            raise Exception(
+                "multiprocess Connect requires the fork start method, which isn't available on this platform"
+            ) from None
+
+        if shutdown_signals is None:
+            shutdown_signals = DEFAULT_SHUTDOWN_SIGNALS
+
+        self._drain_lock = self._ctx.Lock()
+        self._drain_lock_holder = self._ctx.RawValue(ctypes.c_int, _NO_HOLDER)
+        self._logger = logger
+        self._on_pending_request_count = on_pending_request_count
+        self._pending_request_count = 0
+        self._pending_request_counts = self._ctx.RawArray(
+            ctypes.c_int, processes
+        )
+        self._shutdown_signals = shutdown_signals
+        self._target = target
+        self._workers = [_Worker(slot=i) for i in range(processes)]
+
+    @property
+    def pending_request_count(self) -> int:
+        """
+        Total number of pending requests across workers.
+        """
+
+        return sum(self._pending_request_counts)
+
+    def close(self) -> None:
+        """
+        Close the workers. Doesn't block. Must be called from the main thread.
+        """
+
+        self._close(signal.SIGTERM)
+
+    def run(self) -> None:
+        """
+        Run the workers. Blocks until they're closed. Must be called from the
+        main thread.
+        """
+
+        prev_handlers = {
+            sig: signal.signal(sig, self._handle_signal)
+            for sig in self._shutdown_signals
+        }
+        try:
+            while True:
+                self._reap()
+                if self._closing and all(
+                    w.process is None for w in self._workers
+                ):
+                    break
+
+                self._start_due()
+                self._report_pending_request_count()
+
+                sentinels = [
+                    w.process.sentinel
+                    for w in self._workers
+                    if w.process is not None
+                ]
+                multiprocessing.connection.wait(
+                    sentinels,
+                    timeout=self._next_timeout(),
+                )
+        finally:
+            for sig, handler in prev_handlers.items():
+                signal.signal(sig, handler)
+
+        self._report_pending_request_count()
+
+    def _close(self, sig: signal.Signals) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        self._logger.info("Closing worker processes")
+
+        for w in self._workers:
+            w.start_at = None
+            if w.process is not None and w.process.pid is not None:
+                try:
+                    os.kill(w.process.pid, sig)
+                except ProcessLookupError:
+                    # Already exited.
+                    pass
+
+    def _handle_signal(
+        self,
+        signum: int,
+        frame: builtin_types.FrameType | None,
+    ) -> None:
+        self._close(signal.Signals(signum))
+
+    def _next_timeout(self) -> float:
+        now = time.monotonic()
+        timeout = _POLL_INTERVAL_SEC
+        for w in self._workers:
+            if w.start_at is not None:
+                timeout = min(timeout, max(0, w.start_at - now))
+        return timeout
+
+    def _reap(self) -> None:
+        """
+        Handle exited workers.
+        """
+
+        now = time.monotonic()
+        for w in self._workers:
+            if w.process is None or w.process.is_alive():
+                continue
+
+            exitcode = w.process.exitcode
+            w.process.close()
+            w.process = None
+            self._pending_request_counts[w.slot] = 0
+
+            if self._drain_lock_holder.value == w.slot:
+                # Otherwise the other workers would wait for the lock forever.
+                self._drain_lock_holder.value = _NO_HOLDER
+                self._drain_lock.release()
+                self._logger.warning(
+                    "Released drain lock held by exited worker process",
+                    extra={"slot": w.slot},
+                )
+
+            if self._closing:
+                self._logger.debug(
+                    "Worker process exited",
+                    extra={"exitcode": exitcode, "slot": w.slot},
+                )
+                continue
+
+            if now - w.started_at >= WORKER_RESTART_BACKOFF_RESET_SEC:
+                w.crashes = 0
+            delay = min(
+                WORKER_RESTART_BACKOFF_MIN_SEC * 2**w.crashes,
+                WORKER_RESTART_BACKOFF_MAX_SEC,
+            )
+            w.crashes += 1
+            w.start_at = now + delay
+            self._logger.error(
+                "Worker process exited unexpectedly. Restarting...",
+                extra={
+                    "delay_sec": delay,
+                    "exitcode": exitcode,
+                    "slot": w.slot,
+                },
+            )
+
+    def _report_pending_request_count(self) -> None:
+        count = self.pending_request_count
+        if count == self._pending_request_count:
+            return
+
+        self._pending_request_count = count
+        self._logger.debug(
+            "Pending requests changed",
+            extra={"count": count},
+        )
+        if self._on_pending_request_count is not None:
+            try:
+                self._on_pending_request_count(count)
+            except Exception as e:
+                self._logger.error(
+                    "on_pending_request_count failed",
+                    extra={"error": str(e)},
+                )
+
+    def _start_due(self) -> None:
+        now = time.monotonic()
+        for w in self._workers:
+            if w.process is not None or w.start_at is None:
+                continue
+            if w.start_at > now:
+                continue
+
+            ctx = WorkerContext(
+                drain_lock=_SlotDrainLock(
+                    self._drain_lock,
+                    self._drain_lock_holder,
+                    w.slot,
+                ),
+                pending_request_counts=self._pending_request_counts,
+                slot=w.slot,
+            )
+            w.process = self._ctx.Process(
+                daemon=False,
+                name=f"inngest-connect-worker-{w.slot}",
+                target=_run_worker,
+                args=(self._target, ctx, self._shutdown_signals),
+            )
+            w.process.start()
+            w.start_at = None
+            w.started_at = now
+            self._logger.debug(
+                "Started worker process",
+                extra={"pid": w.process.pid, "slot": w.slot},
+            )
+
+
+def _run_worker(
+    target: typing.Callable[[WorkerContext], None],
+    ctx: WorkerContext,
+    shutdown_signals: list[signal.Signals],
+) -> None:
+    # Don't run the supervisor's signal handlers in the worker. The target
+    # installs its own.
+    for sig in shutdown_signals:
+        signal.signal(sig, signal.SIG_DFL)
+
+    target(ctx)
@@ -0,0 +1,108 @@
+import os
+import pathlib
+import signal
+import sys
+import tempfile
+import time
+import unittest.mock
+
+from .supervisor import Supervisor, WorkerContext
+
+
+class TestSupervisor(unittest.TestCase):
+    def test_restart_and_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+
+            def target(ctx: WorkerContext) -> None:
+                # Crash on the first start.
+                marker = pathlib.Path(tmp) / f"started-{ctx.slot}"
+                if not marker.exists():
+                    marker.touch()
+                    sys.exit(1)
+
+                signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+                ctx.set_pending_request_count(ctx.slot + 1)
+                time.sleep(30)
+
+            counts: list[int] = []
+
+            def on_pending_request_count(count: int) -> None:
+                counts.append(count)
+                if count == 3:
+                    supervisor.close()
+
+            supervisor = Supervisor(
+                logger=unittest.mock.Mock(),
+                on_pending_request_count=on_pending_request_count,
+                processes=2,
+                target=target,
+            )
+
+            start = time.monotonic()
+            supervisor.run()
+            duration = time.monotonic() - start
+
+            assert sorted(os.listdir(tmp)) == ["started-0", "started-1"]
+
+        # Restarted after the backoff and closed by SIGTERM, well before the
+        # workers' sleep ended.
+        assert 1 <= duration < 10
+        assert 3 in counts
+        assert counts[-1] == 0
+        assert supervisor.pending_request_count == 0
+
+    def test_release_drain_lock_of_killed_worker(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            held = pathlib.Path(tmp) / "held"
+
+            def target(ctx: WorkerContext) -> None:
+                signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+                if ctx.slot == 0:
+                    if not held.exists():
+                        # Die while holding the lock.
+                        assert ctx.drain_lock.acquire(True)
+                        held.touch()
+                        os.kill(os.getpid(), signal.SIGKILL)
+                    time.sleep(30)
+                    return
+
+                while not held.exists():
+                    time.sleep(0.01)
+
+                # Tell the supervisor whether the lock was acquired (1) or not
+                # (2).
+                deadline = time.monotonic() + 5
+                while not ctx.drain_lock.acquire(False):
+                    if time.monotonic() > deadline:
+                        ctx.set_pending_request_count(2)
+                        time.sleep(30)
+                    time.sleep(0.01)
+                ctx.drain_lock.release()
+                ctx.set_pending_request_count(1)
+                time.sleep(30)
+
+            counts: list[int] = []
+
+            def on_pending_request_count(count: int) -> None:
+                counts.append(count)
+                supervisor.close()
+
+            logger = unittest.mock.Mock()
+            supervisor = Supervisor(
+                logger=logger,
+                on_pending_request_count=on_pending_request_count,
+                processes=2,
+                target=target,
+            )
+
+            start = time.monotonic()
+            supervisor.run()
+            duration = time.monotonic() - start
+
+        assert duration < 10
+        assert counts[0] == 1
+        logger.warning.assert_called_once_with(
+            "Released drain lock held by exited worker process",
+            extra={"slot": 0},
+        )
@@ -4,7 +4,6 @@ DigitalOcean integration for Inngest
 
 from __future__ import annotations
 
-import json
 import typing
 import urllib.parse
 
@@ -105,7 +104,7 @@ def serve(
                         'missing "body" event.http; have you set "web: raw"?'
                     )
 
-                body = json.loads(http.body)
+                body = client.json_codec.loads(http.body)
                 if not isinstance(body, dict):
                     raise errors.BodyInvalidError("body must be an object")
 
@@ -3,7 +3,6 @@ Django integration for Inngest.
 """
 
 import http
-import json
 import typing
 
 import django
@@ -194,13 +193,13 @@ def _to_response(
     client: client_lib.Inngest,
     comm_res: comm_lib.CommResponse,
 ) -> django.http.HttpResponse:
-    body = transforms.dump_json(comm_res.body)
+    body = comm_res.body_bytes()
     if isinstance(body, Exception):
         comm_res = comm_lib.CommResponse.from_error(client.logger, body)
-        body = json.dumps(comm_res.body)
+        body = client.json_codec.dumps(comm_res.body)
 
     return django.http.HttpResponse(
-        body.encode("utf-8"),
+        body,
         headers=comm_res.headers,
         status=comm_res.status_code,
     )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing
+
 import inngest
 from inngest._internal import server_lib
 
@@ -11,7 +13,7 @@ class Inngest(inngest.Inngest):
 
     async def send(
         self,
-        events: server_lib.Event | list[server_lib.Event],
+        events: server_lib.EventLike | typing.Sequence[server_lib.EventLike],
         *,
         skip_middleware: bool = False,
     ) -> list[str]:
@@ -26,7 +28,7 @@ class Inngest(inngest.Inngest):
 
     def send_sync(
         self,
-        events: server_lib.Event | list[server_lib.Event],
+        events: server_lib.EventLike | typing.Sequence[server_lib.EventLike],
         *,
         skip_middleware: bool = False,
     ) -> list[str]:
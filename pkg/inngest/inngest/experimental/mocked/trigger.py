@@ -8,6 +8,7 @@ import unittest.mock
 import inngest
 from inngest._internal import (
     async_lib,
+    comm_lib,
     execution_lib,
     middleware_lib,
     net,
@@ -46,6 +47,9 @@ def trigger(
     if step_stubs is None:
         step_stubs = {}
 
+    # The request holds events as parsed JSON, like a real executor request.
+    raw_events = [e.model_dump(mode="json") for e in event]
+
     timings = net.ServerTimings()
     stack: list[str] = []
     steps: dict[str, object] = {}
@@ -56,6 +60,8 @@ def trigger(
     if fn._opts.retries is not None:
         max_attempt = fn._opts.retries
 
+    entry = _get_entry(fn, client)
+
     while True:
         step_id: str | None = None
         if len(planned) > 0:
@@ -69,21 +75,17 @@ def trigger(
                 run_id="test",
                 stack=server_lib.ServerRequestCtxStack(stack=stack),
             ),
-            event=event[0],
-            events=event,
+            event=raw_events[0],
+            events=raw_events,
             steps=steps,
             use_api=False,
         )
-        middleware = middleware_lib.MiddlewareManager.from_client(
-            client,
-            {},
-            timings,
-        )
+        middleware = _create_middleware(client, entry, timings)
 
         memos = step_lib.StepMemos.from_raw(steps)
 
         ctx: execution_lib.Context | execution_lib.ContextSync
-        if fn.is_handler_async:
+        if entry.is_handler_async:
             ctx = execution_lib.Context(
                 attempt=request.ctx.attempt,
                 event=event[0],
@@ -111,10 +113,11 @@ def trigger(
                 loop = asyncio.new_event_loop()
 
             res = loop.run_until_complete(
-                fn.call(
+                entry.fn.call_handler(
                     client,
                     ctx,
-                    fn.id,
+                    entry.handler,
+                    entry.output_type,
                     middleware,
                 )
             )
@@ -141,10 +144,11 @@ def trigger(
                 ),
             )
 
-            res = fn.call_sync(
+            res = entry.fn.call_handler_sync(
                 client,
                 ctx,
-                fn.id,
+                entry.handler,
+                entry.output_type,
                 middleware,
             )
 
@@ -205,6 +209,35 @@ def trigger(
         )
 
 
+def _get_entry(
+    fn: inngest.Function[typing.Any],
+    client: Inngest,
+) -> comm_lib.FunctionEntry:
+    """
+    Resolve the function the same way CommHandler does.
+    """
+
+    entry = comm_lib.FunctionRegistry(client.app_id, [fn]).get(fn.id)
+    if isinstance(entry, Exception):
+        raise entry
+    return entry
+
+
+def _create_middleware(
+    client: Inngest,
+    entry: comm_lib.FunctionEntry,
+    timings: net.ServerTimings,
+) -> middleware_lib.MiddlewareManager:
+    middleware = middleware_lib.MiddlewareManager.from_client(
+        client,
+        {},
+        timings,
+    )
+    for m in entry.middleware:
+        middleware.add(m)
+    return middleware
+
+
 @dataclasses.dataclass
 class _Result:
     error: Exception | None
@@ -35,7 +35,9 @@ async def get_subscription_token(
     if isinstance(res, Exception):
         raise res
     # Response is an object with a "jwt" property which is a string
-    response_data = _TokenResponse.model_validate(res.json())
+    response_data = _TokenResponse.model_validate(
+        client.json_codec.loads(res.content)
+    )
 
     # Return a dictionary ready to be used by the @inngest/realtime npm package
     return {
@@ -72,7 +74,9 @@ def get_subscription_token_sync(
     if isinstance(res, Exception):
         raise res
     # Response is an object with a "jwt" property which is a string
-    response_data = _TokenResponse.model_validate(res.json())
+    response_data = _TokenResponse.model_validate(
+        client.json_codec.loads(res.content)
+    )
 
     # Return a dictionary ready to be used by the @inngest/realtime npm package
     return {
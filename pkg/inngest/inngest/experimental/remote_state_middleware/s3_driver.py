@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import secrets
 import string
 import typing
@@ -9,6 +8,7 @@ import pydantic
 import typing_extensions
 
 import inngest
+from inngest._internal import json_lib
 
 from .middleware import StateDriver
 
@@ -45,16 +45,19 @@ class S3Driver(StateDriver):
         *,
         bucket: str,
         client: S3Client,
+        json_codec: inngest.JSONCodec | None = None,
     ) -> None:
         """
         Args:
         ----
             bucket: Bucket name to store remote state.
             client: Boto3 S3 client.
+            json_codec: Encodes/decodes stored state. Defaults to the standard library. Use inngest.OrjsonJSONCodec() for faster encoding and decoding.
         """
 
         self._bucket = bucket
         self._client = client
+        self._json_codec = json_codec or json_lib.default_codec()
 
     def _create_key(self) -> str:
         chars = string.ascii_letters + string.digits
@@ -85,13 +88,11 @@ class S3Driver(StateDriver):
 
             surrogate = _StateSurrogate.model_validate(step.data)
 
-            step.data = json.loads(
+            step.data = self._json_codec.loads(
                 self._client.get_object(
                     Bucket=surrogate.bucket,
                     Key=surrogate.key,
-                )["Body"]
-                .read()
-                .decode()
+                )["Body"].read()
             )
 
     def save_step(
@@ -110,7 +111,7 @@ class S3Driver(StateDriver):
 
         key = f"inngest/remote_state/{run_id}/{self._create_key()}"
         self._client.put_object(
-            Body=json.dumps(value),
+            Body=self._json_codec.dumps(value),
             Bucket=self._bucket,
             Key=key,
         )
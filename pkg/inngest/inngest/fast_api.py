@@ -1,6 +1,5 @@
 """FastAPI integration for Inngest."""
 
-import json
 import typing
 
 import fastapi
@@ -12,7 +11,6 @@ from ._internal import (
     const,
     function,
     server_lib,
-    transforms,
 )
 
 FRAMEWORK = server_lib.Framework.FAST_API
@@ -121,13 +119,13 @@ def _to_response(
             status_code=comm_res.status_code,
         )
 
-    body = transforms.dump_json(comm_res.body)
+    body = comm_res.body_bytes()
     if isinstance(body, Exception):
         comm_res = comm_lib.CommResponse.from_error(client.logger, body)
-        body = json.dumps(comm_res.body)
+        body = client.json_codec.dumps(comm_res.body)
 
     return fastapi.responses.Response(
-        content=body.encode("utf-8"),
+        content=body,
         headers=comm_res.headers,
         status_code=comm_res.status_code,
     )
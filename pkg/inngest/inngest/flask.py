@@ -1,6 +1,5 @@
 """Flask integration for Inngest."""
 
-import json
 import typing
 
 import flask
@@ -176,7 +175,7 @@ def _to_response(
     body = comm_res.body_bytes()
     if isinstance(body, Exception):
         comm_res = comm_lib.CommResponse.from_error(client.logger, body)
-        body = json.dumps(comm_res.body).encode("utf-8")
+        body = client.json_codec.dumps(comm_res.body)
 
     return flask.Response(
         headers=comm_res.headers,
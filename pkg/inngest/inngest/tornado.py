@@ -1,6 +1,5 @@
 """Tornado integration for Inngest."""
 
-import json
 import typing
 
 import tornado.web
@@ -12,7 +11,6 @@ from inngest._internal import (
     const,
     function,
     server_lib,
-    transforms,
 )
 
 FRAMEWORK = server_lib.Framework.TORNADO
@@ -109,10 +107,10 @@ def serve(
             self,
             comm_res: comm_lib.CommResponse,
         ) -> None:
-            body = transforms.dump_json(comm_res.body)
+            body = comm_res.body_bytes()
             if isinstance(body, Exception):
                 comm_res = comm_lib.CommResponse.from_error(client.logger, body)
-                body = json.dumps(comm_res.body)
+                body = client.json_codec.dumps(comm_res.body)
 
             self.write(body)
 
@@ -4,7 +4,6 @@ Encryption middleware for Inngest.
 
 from __future__ import annotations
 
-import json
 import typing
 
 import inngest
@@ -126,7 +125,7 @@ class EncryptionMiddleware(inngest.MiddlewareSync):
             )
             return data
 
-        byt = json.dumps(data).encode()
+        byt = self.client.json_codec.dumps(data)
         ciphertext = self._box.encrypt(
             byt,
             encoder=nacl.encoding.Base64Encoder,
@@ -153,7 +152,7 @@ class EncryptionMiddleware(inngest.MiddlewareSync):
                     encoder=nacl.encoding.Base64Encoder,
                 )
 
-                return json.loads(byt.decode())  # type: ignore
+                return self.client.json_codec.loads(byt)  # type: ignore
             except Exception:
                 continue
 
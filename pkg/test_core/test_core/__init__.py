@@ -1,4 +1,5 @@
 from .base import BaseState, wait_for, wait_for_len, wait_for_truthy
+from .comm import execution_request
 from .dicts import get_nested
 from .helper import RunStatus, client
 from .string import random_suffix, worker_suffix
@@ -7,6 +8,7 @@ __all__ = [
     "BaseState",
     "RunStatus",
     "client",
+    "execution_request",
     "get_nested",
     "random_suffix",
     "wait_for",
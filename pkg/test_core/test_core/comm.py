@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import typing
+
+from inngest._internal import comm_lib
+
+
+def execution_request(
+    steps: typing.Mapping[str, object],
+    *,
+    run_id: str = "run",
+) -> comm_lib.CommRequest:
+    """
+    Create a request that executes the "fn" function of the "app" app,
+    triggered by an "app/fn" event.
+
+    Args:
+    ----
+        steps: Memoized step data, keyed by hashed step ID.
+        run_id: Run ID.
+    """
+
+    body = {
+        "ctx": {
+            "attempt": 0,
+            "disable_immediate_execution": False,
+            "run_id": run_id,
+            "stack": {"stack": []},
+        },
+        "event": {"data": {}, "name": "app/fn"},
+        "events": [{"data": {}, "name": "app/fn"}],
+        "steps": steps,
+        "use_api": False,
+    }
+    return comm_lib.CommRequest(
+        body=json.dumps(body).encode("utf-8"),
+        headers={},
+        public_path=None,
+        query_params={"fnId": "app-fn"},
+        raw_request=None,
+        request_url="",
+        serve_origin=None,
+        serve_path=None,
+    )